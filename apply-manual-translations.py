@@ -6,12 +6,14 @@ This script:
 1. Reads INCOMPLETE-TRANSLATIONS.json (with user's manual translations)
 2. Updates NL-EN-civil-procedure-sentences-all.json
 3. Marks completed translations as incomplete=false
-4. Generates a report
+4. Generates a report (and build-metrics.json section 'apply-manual-translations')
 """
 
 import json
 from pathlib import Path
 
+from build_metrics import METRICS_FILE, BuildMetrics
+
 
 def apply_manual_translations():
     """Apply manual translations"""
@@ -20,20 +22,25 @@ def apply_manual_translations():
     main_file = Path('legal-data/netherlands/legislation/civil-procedure/NL-EN-civil-procedure-sentences-all.json')
     backup_file = Path('legal-data/netherlands/legislation/civil-procedure/NL-EN-civil-procedure-sentences-all.BACKUP.json')
 
+    metrics_file = main_file.parent / METRICS_FILE
+    metrics = BuildMetrics('apply-manual-translations')
+
     print("=" * 70)
     print("APPLYING MANUAL TRANSLATIONS")
     print("=" * 70)
 
     # Load files
-    print(f"\n📂 Loading {incomplete_file}...")
-    with open(incomplete_file, 'r', encoding='utf-8') as f:
-        incomplete_data = json.load(f)
-    print(f"  ✓ Loaded {len(incomplete_data)} incomplete entries")
-
-    print(f"\n📂 Loading {main_file}...")
-    with open(main_file, 'r', encoding='utf-8') as f:
-        main_data = json.load(f)
-    print(f"  ✓ Loaded {len(main_data)} total sentences")
+    with metrics.stage('load') as stage:
+        print(f"\n📂 Loading {incomplete_file}...")
+        with open(incomplete_file, 'r', encoding='utf-8') as f:
+            incomplete_data = json.load(f)
+        print(f"  ✓ Loaded {len(incomplete_data)} incomplete entries")
+
+        print(f"\n📂 Loading {main_file}...")
+        with open(main_file, 'r', encoding='utf-8') as f:
+            main_data = json.load(f)
+        print(f"  ✓ Loaded {len(main_data)} total sentences")
+        stage.items = len(incomplete_data) + len(main_data)
 
     # Create backup
     print(f"\n💾 Creating backup at {backup_file}...")
@@ -54,35 +61,45 @@ def apply_manual_translations():
         print("   Make sure you filled in 'en-translated' fields in INCOMPLETE-TRANSLATIONS.json")
         return
 
-    # Apply translations
-    updated_count = 0
-    for sentence in main_data:
-        if sentence['id'] in manual_translations:
-            old_en = sentence['en']
-            new_en = manual_translations[sentence['id']]
+    # Apply translations, counting what is still incomplete in the same pass
+    with metrics.stage('apply') as stage:
+        for sentence in main_data:
+            if sentence['id'] in manual_translations:
+                old_en = sentence['en']
+                new_en = manual_translations[sentence['id']]
 
-            sentence['en'] = new_en
-            sentence['incomplete'] = False
-            sentence['incomplete-reason'] = None
+                sentence['en'] = new_en
+                sentence['incomplete'] = False
+                sentence['incomplete-reason'] = None
 
-            updated_count += 1
+                metrics.count('applied')
 
-            if updated_count <= 5:  # Show first 5 examples
-                print(f"\n  Updated {sentence['id']}:")
-                print(f"    OLD: {old_en[:80]}...")
-                print(f"    NEW: {new_en[:80]}...")
+                if metrics.counters['applied'] <= 5:  # Show first 5 examples
+                    print(f"\n  Updated {sentence['id']}:")
+                    print(f"    OLD: {old_en[:80]}...")
+                    print(f"    NEW: {new_en[:80]}...")
 
+            metrics.count('sentences')
+            if sentence.get('incomplete', False):
+                metrics.count('incomplete')
+                metrics.tally('document-incomplete', sentence.get('document', 'Unknown'))
+        stage.items = len(main_data)
+
+    updated_count = metrics.counters['applied']
     print(f"\n✅ Updated {updated_count} translations")
 
     # Save updated main file
     print(f"\n💾 Saving updated file to {main_file}...")
-    with open(main_file, 'w', encoding='utf-8') as f:
-        json.dump(main_data, f, ensure_ascii=False, indent=2)
+    with metrics.stage('write-json') as stage:
+        with open(main_file, 'w', encoding='utf-8') as f:
+            json.dump(main_data, f, ensure_ascii=False, indent=2)
+        stage.items = len(main_data)
 
     # Generate report
-    total_sentences = len(main_data)
-    still_incomplete = sum(1 for s in main_data if s.get('incomplete', False))
+    total_sentences = metrics.counters['sentences']
+    still_incomplete = metrics.counters['incomplete']
     completed = total_sentences - still_incomplete
+    metrics.save(str(metrics_file))
 
     print("\n" + "=" * 70)
     print("UPDATE REPORT")
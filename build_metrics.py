@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Single-pass build statistics with machine-readable output.
+
+A BuildMetrics accumulator is fed while a build processes its items, so
+statistics never need an extra pass over the output. Stages are timed with
+a context manager. The result is written to build-metrics.json next to the
+build output, one section per build step, for dashboards to pick up.
+
+Usage:
+    metrics = BuildMetrics('merge-dictionaries')
+    with metrics.stage('merge-translations') as stage:
+        for entry in entries:
+            ...
+            metrics.count('translations')
+            metrics.tally('license', entry['license'])
+        stage.items = len(entries)
+    metrics.save('build-metrics.json')
+"""
+
+import json
+import os
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional
+
+METRICS_FILE = 'build-metrics.json'
+
+
+class Stage:
+    """Timing and item count of one build stage"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.items: Optional[int] = None
+
+    def to_dict(self) -> Dict:
+        return {'name': self.name, 'seconds': round(self.seconds, 4), 'items': self.items}
+
+
+class BuildMetrics:
+    """Accumulates counters, breakdowns and stage timings of a build"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = datetime.now(timezone.utc)
+        self.stages = []
+        self.counters = Counter()
+        self.breakdowns = defaultdict(Counter)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        """Time a build stage; set `.items` on the yielded stage to record its size"""
+        stage = Stage(name)
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.seconds = time.perf_counter() - start
+            self.stages.append(stage)
+
+    def count(self, key: str, amount: int = 1):
+        """Increment a counter"""
+        self.counters[key] += amount
+
+    def tally(self, breakdown: str, key, amount: int = 1):
+        """Increment one bucket of a breakdown (e.g. per license)"""
+        self.breakdowns[breakdown][str(key)] += amount
+
+    def merge(self, other: 'BuildMetrics'):
+        """Add the counters and breakdowns of another accumulator (e.g. a worker's)"""
+        self.counters.update(other.counters)
+        for breakdown, buckets in other.breakdowns.items():
+            self.breakdowns[breakdown].update(buckets)
+
+    def to_dict(self) -> Dict:
+        return {
+            'started': self.started.isoformat(timespec='seconds'),
+            'seconds': round(sum(stage.seconds for stage in self.stages), 4),
+            'stages': [stage.to_dict() for stage in self.stages],
+            'counters': dict(sorted(self.counters.items())),
+            'breakdowns': {
+                breakdown: dict(sorted(buckets.items()))
+                for breakdown, buckets in sorted(self.breakdowns.items())
+            },
+        }
+
+    def save(self, path: str = METRICS_FILE):
+        """
+        Write this build's section of a metrics file
+
+        Sections of other build steps in the same file are kept.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+
+        data[self.name] = self.to_dict()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
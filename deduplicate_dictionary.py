@@ -3,16 +3,70 @@
 Deduplication script for unified-dictionary.json
 Merges duplicate translations from "Civil Procedure Glossary" and "Legal Glossary"
 into a single unified "Legal Glossary" entry.
+
+With --near, near-duplicate translations are also found across the whole
+dictionary ("the case is made pending" vs "the case is made pending.", or
+the same translation under differently cased terms). Term and translation
+texts are shingled into character 3-grams, MinHash signatures are bucketed
+with locality-sensitive hashing (LSH) to find candidate pairs in roughly
+linear time, and candidates are verified by their exact Jaccard
+similarity. Clusters are printed as a summary and can be written to a
+report file; with --merge, variants within a term from the same source and
+license are collapsed into one translation. Clusters that span several
+terms are only reported, since merging terms needs an editorial decision.
+
+merge-dictionaries.py --dedupe applies the same exact-duplicate rules per
+term during the merge, so this script is only needed for --near.
+
+Usage:
+    python deduplicate_dictionary.py
+    python deduplicate_dictionary.py --near --report near-duplicates.json
+    python deduplicate_dictionary.py --near --threshold 0.9 --merge
 """
 
+import argparse
 import json
+import random
+import re
 import sys
-from typing import List, Dict, Any
+import zlib
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+from normalization import normalize_key
+
+SHINGLE_SIZE = 3
+NUM_PERM = 64
+BANDS = 16  # 16 bands of 4 rows: pairs above ~0.5 similarity become candidates
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(42)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+_NON_WORD = re.compile(r'[\W_]+')
 
-def deduplicate_translations(translations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def report_member(trans: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields of a translation shown in duplicate reports"""
+    return {
+        'translation': trans['translation'],
+        'lang': trans.get('lang'),
+        'source': trans.get('source'),
+        'source-type': trans.get('source-type'),
+        'license': trans.get('license'),
+    }
+
+def deduplicate_translations(translations: List[Dict[str, Any]],
+                             clusters: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
     """
     Deduplicate translations by merging entries with same translation text
     but different source-type labels (Civil Procedure Glossary vs Legal Glossary)
+
+    Args:
+        translations: Translations of one term
+        clusters: If given, every group of duplicates is appended to it as
+            {'merged': bool, 'members': [...]}
+
+    Returns:
+        Deduplicated translations
     """
     # Group translations by (translation, lang, source, license, sme-reviewed, context, definition)
     translation_groups = {}
@@ -44,19 +98,178 @@ def deduplicate_translations(translations: List[Dict[str, Any]]) -> List[Dict[st
             source_types = [t.get('source-type', '') for t in group]
 
             # If duplicates are from different glossary types, merge them
-            if any('Glossary' in st for st in source_types):
+            merge = any('Glossary' in st for st in source_types)
+            if merge:
                 # Create merged entry with unified "Legal Glossary" label
                 merged = group[0].copy()
                 merged['source-type'] = 'Legal Glossary'
                 deduplicated.append(merged)
-                print(f"  Merged duplicate: {merged['translation']} ({merged['lang']}) - {len(group)} sources")
             else:
                 # Keep all if they're legitimately different translations
                 deduplicated.extend(group)
 
+            if clusters is not None:
+                clusters.append({'merged': merge, 'members': [report_member(t) for t in group]})
+
     return deduplicated
 
+def shingle_text(text: str) -> str:
+    """Reduce a text to lowercase words without punctuation or diacritics"""
+    return _NON_WORD.sub(' ', normalize_key(text or '', diacritics=True)).strip()
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Character n-grams of a shingle text, padded so short words still count"""
+    padded = f" {text} "
+    if len(padded) <= size:
+        return {padded}
+    return {padded[i:i + size] for i in range(len(padded) - size + 1)}
+
+def minhash(features: Set[str]) -> Tuple[int, ...]:
+    """MinHash signature of a feature set (deterministic across runs)"""
+    hashes = [zlib.crc32(feature.encode('utf-8')) for feature in features]
+    return tuple(min([(a * h + b) % _PRIME for h in hashes]) for a, b in _PERMUTATIONS)
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two sets"""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+def find_near_duplicates(data: List[Dict[str, Any]], threshold: float = 0.8,
+                         bands: int = BANDS) -> List[List[Tuple[int, int]]]:
+    """
+    Find clusters of near-duplicate translations across the whole dictionary
+
+    Two translations are near-duplicates if they have the same language and
+    both their terms and their translation texts have a shingle Jaccard
+    similarity of at least `threshold`.
+
+    Args:
+        data: Terms in unified-dictionary.json format
+        threshold: Minimum Jaccard similarity of term and translation
+        bands: Number of LSH bands (NUM_PERM must be divisible by it)
+
+    Returns:
+        Clusters of (term index, translation index) pairs, each with at
+        least two members
+    """
+    rows = NUM_PERM // bands
+
+    # Identical texts share one signature
+    units = defaultdict(list)  # (lang, term text, translation text) -> members
+    for term_index, term in enumerate(data):
+        term_text = shingle_text(term['term'])
+        for trans_index, trans in enumerate(term['translations']):
+            key = (trans.get('lang'), term_text, shingle_text(trans.get('translation')))
+            units[key].append((term_index, trans_index))
+
+    keys = list(units)
+    features = []
+    buckets = defaultdict(list)
+    for unit, (lang, term_text, trans_text) in enumerate(keys):
+        term_shingles = shingles(term_text)
+        trans_shingles = shingles(trans_text)
+        features.append((term_shingles, trans_shingles))
+
+        signature = minhash({'t' + s for s in term_shingles} | {'x' + s for s in trans_shingles})
+        for band in range(bands):
+            buckets[(lang, band, signature[band * rows:(band + 1) * rows])].append(unit)
+
+    # Union-find over units, joined by verified candidate pairs
+    parent = list(range(len(keys)))
+
+    def find(unit: int) -> int:
+        while parent[unit] != unit:
+            parent[unit] = parent[parent[unit]]
+            unit = parent[unit]
+        return unit
+
+    checked = set()
+    for bucket in buckets.values():
+        for i, a in enumerate(bucket):
+            for b in bucket[i + 1:]:
+                if (a, b) in checked or find(a) == find(b):
+                    continue
+                checked.add((a, b))
+                if (jaccard(features[a][0], features[b][0]) >= threshold
+                        and jaccard(features[a][1], features[b][1]) >= threshold):
+                    parent[find(b)] = find(a)
+
+    clusters = defaultdict(list)
+    for unit, key in enumerate(keys):
+        clusters[find(unit)].extend(units[key])
+
+    return [sorted(members) for members in clusters.values() if len(members) > 1]
+
+def merge_near_duplicates(data: List[Dict[str, Any]], clusters: List[List[Tuple[int, int]]]) -> int:
+    """
+    Collapse near-duplicate variants within a term
+
+    Within each cluster, translations of the same term with the same source
+    and license are merged into one, preferring an SME-reviewed translation,
+    then one with a definition, then the first. Returns the number of
+    translations removed.
+    """
+    remove = set()
+    for members in clusters:
+        groups = defaultdict(list)
+        for term_index, trans_index in members:
+            trans = data[term_index]['translations'][trans_index]
+            groups[(term_index, trans.get('source'), trans.get('license'))].append(trans_index)
+
+        for (term_index, _, _), indices in groups.items():
+            if len(indices) < 2:
+                continue
+            translations = data[term_index]['translations']
+            keep = min(indices, key=lambda i: (not translations[i].get('sme-reviewed'),
+                                               not translations[i].get('definition'), i))
+            remove.update((term_index, i) for i in indices if i != keep)
+
+    for term_index, term in enumerate(data):
+        term['translations'] = [trans for trans_index, trans in enumerate(term['translations'])
+                                if (term_index, trans_index) not in remove]
+
+    return len(remove)
+
+def cluster_report(data: List[Dict[str, Any]], clusters: List[List[Tuple[int, int]]]) -> List[Dict[str, Any]]:
+    """Describe near-duplicate clusters for a report file"""
+    report = []
+    for members in clusters:
+        term_ids = {data[term_index]['id'] for term_index, _ in members}
+        report.append({
+            'kind': 'near',
+            'cross-term': len(term_ids) > 1,
+            'members': [{
+                'term-id': data[term_index]['id'],
+                'term': data[term_index]['term'],
+                **report_member(data[term_index]['translations'][trans_index]),
+            } for term_index, trans_index in members],
+        })
+    return report
+
+def exact_report(term: Dict[str, Any], clusters: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Describe the exact-duplicate groups of one term for a report file"""
+    return [{'kind': 'exact', 'term-id': term['id'], 'term': term['term'], **cluster}
+            for cluster in clusters]
+
+def write_report(path: str, report: List[Dict[str, Any]]):
+    """Write duplicate clusters to a JSON file"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
 def main():
+    parser = argparse.ArgumentParser(
+        description='Deduplicate translations in unified-dictionary.json'
+    )
+    parser.add_argument('--near', action='store_true',
+                        help='Also find near-duplicate translations (MinHash/LSH)')
+    parser.add_argument('--threshold', type=float, default=0.8,
+                        help='Minimum Jaccard similarity for near-duplicates (default: 0.8)')
+    parser.add_argument('--merge', action='store_true',
+                        help='Merge near-duplicates within a term (default: report only)')
+    parser.add_argument('--report', help='Write duplicate clusters to this JSON file')
+    args = parser.parse_args()
+
     print("🔧 Deduplicating unified-dictionary.json...")
     print()
 
@@ -77,16 +290,18 @@ def main():
     # Track statistics
     total_translations_before = sum(len(term['translations']) for term in data)
     terms_with_duplicates = 0
+    report = []
 
     # Process each term
     for term in data:
         original_count = len(term['translations'])
-        term['translations'] = deduplicate_translations(term['translations'])
+        clusters = []
+        term['translations'] = deduplicate_translations(term['translations'], clusters)
         new_count = len(term['translations'])
+        report.extend(exact_report(term, clusters))
 
         if new_count < original_count:
             terms_with_duplicates += 1
-            print(f"📝 {term['term']}: {original_count} → {new_count} translations")
 
     total_translations_after = sum(len(term['translations']) for term in data)
 
@@ -98,6 +313,25 @@ def main():
     print(f"  Removed duplicates: {total_translations_before - total_translations_after}")
     print()
 
+    if args.near:
+        print(f"🔍 Finding near-duplicates (threshold {args.threshold})...")
+        clusters = find_near_duplicates(data, args.threshold)
+        cross_term = sum(1 for members in clusters if len({i for i, _ in members}) > 1)
+        print(f"  Clusters: {len(clusters)} ({cross_term} across several terms)")
+        print(f"  Translations in clusters: {sum(len(members) for members in clusters)}")
+
+        report.extend(cluster_report(data, clusters))
+
+        if args.merge:
+            removed = merge_near_duplicates(data, clusters)
+            print(f"  ✓ Merged {removed} near-duplicate translations")
+        print()
+
+    if args.report:
+        write_report(args.report, report)
+        print(f"📝 Wrote {len(report)} duplicate clusters to {args.report}")
+        print()
+
     # Write deduplicated data
     output_file = 'unified-dictionary.json'
     print(f"💾 Writing deduplicated data to {output_file}...")
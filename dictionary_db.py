@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+SQLite build artifact and query CLI for the unified dictionary.
+
+The merge writes unified-dictionary.db next to unified-dictionary.json, with
+terms, translations and examples tables (each example stored once, linked
+to its terms through term_examples), indexes on normalized term,
+translation, license and source, and an FTS5 index over terms,
+translations and definitions. Lookups then use an index instead of
+parsing the whole JSON file.
+
+Usage:
+    python dictionary_db.py build
+    python dictionary_db.py lookup "aanhangig"
+    python dictionary_db.py search --license CC0 dagvaarding
+    python dictionary_db.py search --json "voorlopige voorziening"
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from typing import Dict, Iterable, List, Optional
+
+from normalization import normalize_key
+
+DB_FILE = 'unified-dictionary.db'
+JSON_FILE = 'unified-dictionary.json'
+EXAMPLES_JSON_FILE = 'unified-examples.json'
+
+SCHEMA = '''
+CREATE TABLE terms (
+    id TEXT PRIMARY KEY,
+    term TEXT NOT NULL,
+    norm_term TEXT NOT NULL,
+    lang TEXT,
+    metadata TEXT
+);
+
+CREATE TABLE translations (
+    term_id TEXT NOT NULL REFERENCES terms(id),
+    position INTEGER NOT NULL,
+    translation TEXT,
+    norm_translation TEXT,
+    lang TEXT,
+    definition TEXT,
+    source TEXT,
+    source_type TEXT,
+    license TEXT,
+    sme_reviewed INTEGER,
+    context TEXT
+);
+
+CREATE TABLE examples (
+    id TEXT PRIMARY KEY,
+    nl TEXT,
+    en TEXT,
+    source TEXT,
+    license TEXT,
+    premium INTEGER,
+    sme_reviewed INTEGER,
+    context TEXT
+);
+
+CREATE TABLE term_examples (
+    term_id TEXT NOT NULL REFERENCES terms(id),
+    position INTEGER NOT NULL,
+    example_id TEXT NOT NULL REFERENCES examples(id)
+);
+
+CREATE INDEX idx_terms_norm_term ON terms(norm_term);
+CREATE INDEX idx_translations_term_id ON translations(term_id);
+CREATE INDEX idx_translations_norm_translation ON translations(norm_translation);
+CREATE INDEX idx_translations_license ON translations(license);
+CREATE INDEX idx_translations_source ON translations(source);
+CREATE INDEX idx_term_examples_term_id ON term_examples(term_id);
+
+CREATE VIRTUAL TABLE search USING fts5(
+    term_id UNINDEXED,
+    term,
+    translations,
+    definitions,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+'''
+
+
+def build_database(terms: Iterable[Dict], db_path: str = DB_FILE,
+                   examples: Iterable[Dict] = ()) -> int:
+    """
+    Build the SQLite database from unified dictionary terms
+
+    The database is written to a temporary file and moved into place, so
+    readers never see a half-built database.
+
+    Args:
+        terms: Term objects in unified-dictionary.json format
+        db_path: Output database path
+        examples: Example objects in unified-examples.json format, referenced
+            by ID from the terms (terms of older builds embed them instead)
+
+    Returns:
+        Number of terms written
+    """
+    tmp_path = db_path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    count = 0
+    try:
+        conn.executescript(SCHEMA)
+
+        conn.executemany(
+            'INSERT INTO examples VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (example_row(ex) for ex in examples)
+        )
+
+        for term in terms:
+            conn.execute(
+                'INSERT INTO terms VALUES (?, ?, ?, ?, ?)',
+                (term['id'], term['term'], term.get('normalized') or normalize_key(term['term']),
+                 term.get('lang'),
+                 json.dumps(term.get('metadata') or {}, ensure_ascii=False))
+            )
+            conn.executemany(
+                'INSERT INTO translations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [(term['id'], i, t.get('translation'),
+                  t.get('normalized') or normalize_key(t.get('translation') or ''),
+                  t.get('lang'), t.get('definition'), t.get('source'), t.get('source-type'),
+                  t.get('license'), int(bool(t.get('sme-reviewed'))), t.get('context'))
+                 for i, t in enumerate(term['translations'])]
+            )
+            embedded = [ex for ex in term['examples'] if isinstance(ex, dict)]
+            conn.executemany(
+                'INSERT OR IGNORE INTO examples VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [example_row(ex) for ex in embedded]
+            )
+            conn.executemany(
+                'INSERT INTO term_examples VALUES (?, ?, ?)',
+                [(term['id'], i, ex['id'] if isinstance(ex, dict) else ex)
+                 for i, ex in enumerate(term['examples'])]
+            )
+            conn.execute(
+                'INSERT INTO search VALUES (?, ?, ?, ?)',
+                (term['id'], term['term'],
+                 '\n'.join(t.get('translation') or '' for t in term['translations']),
+                 '\n'.join(t['definition'] for t in term['translations'] if t.get('definition')))
+            )
+            count += 1
+
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+    return count
+
+
+def example_row(example: Dict) -> tuple:
+    """Row of the examples table for an example object"""
+    return (example.get('id'), example.get('nl'), example.get('en'), example.get('source'),
+            example.get('license'), int(bool(example.get('premium'))),
+            int(bool(example.get('sme-reviewed'))), example.get('context'))
+
+
+def connect(db_path: str = DB_FILE) -> sqlite3.Connection:
+    """Open an existing dictionary database (read-only)"""
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"{db_path} not found - run merge-dictionaries.py or 'build' first")
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def load_terms(conn: sqlite3.Connection, term_ids: List[str], license: Optional[str] = None,
+               source: Optional[str] = None) -> List[Dict]:
+    """
+    Load full term objects (unified-dictionary.json format) by ID
+
+    Translations are restricted to the given license and/or source.
+    Examples are returned as example objects instead of IDs.
+    """
+    results = []
+    for term_id in term_ids:
+        row = conn.execute('SELECT * FROM terms WHERE id = ?', (term_id,)).fetchone()
+        if row is None:
+            continue
+
+        query = 'SELECT * FROM translations WHERE term_id = ?'
+        params = [term_id]
+        if license:
+            query += ' AND license = ?'
+            params.append(license)
+        if source:
+            query += ' AND source = ?'
+            params.append(source)
+        translations = conn.execute(query + ' ORDER BY position', params).fetchall()
+
+        examples = conn.execute(
+            'SELECT examples.* FROM term_examples JOIN examples ON examples.id = example_id '
+            'WHERE term_id = ? ORDER BY position', (term_id,)
+        ).fetchall()
+
+        results.append({
+            'id': row['id'],
+            'term': row['term'],
+            'normalized': row['norm_term'],
+            'lang': row['lang'],
+            'translations': [{
+                'translation': t['translation'],
+                'normalized': t['norm_translation'],
+                'lang': t['lang'],
+                'definition': t['definition'],
+                'source': t['source'],
+                'source-type': t['source_type'],
+                'license': t['license'],
+                'sme-reviewed': bool(t['sme_reviewed']),
+                'context': t['context'],
+            } for t in translations],
+            'examples': [{
+                'id': ex['id'],
+                'nl': ex['nl'],
+                'en': ex['en'],
+                'source': ex['source'],
+                'license': ex['license'],
+                'premium': bool(ex['premium']),
+                'sme-reviewed': bool(ex['sme_reviewed']),
+                'context': ex['context'],
+            } for ex in examples],
+            'metadata': json.loads(row['metadata'] or '{}'),
+        })
+
+    return results
+
+
+def lookup(conn: sqlite3.Connection, text: str, license: Optional[str] = None,
+           source: Optional[str] = None) -> List[Dict]:
+    """Exact lookup of a term, or of a translation, by normalized text"""
+    norm = normalize_key(text)
+    term_ids = [row['id'] for row in conn.execute(
+        'SELECT id FROM terms WHERE norm_term = ?', (norm,))]
+    if not term_ids:
+        term_ids = [row['term_id'] for row in conn.execute(
+            'SELECT DISTINCT term_id FROM translations WHERE norm_translation = ?', (norm,))]
+
+    return [t for t in load_terms(conn, term_ids, license, source) if t['translations']]
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query of quoted prefix tokens"""
+    tokens = text.split()
+    return ' '.join('"' + token.replace('"', '""') + '"*' for token in tokens)
+
+
+def search(conn: sqlite3.Connection, text: str, license: Optional[str] = None,
+           source: Optional[str] = None, limit: int = 20) -> List[Dict]:
+    """Full-text search over terms, translations and definitions (ranked)"""
+    query = fts_query(text)
+    if not query:
+        return []
+
+    sql = 'SELECT term_id FROM search WHERE search MATCH ?'
+    params = [query]
+    if license or source:
+        sql += ' AND term_id IN (SELECT term_id FROM translations WHERE 1 = 1'
+        if license:
+            sql += ' AND license = ?'
+            params.append(license)
+        if source:
+            sql += ' AND source = ?'
+            params.append(source)
+        sql += ')'
+    sql += ' ORDER BY rank LIMIT ?'
+    params.append(limit)
+
+    term_ids = [row['term_id'] for row in conn.execute(sql, params)]
+    return load_terms(conn, term_ids, license, source)
+
+
+def print_terms(terms: List[Dict]):
+    """Print terms in a readable format"""
+    if not terms:
+        print("No results found")
+        return
+
+    for term in terms:
+        print(f"\n{term['term']} [{term['lang']}] ({term['id']})")
+        for t in term['translations']:
+            reviewed = '✓' if t['sme-reviewed'] else ' '
+            print(f"  {reviewed} {t['translation']} [{t['lang']}] - {t['source']}, {t['license']}")
+            if t['definition']:
+                print(f"      {t['definition']}")
+        if term['examples']:
+            print(f"  {len(term['examples'])} examples")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Query the unified dictionary SQLite database'
+    )
+    parser.add_argument('--db', default=DB_FILE, help=f'Database path (default: {DB_FILE})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Build the database from the JSON dictionary')
+    build_parser.add_argument('--json', dest='json_file', default=JSON_FILE,
+                              help=f'Unified dictionary JSON (default: {JSON_FILE})')
+    build_parser.add_argument('--examples', dest='examples_file', default=EXAMPLES_JSON_FILE,
+                              help=f'Example sentences JSON (default: {EXAMPLES_JSON_FILE}, '
+                                   f'skipped if missing)')
+
+    for name, help_text in [('lookup', 'Exact lookup of a term or translation'),
+                            ('search', 'Full-text search over terms, translations and definitions')]:
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument('query', nargs='+', help='Text to look up')
+        sub.add_argument('--license', help='Only translations with this license (e.g. CC0)')
+        sub.add_argument('--source', help='Only translations from this source')
+        sub.add_argument('--json', action='store_true', help='Print results as JSON')
+        if name == 'search':
+            sub.add_argument('--limit', type=int, default=20, help='Maximum results (default: 20)')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'build':
+            with open(args.json_file, 'r', encoding='utf-8') as f:
+                terms = json.load(f)
+            examples = []
+            if os.path.exists(args.examples_file):
+                with open(args.examples_file, 'r', encoding='utf-8') as f:
+                    examples = json.load(f)
+            count = build_database(terms, args.db, examples)
+            print(f"✓ Built {args.db} with {count} terms")
+            return
+
+        conn = connect(args.db)
+        text = ' '.join(args.query)
+        if args.command == 'lookup':
+            results = lookup(conn, text, args.license, args.source)
+        else:
+            results = search(conn, text, args.license, args.source, args.limit)
+        conn.close()
+    except (FileNotFoundError, sqlite3.Error) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print_terms(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Delta publishing: versioned patches between unified dictionary builds.
+
+Each merge that changes unified-dictionary.json compares the new terms with
+the previous artifact and writes a patch with the added, removed and changed
+terms (keyed by their stable IDs, see term_ids.py) to
+unified-dictionary-patches/. An index lists the current version and the
+available patches, so a client holding version N can fetch and apply the
+patches N -> N+1 -> ... instead of downloading the whole dictionary.
+
+Index (unified-dictionary-patches/index.json):
+    {
+      "version": 7,
+      "file": "unified-dictionary.json",
+      "hash": "<sha256 of the full file>",
+      "terms": 2968,
+      "patches": [
+        {"from": 6, "to": 7, "file": "6-7.json", "hash": "<sha256 of the patch>",
+         "added": 1, "removed": 0, "changed": 3}
+      ]
+    }
+
+Patch (unified-dictionary-patches/6-7.json):
+    {"format": 1, "from": 6, "to": 7, "base-hash": "...", "hash": "...",
+     "added": [term, ...], "removed": ["term_...", ...], "changed": [term, ...]}
+
+Applying a patch replaces changed terms, removes and adds terms, and sorts
+the result the same way the merge does; serialized with json.dump(...,
+ensure_ascii=False, indent=2) it hashes to the patch's "hash".
+
+If the full file was modified outside the merge (e.g. by
+import-fr-dictionary.py), the version is bumped without a patch and
+clients on older versions fetch the full file again.
+
+The example sentences (unified-examples.json, sorted by ID) get their own
+version and patches in the examples/ subdirectory, in the same format with
+examples in place of terms.
+
+Usage:
+    python dictionary_patches.py apply old.json --from 6 --output new.json
+    python dictionary_patches.py apply old-examples.json --examples --from 3 --output new.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+PATCH_DIR = 'unified-dictionary-patches'
+EXAMPLES_PATCH_DIR = os.path.join(PATCH_DIR, 'examples')
+INDEX_FILE = 'index.json'
+PATCH_FORMAT = 1
+
+# Patches kept in the index; older clients fetch the full file
+KEEP_PATCHES = 30
+
+
+def term_sort_key(term_data: Dict):
+    """Order of terms in unified-dictionary.json"""
+    return (term_data['term'].lower(), term_data['id'])
+
+
+def example_sort_key(example: Dict):
+    """Order of examples in unified-examples.json"""
+    return example['id']
+
+
+def hash_bytes(content: bytes) -> str:
+    """SHA-256 of serialized content"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def dump_terms(terms: List[Dict]) -> bytes:
+    """Serialize terms exactly as unified-dictionary.json is written"""
+    return json.dumps(terms, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def diff_terms(old_terms: Iterable[Dict], new_terms: List[Dict]) -> Dict[str, List]:
+    """
+    Compare two builds by term ID
+
+    Returns:
+        {'added': [terms], 'removed': [IDs], 'changed': [terms]}, each
+        sorted by ID
+    """
+    old_by_id = {term_data['id']: term_data for term_data in old_terms}
+    added = []
+    changed = []
+
+    for term_data in new_terms:
+        old_term = old_by_id.pop(term_data['id'], None)
+        if old_term is None:
+            added.append(term_data)
+        elif old_term != term_data:
+            changed.append(term_data)
+
+    return {
+        'added': sorted(added, key=lambda t: t['id']),
+        'removed': sorted(old_by_id),
+        'changed': sorted(changed, key=lambda t: t['id']),
+    }
+
+
+def apply_patch(terms: List[Dict], patch: Dict, sort_key=term_sort_key) -> List[Dict]:
+    """Apply a patch to the terms (or examples, with example_sort_key) of its base version"""
+    by_id = {term_data['id']: term_data for term_data in terms}
+    for term_id in patch['removed']:
+        by_id.pop(term_id, None)
+    for term_data in patch['changed'] + patch['added']:
+        by_id[term_data['id']] = term_data
+    return sorted(by_id.values(), key=sort_key)
+
+
+def load_index(patch_dir: str = PATCH_DIR) -> Optional[Dict]:
+    """Load the patch index (None if there is none yet)"""
+    try:
+        with open(os.path.join(patch_dir, INDEX_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def publish(old_terms: Optional[Iterable[Dict]], old_hash: Optional[str], new_terms: List[Dict],
+            new_hash: str, output_file: str, patch_dir: str = PATCH_DIR,
+            keep: int = KEEP_PATCHES) -> Optional[Dict]:
+    """
+    Record a new build in the patch index, writing a patch if possible
+
+    Args:
+        old_terms: Terms of the previous artifact (None if there was none)
+        old_hash: SHA-256 of the previous artifact
+        new_terms: Terms of the new artifact, in output order
+        new_hash: SHA-256 of the new artifact
+        output_file: Name of the full artifact (recorded in the index)
+        patch_dir: Directory for the index and patch files
+        keep: Number of patches to keep
+
+    Returns:
+        Entry of the new patch in the index, or None if no patch was written
+    """
+    index = load_index(patch_dir)
+    if index is not None and index['hash'] == new_hash:
+        return None
+
+    os.makedirs(patch_dir, exist_ok=True)
+    patches = index['patches'] if index else []
+    version = index['version'] + 1 if index else 1
+    entry = None
+
+    # Only the published version can be patched; a file changed outside the
+    # merge breaks the chain
+    if index is not None and old_terms is not None and index['hash'] == old_hash:
+        diff = diff_terms(old_terms, new_terms)
+        patch = {
+            'format': PATCH_FORMAT,
+            'from': index['version'],
+            'to': version,
+            'base-hash': old_hash,
+            'hash': new_hash,
+            **diff,
+        }
+        content = json.dumps(patch, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        filename = f"{index['version']}-{version}.json"
+        with open(os.path.join(patch_dir, filename), 'wb') as f:
+            f.write(content)
+
+        entry = {
+            'from': index['version'],
+            'to': version,
+            'file': filename,
+            'hash': hash_bytes(content),
+            'bytes': len(content),
+            'added': len(diff['added']),
+            'removed': len(diff['removed']),
+            'changed': len(diff['changed']),
+        }
+        patches.append(entry)
+    else:
+        # Clients older than this version have no patch path
+        patches = []
+
+    # Drop patches beyond the retention limit
+    for old_entry in patches[:-keep] if keep else patches:
+        stale = os.path.join(patch_dir, old_entry['file'])
+        if os.path.exists(stale):
+            os.remove(stale)
+    patches = patches[-keep:] if keep else []
+
+    index = {
+        'version': version,
+        'file': os.path.basename(output_file),
+        'hash': new_hash,
+        'terms': len(new_terms),
+        'patches': patches,
+    }
+    with open(os.path.join(patch_dir, INDEX_FILE), 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+
+    return entry
+
+
+def apply_patches(terms: List[Dict], from_version: int, patch_dir: str = PATCH_DIR,
+                  sort_key=term_sort_key) -> List[Dict]:
+    """
+    Bring terms of version `from_version` up to the latest version
+
+    For the examples file, pass EXAMPLES_PATCH_DIR and example_sort_key.
+
+    Raises:
+        ValueError: If there is no patch path from that version, or if a
+            patched result does not match the published hash
+    """
+    index = load_index(patch_dir)
+    if index is None:
+        raise ValueError(f"No patch index in {patch_dir}/")
+
+    version = from_version
+    for entry in index['patches']:
+        if entry['from'] != version:
+            continue
+        with open(os.path.join(patch_dir, entry['file']), 'r', encoding='utf-8') as f:
+            patch = json.load(f)
+        terms = apply_patch(terms, patch, sort_key)
+        if hash_bytes(dump_terms(terms)) != patch['hash']:
+            raise ValueError(f"Patch {entry['file']} produced an unexpected result")
+        version = entry['to']
+
+    if version != index['version']:
+        raise ValueError(f"No patch path from version {from_version} to {index['version']}")
+    return terms
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Apply unified dictionary patches'
+    )
+    parser.add_argument('--patch-dir',
+                        help=f'Patch directory (default: {PATCH_DIR}, '
+                             f'or {EXAMPLES_PATCH_DIR} with --examples)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    apply_parser = subparsers.add_parser('apply', help='Update an old dictionary file to the latest version')
+    apply_parser.add_argument('input', help='Dictionary JSON of the old version')
+    apply_parser.add_argument('--from', dest='from_version', type=int, required=True,
+                              help='Version of the input file')
+    apply_parser.add_argument('--output', required=True, help='Output JSON file')
+    apply_parser.add_argument('--examples', action='store_true',
+                              help='Input is an examples file (unified-examples.json)')
+
+    args = parser.parse_args()
+    if args.examples:
+        patch_dir, sort_key = args.patch_dir or EXAMPLES_PATCH_DIR, example_sort_key
+    else:
+        patch_dir, sort_key = args.patch_dir or PATCH_DIR, term_sort_key
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        terms = json.load(f)
+
+    try:
+        terms = apply_patches(terms, args.from_version, patch_dir, sort_key)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    with open(args.output, 'wb') as f:
+        f.write(dump_terms(terms))
+    print(f"✓ Wrote {len(terms)} {'examples' if args.examples else 'terms'} to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
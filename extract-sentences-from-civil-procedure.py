@@ -4,23 +4,65 @@ Extract individual sentences from civil procedure paragraphs.
 
 This script:
 1. Reads all civil procedure JSON files (paragraph-level)
-2. Splits paragraphs into individual sentences
+2. Splits paragraphs into individual sentences and aligns them within each
+   paragraph by length and punctuation (1:1, 1:2, 2:1, 1:0, 0:1), so one
+   extra split on either side no longer shifts every following pair
 3. Detects incomplete/missing translations
 4. Combines everything into one comprehensive sentence file
 
+Re-runs are incremental: a content hash of every paragraph (source and
+target) is kept in .sentence-extraction-state.json, and only paragraphs
+whose hash changed are segmented again. The sentence entries of all other
+paragraphs are taken over from the existing output, so manual fixes made by
+apply-manual-translations.py survive. Use --full to rebuild everything.
+
+The state also records a hash of every paragraph's English text, which
+survives a change of EXTRACTION_VERSION: a paragraph segmented again only
+because of a new version keeps manually edited sentences if its English is
+the same as at the last run. Without that record (first run), previous
+English is not kept; re-apply manual fixes with apply-manual-translations.py.
+
+Changed paragraphs of all books are segmented in fixed-size chunks across a
+process pool (--workers); output order is the order of the input files.
+
 Output: NL-EN-civil-procedure-sentences-all.json
+Metrics: build-metrics.json (section 'extract-sentences')
 """
 
+import argparse
+import hashlib
 import json
-import re
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from build_metrics import METRICS_FILE, BuildMetrics
+from length_alignment import align_texts, merge_unpaired
+from incomplete_scorer import REASON_OK, SENTENCE_RULES, reason_text, score_pairs
+from sentence_segmenter import split_sentences
+
+OUTPUT_FILE = 'NL-EN-civil-procedure-sentences-all.json'
+STATE_FILE = '.sentence-extraction-state.json'
+
+# Bump when segmentation or alignment changes, so recorded hashes are ignored
+EXTRACTION_VERSION = 4
+
+# Paragraphs per task sent to a worker process
+CHUNK_SIZE = 250
 
 
 class SentenceExtractor:
     """Extract sentences from civil procedure paragraphs"""
 
-    def __init__(self):
+    def __init__(self, full: bool = False, workers: Optional[int] = None):
+        """
+        Initialize extractor
+
+        Args:
+            full: Segment every paragraph again instead of reusing unchanged ones
+            workers: Processes for segmentation (default: CPU count)
+        """
         self.base_path = Path('legal-data/netherlands/legislation/civil-procedure')
         self.input_files = [
             'NL-EN-civil-procedure-book1.json',
@@ -28,14 +70,76 @@ class SentenceExtractor:
             'NL-EN-civil-procedure-book4.json',
         ]
         self.sentences = []
-        self.incomplete_count = 0
+        self.metrics = BuildMetrics('extract-sentences')
+        self.full = full
+        self.workers = workers or os.cpu_count() or 1
+        self.state: Dict = {}
+        self.previous: Dict[Tuple[str, str], List[Dict]] = {}
+        self.paragraph_hashes: Dict[str, Dict[str, str]] = {}
+        # Hashes of the English paragraph texts, of the last run and this run
+        self.previous_targets: Dict[str, Dict[str, str]] = {}
+        self.target_hashes: Dict[str, Dict[str, str]] = {}
+
+    def load_previous(self, output_filename: str):
+        """
+        Load the previous output and paragraph hashes for an incremental run
+
+        Previous sentence entries are grouped by (document, tuid), the tuid
+        being the part of the sentence ID before '_s'.
+
+        Args:
+            output_filename: Output file name
+        """
+        if self.full:
+            return
 
-    def split_into_sentences(self, text: str) -> List[str]:
+        state_path = self.base_path / STATE_FILE
+        if state_path.exists():
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == EXTRACTION_VERSION:
+                self.state = state
+            self.previous_targets = state.get('targets', {})
+
+        output_path = self.base_path / output_filename
+        if not output_path.exists():
+            return
+        with open(output_path, 'r', encoding='utf-8') as f:
+            for sentence_entry in json.load(f):
+                tuid = sentence_entry['id'].rsplit('_s', 1)[0]
+                key = (sentence_entry.get('document', ''), tuid)
+                self.previous.setdefault(key, []).append(sentence_entry)
+
+    def save_state(self):
+        """Write the paragraph hashes of this run"""
+        state_path = self.base_path / STATE_FILE
+        with open(state_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': EXTRACTION_VERSION, 'paragraphs': self.paragraph_hashes,
+                       'targets': self.target_hashes}, f)
+
+    def record(self, sentence_entry: Dict):
+        """
+        Add one sentence entry to the build statistics
+
+        Args:
+            sentence_entry: Sentence entry as written to the output
+        """
+        document = sentence_entry.get('document', 'Unknown')
+        self.metrics.count('sentences')
+        self.metrics.tally('document', document)
+
+        if sentence_entry['incomplete']:
+            self.metrics.count('incomplete')
+            self.metrics.tally('incomplete-reason', sentence_entry.get('incomplete-reason', 'Unknown'))
+            self.metrics.tally('document-incomplete', document)
+
+    def split_into_sentences(self, text: str, lang: str) -> List[str]:
         """
         Split text into sentences intelligently
 
         Args:
             text: Input text
+            lang: Language of the text ('nl' or 'en')
 
         Returns:
             List of sentences
@@ -47,14 +151,8 @@ class SentenceExtractor:
         if len(text) < 50 or text.count('.') <= 1:
             return [text.strip()]
 
-        # Split on sentence boundaries
-        # Match: ". " followed by capital letter, but not after common abbreviations
-        sentences = re.split(
-            r'(?<!\bArt)(?<!\bRv)(?<!\bNr)(?<!\bDr)(?<!\bMr)(?<!\bProf)(?<!\bJr)'
-            r'(?<!\bSr)(?<!\betc)(?<!\bi\.e)(?<!\be\.g)(?<!\bvgl)(?<!\bbv)'
-            r'(?<!\beg)(?<!\bviz)(?<!\bcf)\.\s+(?=[A-Z])',
-            text
-        )
+        # Split on sentence boundaries, skipping the language's abbreviations
+        sentences = split_sentences(text, lang)
 
         # Clean up sentences
         result = []
@@ -68,62 +166,108 @@ class SentenceExtractor:
 
         return result if result else [text.strip()]
 
-    def is_incomplete_translation(self, nl_text: str, en_text: str) -> Tuple[bool, str]:
+    def score_entries(self, sentence_entries: List[Dict]):
         """
-        Detect if translation is incomplete
+        Set 'incomplete' and 'incomplete-reason' on sentence entries
+
+        All entries are scored in one batch by incomplete_scorer, the
+        heuristics shared with the import scripts.
 
         Args:
-            nl_text: Dutch text
-            en_text: English text
+            sentence_entries: Sentence entries to score (updated in place)
+        """
+        features, reasons = score_pairs([e['nl'] for e in sentence_entries],
+                                        [e['en'] for e in sentence_entries], SENTENCE_RULES)
+        for sentence_entry, code, row in zip(sentence_entries, reasons, features):
+            incomplete = code != REASON_OK
+            sentence_entry['incomplete'] = bool(incomplete)
+            sentence_entry['incomplete-reason'] = reason_text(code, row) if incomplete else None
+
+    def paragraph_hash(self, entry: Dict) -> str:
+        """Content hash of a paragraph entry (source and target text)"""
+        content = json.dumps([entry.get('source', ''), entry.get('target', '')], ensure_ascii=False)
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+    def target_hash(self, entry: Dict) -> str:
+        """Content hash of the English text of a paragraph entry"""
+        return hashlib.sha256(entry.get('target', '').encode('utf-8')).hexdigest()[:16]
+
+    def process_paragraph(self, entry: Dict) -> List[Dict]:
+        """
+        Split one paragraph entry into aligned sentence entries
+
+        Args:
+            entry: Paragraph entry (tuid, source, target, ...)
 
         Returns:
-            Tuple of (is_incomplete, reason)
+            List of sentence entries (not yet scored, see score_entries)
         """
-        if not en_text or not en_text.strip():
-            return True, "Empty translation"
-
-        en_text = en_text.strip()
-
-        # Check for placeholder patterns
-        placeholder_patterns = [
-            r'\[.*?\]',  # [placeholder]
-            r'TODO',
-            r'TBD',
-            r'XXX',
-            r'\?\?\?',
-        ]
-
-        for pattern in placeholder_patterns:
-            if re.search(pattern, en_text, re.IGNORECASE):
-                return True, f"Contains placeholder: {pattern}"
+        sentence_entries = []
 
-        # Check if English is just a copy of Dutch
-        if nl_text.strip() == en_text:
-            return True, "English is copy of Dutch"
+        nl_text = entry.get('source', '').strip()
+        en_text = entry.get('target', '').strip()
 
-        # Check length ratio (translation should be similar length)
-        if len(nl_text) > 0:
-            ratio = len(en_text) / len(nl_text)
-            if ratio < 0.3:
-                return True, f"Too short (ratio: {ratio:.2f})"
-            if ratio > 3.0:
-                return True, f"Too long (ratio: {ratio:.2f})"
+        # Skip if both are empty
+        if not nl_text and not en_text:
+            return []
 
-        # Check if contains only non-alphabetic characters
-        if not re.search(r'[a-zA-Z]', en_text):
-            return True, "No alphabetic characters"
+        # Skip very short entries (titles, article numbers, etc.)
+        # But keep them if they're actual sentences
+        if len(nl_text) < 50 and '.' not in nl_text:
+            # Likely a title or article number, keep as-is
+            sentence_entry = {
+                'id': f"{entry.get('tuid', 'unknown')}_s001",
+                'nl': nl_text,
+                'en': en_text,
+                'type': 'title-or-header',
+                'document': entry.get('document', ''),
+                'author': entry.get('author', ''),
+                'license': entry.get('license', 'CC BY 4.0'),
+                'sme-reviewed': entry.get('sme-reviewed', False),
+                'incomplete': False,  # set by score_entries()
+                'incomplete-reason': None,
+            }
+            return [sentence_entry]
+
+        # Split into sentences
+        nl_sentences = self.split_into_sentences(nl_text, 'nl')
+        en_sentences = self.split_into_sentences(en_text, 'en')
+
+        # Align sentences within the paragraph; merged sentences are joined,
+        # and a sentence left without a counterpart joins its neighbour
+        beads = merge_unpaired(align_texts(nl_sentences, en_sentences))
+
+        for i, bead in enumerate(beads):
+            nl_sent = ' '.join(nl_sentences[k] for k in bead.source)
+            en_sent = ' '.join(en_sentences[k] for k in bead.target)
+            self.metrics.tally('alignment', bead.kind)
+
+            sentence_entry = {
+                'id': f"{entry.get('tuid', 'unknown')}_s{i+1:03d}",
+                'nl': nl_sent,
+                'en': en_sent,
+                'type': 'sentence',
+                'document': entry.get('document', ''),
+                'author': entry.get('author', ''),
+                'license': entry.get('license', 'CC BY 4.0'),
+                'sme-reviewed': entry.get('sme-reviewed', False),
+                'incomplete': False,  # set by score_entries()
+                'incomplete-reason': None,
+            }
+
+            sentence_entries.append(sentence_entry)
 
-        return False, ""
+        return sentence_entries
 
-    def process_file(self, filename: str) -> List[Dict]:
+    def load_file(self, filename: str) -> List[Dict]:
         """
-        Process one civil procedure file
+        Load one civil procedure file and hash its paragraphs
 
         Args:
             filename: Name of JSON file
 
         Returns:
-            List of sentence entries
+            List of paragraph entries (empty if the file is missing)
         """
         filepath = self.base_path / filename
         print(f"\n📄 Processing: {filename}")
@@ -135,74 +279,110 @@ class SentenceExtractor:
         with open(filepath, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
+        self.paragraph_hashes[filename] = {
+            entry.get('tuid', 'unknown'): self.paragraph_hash(entry) for entry in data
+        }
+        self.target_hashes[filename] = {
+            entry.get('tuid', 'unknown'): self.target_hash(entry) for entry in data
+        }
         print(f"  ✓ Loaded {len(data)} paragraph entries")
 
-        sentence_entries = []
+        return data
 
-        for entry in data:
-            nl_text = entry.get('source', '').strip()
-            en_text = entry.get('target', '').strip()
+    def is_unchanged(self, filename: str, entry: Dict) -> bool:
+        """Whether a paragraph has previous sentence entries and the same hash as then"""
+        tuid = entry.get('tuid', 'unknown')
+        old_hashes = self.state.get('paragraphs', {}).get(filename, {})
+        return ((entry.get('document', ''), tuid) in self.previous and
+                old_hashes.get(tuid) == self.paragraph_hashes[filename][tuid])
 
-            # Skip if both are empty
-            if not nl_text and not en_text:
-                continue
+    def segment_paragraphs(self, paragraphs: List[Dict]) -> List[List[Dict]]:
+        """
+        Segment paragraphs, in chunks across a process pool
 
-            # Skip very short entries (titles, article numbers, etc.)
-            # But keep them if they're actual sentences
-            if len(nl_text) < 50 and '.' not in nl_text:
-                # Likely a title or article number, keep as-is
-                is_incomplete, reason = self.is_incomplete_translation(nl_text, en_text)
-
-                sentence_entry = {
-                    'id': f"{entry.get('tuid', 'unknown')}_s001",
-                    'nl': nl_text,
-                    'en': en_text,
-                    'type': 'title-or-header',
-                    'document': entry.get('document', ''),
-                    'author': entry.get('author', ''),
-                    'license': entry.get('license', 'CC BY 4.0'),
-                    'sme-reviewed': entry.get('sme-reviewed', False),
-                    'incomplete': is_incomplete,
-                    'incomplete-reason': reason if is_incomplete else None,
-                }
-                sentence_entries.append(sentence_entry)
-                if is_incomplete:
-                    self.incomplete_count += 1
-                continue
+        Each worker counts into its own BuildMetrics; these are merged into
+        self.metrics. Results come back in input order.
 
-            # Split into sentences
-            nl_sentences = self.split_into_sentences(nl_text)
-            en_sentences = self.split_into_sentences(en_text)
+        Args:
+            paragraphs: Paragraph entries
 
-            # Match sentences
-            max_len = max(len(nl_sentences), len(en_sentences))
+        Returns:
+            Sentence entries per paragraph (see process_paragraph)
+        """
+        chunks = [paragraphs[i:i + CHUNK_SIZE] for i in range(0, len(paragraphs), CHUNK_SIZE)]
+        workers = min(self.workers, len(chunks))
+
+        if workers <= 1:
+            return [self.process_paragraph(entry) for entry in paragraphs]
+
+        print(f"\n⚙️  Segmenting {len(paragraphs)} paragraphs in {len(chunks)} chunks "
+              f"with {workers} workers")
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_results, worker_metrics in executor.map(_segment_chunk, chunks):
+                results.extend(chunk_results)
+                self.metrics.merge(worker_metrics)
+        return results
+
+    def assemble_file(self, filename: str, data: List[Dict],
+                      segmented: Iterator[List[Dict]]) -> List[Dict]:
+        """
+        Build the sentence entries of one file
 
-            for i in range(max_len):
-                nl_sent = nl_sentences[i] if i < len(nl_sentences) else ""
-                en_sent = en_sentences[i] if i < len(en_sentences) else ""
+        Paragraphs whose content hash is unchanged since the last run keep
+        their previous sentence entries, including manual edits; the others
+        take the next result from `segmented`.
 
-                # Check if incomplete
-                is_incomplete, reason = self.is_incomplete_translation(nl_sent, en_sent)
+        Args:
+            filename: Name of JSON file
+            data: Paragraph entries of the file
+            segmented: Sentence entries of the changed paragraphs, in order
 
-                sentence_entry = {
-                    'id': f"{entry.get('tuid', 'unknown')}_s{i+1:03d}",
-                    'nl': nl_sent,
-                    'en': en_sent,
-                    'type': 'sentence',
-                    'document': entry.get('document', ''),
-                    'author': entry.get('author', ''),
-                    'license': entry.get('license', 'CC BY 4.0'),
-                    'sme-reviewed': entry.get('sme-reviewed', False),
-                    'incomplete': is_incomplete,
-                    'incomplete-reason': reason if is_incomplete else None,
-                }
+        Returns:
+            List of sentence entries
+        """
+        sentence_entries = []
+        fresh = []
+        reused = 0
 
-                sentence_entries.append(sentence_entry)
+        for entry in data:
+            tuid = entry.get('tuid', 'unknown')
+            previous = self.previous.get((entry.get('document', ''), tuid))
 
-                if is_incomplete:
-                    self.incomplete_count += 1
+            if self.is_unchanged(filename, entry):
+                sentence_entries.extend(previous)
+                reused += 1
+                continue
 
-        print(f"  ✓ Extracted {len(sentence_entries)} sentence entries")
+            entries = next(segmented)
+            self.metrics.count('paragraphs-extracted')
+            old_hashes = self.state.get('paragraphs', {}).get(filename, {})
+            old_target = self.previous_targets.get(filename, {}).get(tuid)
+            if previous is not None and tuid not in old_hashes and \
+                    old_target == self.target_hashes[filename][tuid] and \
+                    [(e['id'], e['nl']) for e in previous] == [(e['id'], e['nl']) for e in entries]:
+                # No recorded hash (new extraction version), but the same
+                # English paragraph as last run and the same segmentation:
+                # previous entries whose English differs are manual fixes
+                for old, new in zip(previous, entries):
+                    if old['en'] != new['en']:
+                        sentence_entries.append(old)
+                    else:
+                        sentence_entries.append(new)
+                        fresh.append(new)
+            else:
+                sentence_entries.extend(entries)
+                fresh.extend(entries)
+
+        with self.metrics.stage(f'score {filename}') as stage:
+            self.score_entries(fresh)
+            stage.items = len(fresh)
+        for sentence_entry in sentence_entries:
+            self.record(sentence_entry)
+
+        self.metrics.count('paragraphs-reused', reused)
+        print(f"  ✓ {filename}: {len(sentence_entries)} sentence entries "
+              f"({len(data) - reused} paragraphs segmented, {reused} unchanged)")
 
         return sentence_entries
 
@@ -210,6 +390,10 @@ class SentenceExtractor:
         """
         Extract sentences from all files
 
+        All files are loaded first; the changed paragraphs of every file are
+        then segmented together across the process pool, and the results
+        are put back in file and paragraph order.
+
         Returns:
             Combined list of all sentences
         """
@@ -217,10 +401,35 @@ class SentenceExtractor:
         print("CIVIL PROCEDURE SENTENCE EXTRACTOR")
         print("=" * 70)
 
-        all_sentences = []
-
+        with self.metrics.stage('load-previous') as stage:
+            self.load_previous(OUTPUT_FILE)
+            stage.items = sum(len(entries) for entries in self.previous.values())
+        if self.previous:
+            mode = 'hashes recorded' if self.state else 'no hashes recorded yet'
+            print(f"\n♻️  Previous output: {stage.items} sentence entries ({mode})")
+            if not self.previous_targets:
+                print("  ⚠️  No English paragraph hashes recorded: previous English is not "
+                      "kept, re-apply manual fixes with apply-manual-translations.py")
+
+        files = []
         for filename in self.input_files:
-            sentences = self.process_file(filename)
+            with self.metrics.stage(f'load {filename}') as stage:
+                data = self.load_file(filename)
+                stage.items = len(data)
+            files.append((filename, data))
+
+        pending = [entry for filename, data in files for entry in data
+                   if not self.is_unchanged(filename, entry)]
+        with self.metrics.stage('segment') as stage:
+            segmented = iter(self.segment_paragraphs(pending))
+            stage.items = len(pending)
+
+        print(f"\n🔗 Assembling sentence entries...")
+        all_sentences = []
+        for filename, data in files:
+            with self.metrics.stage(f'assemble {filename}') as stage:
+                sentences = self.assemble_file(filename, data, segmented)
+                stage.items = len(sentences)
             all_sentences.extend(sentences)
 
         return all_sentences
@@ -236,8 +445,10 @@ class SentenceExtractor:
         output_path = self.base_path / output_filename
 
         print(f"\n💾 Saving to {output_path}...")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(sentences, f, ensure_ascii=False, indent=2)
+        with self.metrics.stage('write-json') as stage:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(sentences, f, ensure_ascii=False, indent=2)
+            stage.items = len(sentences)
 
         file_size = output_path.stat().st_size / 1024  # KB
         print(f"  ✓ Saved {len(sentences)} sentence entries")
@@ -254,45 +465,49 @@ class SentenceExtractor:
         print("EXTRACTION REPORT")
         print("=" * 70)
 
-        print(f"\nTotal sentences extracted: {len(sentences)}")
-        print(f"Incomplete translations: {self.incomplete_count}")
-        print(f"Complete translations: {len(sentences) - self.incomplete_count}")
+        total = self.metrics.counters['sentences']
+        incomplete_count = self.metrics.counters['incomplete']
+        print(f"\nTotal sentences extracted: {total}")
+        print(f"Incomplete translations: {incomplete_count}")
+        print(f"Complete translations: {total - incomplete_count}")
 
-        completion_rate = ((len(sentences) - self.incomplete_count) / len(sentences) * 100) if sentences else 0
+        completion_rate = ((total - incomplete_count) / total * 100) if total else 0
         print(f"Completion rate: {completion_rate:.1f}%")
+        print(f"Paragraphs segmented: {self.metrics.counters['paragraphs-extracted']}, "
+              f"unchanged: {self.metrics.counters['paragraphs-reused']}")
 
         # Breakdown by reason
         print("\n📊 Incomplete Translation Reasons:")
-        reasons = {}
-        for sent in sentences:
-            if sent['incomplete']:
-                reason = sent.get('incomplete-reason', 'Unknown')
-                reasons[reason] = reasons.get(reason, 0) + 1
-
+        reasons = self.metrics.breakdowns['incomplete-reason']
         for reason, count in sorted(reasons.items(), key=lambda x: x[1], reverse=True):
             print(f"  • {reason}: {count}")
 
+        # Breakdown by alignment type (within paragraphs)
+        print("\n🔗 Sentence Alignments (paragraphs segmented in this run):")
+        alignments = self.metrics.breakdowns['alignment']
+        for kind, count in sorted(alignments.items(), key=lambda x: x[1], reverse=True):
+            print(f"  • {kind}: {count}")
+
         # Breakdown by document
         print("\n📚 By Document:")
-        documents = {}
-        incomplete_by_doc = {}
-        for sent in sentences:
-            doc = sent.get('document', 'Unknown')
-            documents[doc] = documents.get(doc, 0) + 1
-            if sent['incomplete']:
-                incomplete_by_doc[doc] = incomplete_by_doc.get(doc, 0) + 1
+        documents = self.metrics.breakdowns['document']
+        incomplete_by_doc = self.metrics.breakdowns['document-incomplete']
 
         for doc in sorted(documents.keys()):
-            total = documents[doc]
+            doc_total = documents[doc]
             incomplete = incomplete_by_doc.get(doc, 0)
-            complete = total - incomplete
-            pct = (complete / total * 100) if total > 0 else 0
-            print(f"  • {doc}: {complete}/{total} ({pct:.1f}%)")
+            complete = doc_total - incomplete
+            pct = (complete / doc_total * 100) if doc_total > 0 else 0
+            print(f"  • {doc}: {complete}/{doc_total} ({pct:.1f}%)")
+
+        metrics_path = self.base_path / METRICS_FILE
+        self.metrics.save(str(metrics_path))
+        print(f"\n📈 Build metrics written to {metrics_path}")
 
         print("\n" + "=" * 70)
         print("NEXT STEPS")
         print("=" * 70)
-        print("\n1. Review NL-EN-civil-procedure-sentences-all.json")
+        print(f"\n1. Review {OUTPUT_FILE}")
         print("2. Filter entries where 'incomplete' = true")
         print("3. Manually add English translations")
         print("4. Set 'incomplete' = false when done")
@@ -300,16 +515,31 @@ class SentenceExtractor:
         print("\n✅ Extraction complete!")
 
 
+def _segment_chunk(paragraphs: List[Dict]) -> Tuple[List[List[Dict]], BuildMetrics]:
+    """Segment a chunk of paragraphs (runs in a worker process)"""
+    extractor = SentenceExtractor()
+    return [extractor.process_paragraph(entry) for entry in paragraphs], extractor.metrics
+
+
 def main():
     """Main execution"""
-    extractor = SentenceExtractor()
+    parser = argparse.ArgumentParser(
+        description='Extract sentences from the civil procedure paragraph files'
+    )
+    parser.add_argument('--full', action='store_true',
+                        help='Segment every paragraph again (drops manual fixes)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Processes for segmentation (default: CPU count)')
+    args = parser.parse_args()
+
+    extractor = SentenceExtractor(full=args.full, workers=args.workers)
 
     # Extract all sentences
     sentences = extractor.extract_all()
 
     # Save to file
-    output_filename = 'NL-EN-civil-procedure-sentences-all.json'
-    extractor.save_json(sentences, output_filename)
+    extractor.save_json(sentences, OUTPUT_FILE)
+    extractor.save_state()
 
     # Generate report
     extractor.generate_report(sentences)
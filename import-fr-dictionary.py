@@ -6,6 +6,10 @@ Import FR-FR dictionary into unified dictionary structure
 import json
 from pathlib import Path
 
+from dictionary_patches import term_sort_key
+from normalization import normalize_key
+from term_ids import IdTable
+
 def load_json(filepath):
     """Load JSON file"""
     with open(filepath, 'r', encoding='utf-8') as f:
@@ -34,16 +38,12 @@ def import_fr_dictionary():
     unified_dict = load_json(unified_path)
     print(f"  ✓ Loaded {len(unified_dict)} existing terms")
 
-    # Find the highest ID number
-    max_id = 0
-    for entry in unified_dict:
-        id_num = int(entry['id'].split('_')[1])
-        max_id = max(max_id, id_num)
-
-    print(f"\n🔢 Starting from ID: term_{str(max_id + 1).zfill(5)}")
-
-    # Create a lookup for existing terms
-    existing_terms = {entry['term'].lower().strip(): entry for entry in unified_dict}
+    # Create a lookup for existing terms; new terms get content-derived IDs
+    existing_terms = {entry.get('normalized') or normalize_key(entry['term']): entry
+                      for entry in unified_dict}
+    ids = IdTable()
+    for term_key, entry in existing_terms.items():
+        ids.reserve(term_key, entry['id'])
 
     # Process FR-FR entries
     added_count = 0
@@ -67,6 +67,7 @@ def import_fr_dictionary():
         # Create translation object (FR-FR definition)
         translation = {
             'translation': source_term,  # Same as source for FR-FR
+            'normalized': normalize_key(source_term),
             'lang': 'fr-fr',
             'definition': fr_entry.get('lang-source-dict'),
             'source': fr_entry.get('author', 'Unknown'),
@@ -77,17 +78,17 @@ def import_fr_dictionary():
         }
 
         # Check if term already exists
-        term_key = source_term.lower().strip()
+        term_key = normalize_key(source_term)
         if term_key in existing_terms:
             # Add to existing term
             existing_terms[term_key]['translations'].append(translation)
             updated_count += 1
         else:
             # Create new term entry
-            max_id += 1
             new_entry = {
-                'id': f"term_{str(max_id).zfill(5)}",
+                'id': ids.term_id(term_key),
                 'term': source_term,
+                'normalized': term_key,
                 'lang': fr_entry.get('lang-source', 'fr-fr'),
                 'translations': [translation],
                 'examples': [],
@@ -99,9 +100,10 @@ def import_fr_dictionary():
 
     print(f"  ✓ Added {added_count} new French terms")
     print(f"  ✓ Updated {updated_count} existing terms with French definitions")
+    ids.save()
 
     # Sort by term
-    unified_dict.sort(key=lambda x: x['term'].lower())
+    unified_dict.sort(key=term_sort_key)
 
     # Save updated unified dictionary
     print(f"\n💾 Saving updated dictionary to {unified_path}...")
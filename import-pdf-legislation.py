@@ -5,19 +5,42 @@ Import PDF legislation files and match them paragraph by paragraph.
 This script extracts text from bilingual PDF files (e.g., Dutch and English versions
 of the same legal code) and creates paragraph-by-paragraph matched translations.
 
+Pages are extracted in parallel across a process pool, and the text of each
+page is cached on disk (.pdf-page-cache/), keyed by the PDF content hash,
+the page number and the extractor settings. Re-running with another --mode
+or after an alignment change reuses the cached text instead of parsing the
+PDFs again.
+
+Segments are aligned with a length-based dynamic-programming aligner
+(Gale-Church, see length_alignment.py), so a split or merged paragraph only
+affects its own pair instead of shifting every pair after it. Each unit
+carries its alignment type and score; doubtful units are written to a
+review queue next to the output (<output>-review.json), lowest score first.
+
+Before aligning segments, both documents are cut into blocks at the article
+headings they share ("Artikel 12a" / "Article 12a"). Each pair of blocks is
+aligned on its own, in parallel, so an alignment error cannot spread past
+an article boundary.
+
 Requirements:
     pip install pdfplumber python-docx
 
 Usage:
     python import-pdf-legislation.py --nl dutch.pdf --en english.pdf --output NL-EN-legislation.json
     python import-pdf-legislation.py --nl dutch.pdf --en english.pdf --mode sentence --output NL-EN-legislation-sentences.json
+    python import-pdf-legislation.py --nl dutch.pdf --en english.pdf --workers 8 --output NL-EN-legislation.json
+    python import-pdf-legislation.py --nl dutch.pdf --en english.pdf --no-cache --output NL-EN-legislation.json
 """
 
 import argparse
+import difflib
+import hashlib
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 try:
     import pdfplumber
@@ -25,11 +48,35 @@ except ImportError:
     print("ERROR: pdfplumber not installed. Install with: pip install pdfplumber")
     exit(1)
 
+from length_alignment import DEFAULT_BAND, Bead, align_by_length
+from sentence_segmenter import split_sentences
+
+PAGE_CACHE_DIR = '.pdf-page-cache'
+
+# Passed to page.extract_text(); part of the cache key
+EXTRACTOR_SETTINGS = {'x_tolerance': 3, 'y_tolerance': 3}
+
+# Units scoring below this go to the review queue: a 1:1 pair whose length
+# ratio is about two standard deviations off, and every non-1:1 alignment
+REVIEW_THRESHOLD = 0.05
+
+# Article heading at the start of a segment; used as an alignment anchor
+ARTICLE_HEADING = re.compile(r'^\s*(?:Artikel|Article|Art\.)\s+\d+[a-z]?\b', re.IGNORECASE)
+
+
+def _extract_page_range(pdf_path: str, page_numbers: List[int], settings: Dict) -> List[Tuple[int, str]]:
+    """Extract the text of some pages of a PDF (runs in a worker process)"""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [(page_num, pdf.pages[page_num - 1].extract_text(**settings) or '')
+                for page_num in page_numbers]
+
 
 class PDFLegislationImporter:
     """Import and match bilingual PDF legislation"""
 
-    def __init__(self, nl_pdf: str, en_pdf: str, mode: str = 'paragraph'):
+    def __init__(self, nl_pdf: str, en_pdf: str, mode: str = 'paragraph',
+                 workers: Optional[int] = None, cache_dir: Optional[str] = PAGE_CACHE_DIR,
+                 band: int = DEFAULT_BAND):
         """
         Initialize importer
 
@@ -37,16 +84,87 @@ class PDFLegislationImporter:
             nl_pdf: Path to Dutch PDF file
             en_pdf: Path to English PDF file
             mode: Segmentation mode ('paragraph' or 'sentence')
+            workers: Processes for page extraction and alignment (default: CPU count)
+            cache_dir: Page-text cache directory (None disables the cache)
+            band: Initial search band of the aligner (widened when needed)
         """
         self.nl_pdf = Path(nl_pdf)
         self.en_pdf = Path(en_pdf)
         self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.band = band
+        self.review_queue: List[Dict] = []
 
         if not self.nl_pdf.exists():
             raise FileNotFoundError(f"Dutch PDF not found: {nl_pdf}")
         if not self.en_pdf.exists():
             raise FileNotFoundError(f"English PDF not found: {en_pdf}")
 
+    def cache_path(self, pdf_path: Path) -> Path:
+        """
+        Page-text cache file of a PDF
+
+        The file name combines the PDF content hash with a hash of the
+        extractor settings and pdfplumber version; inside, texts are stored
+        per page number.
+        """
+        digest = hashlib.sha256()
+        with open(pdf_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+
+        settings = json.dumps({'settings': EXTRACTOR_SETTINGS,
+                               'pdfplumber': getattr(pdfplumber, '__version__', '')},
+                              sort_keys=True)
+        settings_hash = hashlib.sha256(settings.encode('utf-8')).hexdigest()[:12]
+        return self.cache_dir / f"{digest.hexdigest()}-{settings_hash}.json"
+
+    def extract_pages(self, pdf_path: Path) -> List[str]:
+        """
+        Extract the text of every page, using the cache and a process pool
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            Text per page (empty string for pages without text)
+        """
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+
+        cache_file = self.cache_path(pdf_path) if self.cache_dir else None
+        cached = {}
+        if cache_file and cache_file.exists():
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = {int(page_num): text for page_num, text in json.load(f).items()}
+
+        missing = [page_num for page_num in range(1, page_count + 1) if page_num not in cached]
+        if cached:
+            print(f"  ✓ {page_count - len(missing)} of {page_count} pages from cache")
+
+        if missing:
+            workers = min(self.workers, len(missing))
+            if workers <= 1:
+                cached.update(_extract_page_range(str(pdf_path), missing, EXTRACTOR_SETTINGS))
+            else:
+                # Contiguous page ranges, so each worker opens the PDF once per range
+                size = -(-len(missing) // (workers * 2))
+                ranges = [missing[i:i + size] for i in range(0, len(missing), size)]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for pages in executor.map(_extract_page_range, [str(pdf_path)] * len(ranges),
+                                              ranges, [EXTRACTOR_SETTINGS] * len(ranges)):
+                        cached.update(pages)
+            print(f"  ✓ Extracted {len(missing)} pages with {workers} worker(s)")
+
+            if cache_file:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump({str(page_num): cached[page_num] for page_num in sorted(cached)},
+                              f, ensure_ascii=False)
+
+        return [cached[page_num] for page_num in range(1, page_count + 1)]
+
     def extract_paragraphs(self, pdf_path: Path) -> List[str]:
         """
         Extract paragraphs from PDF
@@ -59,33 +177,31 @@ class PDFLegislationImporter:
         """
         paragraphs = []
 
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                text = page.extract_text()
-
-                if not text:
-                    continue
+        for text in self.extract_pages(pdf_path):
+            if not text:
+                continue
 
-                # Split by double newlines or article numbers
-                # Common patterns: "Artikel 1", "Article 1", "Art. 1"
-                chunks = re.split(
-                    r'\n\s*\n|(?=(?:Artikel|Article|Art\.)\s+\d+)',
-                    text
-                )
+            # Split by double newlines or article numbers
+            # Common patterns: "Artikel 1", "Article 1", "Art. 1"
+            chunks = re.split(
+                r'\n\s*\n|(?=(?:Artikel|Article|Art\.)\s+\d+)',
+                text
+            )
 
-                for chunk in chunks:
-                    chunk = chunk.strip()
-                    if chunk and len(chunk) > 10:  # Skip very short fragments
-                        paragraphs.append(chunk)
+            for chunk in chunks:
+                chunk = chunk.strip()
+                if chunk and len(chunk) > 10:  # Skip very short fragments
+                    paragraphs.append(chunk)
 
         return paragraphs
 
-    def extract_sentences(self, pdf_path: Path) -> List[str]:
+    def extract_sentences(self, pdf_path: Path, lang: str) -> List[str]:
         """
         Extract sentences from PDF
 
         Args:
             pdf_path: Path to PDF file
+            lang: Language of the PDF ('nl' or 'en')
 
         Returns:
             List of sentences
@@ -94,12 +210,9 @@ class PDFLegislationImporter:
         sentences = []
 
         for para in paragraphs:
-            # Split by sentence endings (. ! ?) followed by space and capital letter
-            # But preserve abbreviations like "Art.", "Rv.", etc.
-            para_sentences = re.split(
-                r'(?<!\bArt)(?<!\bRv)(?<!\bNr)(?<!\bDr)(?<!\bMr)\. (?=[A-Z])',
-                para
-            )
+            # Split by sentence endings (. ! ?) followed by a capital letter,
+            # skipping the language's abbreviations like "Art.", "Rv.", etc.
+            para_sentences = split_sentences(para, lang)
 
             for sent in para_sentences:
                 sent = sent.strip()
@@ -131,9 +244,93 @@ class PDFLegislationImporter:
 
         return ''
 
+    def article_anchor(self, text: str) -> str:
+        """
+        Article number of a segment that starts with an article heading
+
+        Only headings count as anchors; an article mentioned further on in
+        the text ("zie artikel 12") is a reference, not a boundary.
+
+        Args:
+            text: Segment text
+
+        Returns:
+            Lowercase article number, or empty string
+        """
+        if not ARTICLE_HEADING.match(text):
+            return ''
+        return self.detect_article_numbers(text).lower()
+
+    def align_blocks(self, nl_paras: List[str], en_paras: List[str]) -> List[Bead]:
+        """
+        Align segments block by block between shared article headings
+
+        The article numbers of both documents are matched in order (longest
+        common subsequence, so numbering that restarts per book or articles
+        missing from one version are handled). The segments between two
+        matched headings form a block pair, aligned independently by length.
+
+        Args:
+            nl_paras: Dutch segments
+            en_paras: English segments
+
+        Returns:
+            Beads with indices into the full segment lists
+        """
+        nl_anchors = [(i, self.article_anchor(p)) for i, p in enumerate(nl_paras)]
+        nl_anchors = [(i, number) for i, number in nl_anchors if number]
+        en_anchors = [(j, self.article_anchor(p)) for j, p in enumerate(en_paras)]
+        en_anchors = [(j, number) for j, number in en_anchors if number]
+
+        matcher = difflib.SequenceMatcher(None, [number for _, number in nl_anchors],
+                                          [number for _, number in en_anchors], autojunk=False)
+        cuts = [(0, 0)]
+        shared = 0
+        for a, b, size in matcher.get_matching_blocks():
+            shared += size
+            for k in range(size):
+                cut = (nl_anchors[a + k][0], en_anchors[b + k][0])
+                if cut != cuts[-1]:
+                    cuts.append(cut)
+        cuts.append((len(nl_paras), len(en_paras)))
+
+        blocks = list(zip(cuts, cuts[1:]))
+        nl_lengths = [[len(p) for p in nl_paras[i:next_i]] for (i, _), (next_i, _) in blocks]
+        en_lengths = [[len(p) for p in en_paras[j:next_j]] for (_, j), (_, next_j) in blocks]
+        bands = [self.band] * len(blocks)
+
+        # One expected length ratio for the whole document: a block's own
+        # totals would make a single-paragraph block always look complete
+        nl_total = sum(map(len, nl_paras))
+        en_total = sum(map(len, en_paras))
+        ratios = [en_total / nl_total if nl_total and en_total else 1.0] * len(blocks)
+
+        print(f"  ✓ Anchored on {shared} shared article headings ({len(blocks)} blocks)")
+
+        workers = min(self.workers, len(blocks))
+        if workers <= 1:
+            results = list(map(align_by_length, nl_lengths, en_lengths, bands, ratios))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(align_by_length, nl_lengths, en_lengths, bands, ratios,
+                                            chunksize=-(-len(blocks) // (workers * 4))))
+
+        beads = []
+        for ((i, j), _), block_beads in zip(blocks, results):
+            for bead in block_beads:
+                beads.append(Bead(tuple(i + k for k in bead.source),
+                                  tuple(j + k for k in bead.target), bead.score))
+
+        return beads
+
     def match_paragraphs(self, nl_paras: List[str], en_paras: List[str]) -> List[Dict]:
         """
-        Match Dutch and English paragraphs
+        Align Dutch and English paragraphs by length
+
+        Paragraphs are aligned per article block (see align_blocks) and
+        grouped 1:1, 1:2 or 2:1; grouped paragraphs are joined
+        into one unit. Paragraphs left without a counterpart (1:0 and 0:1)
+        do not become units but are added to the review queue.
 
         Args:
             nl_paras: Dutch paragraphs
@@ -143,37 +340,56 @@ class PDFLegislationImporter:
             List of matched translation units
         """
         translation_units = []
-
-        # Simple 1:1 matching
-        max_len = min(len(nl_paras), len(en_paras))
-
-        for i in range(max_len):
-            nl_text = nl_paras[i]
-            en_text = en_paras[i]
+        self.review_queue = []
+        kinds = {}
+
+        beads = self.align_blocks(nl_paras, en_paras)
+
+        for bead in beads:
+            kinds[bead.kind] = kinds.get(bead.kind, 0) + 1
+            nl_text = ' '.join(nl_paras[i] for i in bead.source)
+            en_text = ' '.join(en_paras[j] for j in bead.target)
+
+            if not bead.source or not bead.target:
+                self.review_queue.append({
+                    'id': None,
+                    'nl': nl_text or None,
+                    'en': en_text or None,
+                    'alignment': bead.kind,
+                    'alignment-score': round(bead.score, 6),
+                })
+                continue
 
             # Detect article number
             article_num = self.detect_article_numbers(nl_text) or \
                          self.detect_article_numbers(en_text)
 
             tu = {
-                'id': f'tu_{i+1:04d}',
+                'id': f'tu_{len(translation_units) + 1:04d}',
                 'nl': nl_text,
                 'en': en_text,
                 'article': article_num or None,
                 'segmentation': self.mode,
+                'alignment': bead.kind,
+                'alignment-score': round(bead.score, 6),
                 'source': 'PDF Import',
                 'license': 'TBD',  # User should update this
             }
 
             translation_units.append(tu)
+            if bead.score < REVIEW_THRESHOLD:
+                self.review_queue.append(tu)
+
+        self.review_queue.sort(key=lambda tu: tu['alignment-score'])
 
         # Report mismatches
-        if len(nl_paras) != len(en_paras):
-            print(f"\n⚠️  WARNING: Paragraph count mismatch!")
+        if len(nl_paras) != len(en_paras) or len(kinds) > 1:
+            print(f"\n⚠️  WARNING: Paragraph count mismatch!" if len(nl_paras) != len(en_paras)
+                  else f"\n⚠️  WARNING: Some paragraphs were split or merged!")
             print(f"   Dutch paragraphs: {len(nl_paras)}")
             print(f"   English paragraphs: {len(en_paras)}")
-            print(f"   Matched: {max_len}")
-            print(f"   Unmatched: {abs(len(nl_paras) - len(en_paras))}")
+            print(f"   Alignments: " +
+                  ', '.join(f"{count} × {kind}" for kind, count in sorted(kinds.items())))
 
         return translation_units
 
@@ -193,14 +409,14 @@ class PDFLegislationImporter:
 
         print(f"\n📄 Extracting {self.mode}s from Dutch PDF...")
         if self.mode == 'sentence':
-            nl_segments = self.extract_sentences(self.nl_pdf)
+            nl_segments = self.extract_sentences(self.nl_pdf, 'nl')
         else:
             nl_segments = self.extract_paragraphs(self.nl_pdf)
         print(f"  ✓ Extracted {len(nl_segments)} Dutch {self.mode}s")
 
         print(f"\n📄 Extracting {self.mode}s from English PDF...")
         if self.mode == 'sentence':
-            en_segments = self.extract_sentences(self.en_pdf)
+            en_segments = self.extract_sentences(self.en_pdf, 'en')
         else:
             en_segments = self.extract_paragraphs(self.en_pdf)
         print(f"  ✓ Extracted {len(en_segments)} English {self.mode}s")
@@ -217,16 +433,10 @@ class PDFLegislationImporter:
         if short_segments:
             print(f"  ⚠️  {len(short_segments)} segments are very short (< 20 chars)")
 
-        # Check for length mismatches (ratio > 2:1 or < 1:2)
-        length_mismatches = []
-        for tu in translation_units:
-            ratio = len(tu['nl']) / max(len(tu['en']), 1)
-            if ratio > 2.5 or ratio < 0.4:
-                length_mismatches.append(tu)
-
-        if length_mismatches:
-            print(f"  ⚠️  {len(length_mismatches)} segments have suspicious length ratios")
-            print(f"      (May indicate alignment issues)")
+        # Low alignment scores (unusual length ratios, split or unmatched paragraphs)
+        if self.review_queue:
+            print(f"  ⚠️  {len(self.review_queue)} segments need alignment review "
+                  f"(score < {REVIEW_THRESHOLD})")
 
         # Article number coverage
         with_articles = [tu for tu in translation_units if tu['article']]
@@ -255,6 +465,13 @@ class PDFLegislationImporter:
         print(f"  ✓ Saved {len(translation_units)} translation units")
         print(f"  ✓ File size: {file_size:.1f} KB")
 
+        if self.review_queue:
+            review_file = output_file.with_name(f"{output_file.stem}-review.json")
+            with open(review_file, 'w', encoding='utf-8') as f:
+                json.dump(self.review_queue, f, ensure_ascii=False, indent=2)
+            print(f"  ✓ Saved review queue ({len(self.review_queue)} segments, "
+                  f"lowest score first) to {review_file}")
+
     def generate_report(self, translation_units: List[Dict]) -> str:
         """
         Generate import report
@@ -280,12 +497,13 @@ class PDFLegislationImporter:
 
             with_articles = [tu for tu in translation_units if tu['article']]
             report.append(f"Segments with article numbers: {len(with_articles)}")
+            report.append(f"Segments in review queue: {len(self.review_queue)}")
 
         report.append("\n" + "=" * 70)
         report.append("NEXT STEPS")
         report.append("=" * 70)
         report.append("\n1. Review the generated JSON file")
-        report.append("2. Check for alignment issues (length mismatches)")
+        report.append("2. Work through the review queue (lowest alignment score first)")
         report.append("3. Update 'license' field with correct license")
         report.append("4. Update 'source' field with actual source")
         report.append("5. Add metadata (jurisdiction, legislation name, etc.)")
@@ -304,11 +522,21 @@ def main():
     parser.add_argument('--output', required=True, help='Output JSON file path')
     parser.add_argument('--mode', choices=['paragraph', 'sentence'], default='paragraph',
                        help='Segmentation mode (default: paragraph)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Processes for page extraction and alignment (default: CPU count)')
+    parser.add_argument('--cache-dir', default=PAGE_CACHE_DIR,
+                       help=f'Page-text cache directory (default: {PAGE_CACHE_DIR})')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write the page-text cache')
+    parser.add_argument('--band', type=int, default=DEFAULT_BAND,
+                       help=f'Initial alignment search band (default: {DEFAULT_BAND})')
 
     args = parser.parse_args()
 
     try:
-        importer = PDFLegislationImporter(args.nl, args.en, args.mode)
+        importer = PDFLegislationImporter(args.nl, args.en, args.mode, workers=args.workers,
+                                          cache_dir=None if args.no_cache else args.cache_dir,
+                                          band=args.band)
         translation_units = importer.import_pdfs()
         importer.save_json(translation_units, args.output)
 
@@ -1,52 +1,34 @@
 #!/usr/bin/env python3
 """
 Analyze incomplete translations and create a report
+
+The heuristics live in incomplete_scorer.py and are shared with the
+sentence extractor and the TMX re-import; every file is scored in one batch.
 """
 import json
-import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from incomplete_scorer import PARAGRAPH_RULES, REASON_OK, reason_text, score_pairs
 
 def load_json(filepath):
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def is_mutatis_mutandis(nl_text):
-    """Check if text is a mutatis mutandis clause"""
-    patterns = [
-        r'van overeenkomstige toepassing',
-        r'is van toepassing',
-        r'zijn van toepassing'
-    ]
-    return any(re.search(pattern, nl_text, re.IGNORECASE) for pattern in patterns)
-
 def analyze_incomplete(data):
     """Analyze incomplete translations"""
     incomplete = []
 
-    for item in data:
+    features, reasons = score_pairs([item['source'] for item in data],
+                                    [item['target'] for item in data], PARAGRAPH_RULES)
+
+    for item, code, row in zip(data, reasons, features):
         nl = item['source']
         en = item['target']
 
-        # Check if translation seems incomplete
-        is_incomplete = False
-        reason = ""
-
-        # Pattern 1: Ends with "apply" but Dutch has more text
-        if en.strip().endswith('apply') and len(nl) > len(en) * 1.5:
-            if is_mutatis_mutandis(nl):
-                is_incomplete = True
-                reason = "Mutatis mutandis clause - truncated"
-
-        # Pattern 2: Very short English compared to Dutch
-        if len(en) < len(nl) * 0.4 and len(nl) > 50:
-            is_incomplete = True
-            reason = "English much shorter than Dutch"
-
-        # Pattern 3: Ends with ellipsis or (
-        if en.strip().endswith('...') or en.strip().endswith('('):
-            is_incomplete = True
-            reason = "Ellipsis or incomplete parenthesis"
-
-        if is_incomplete:
+        if code != REASON_OK:
+            reason = reason_text(code, row)
             incomplete.append({
                 'tuid': item.get('tuid', ''),
                 'nl': nl,
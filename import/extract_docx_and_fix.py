@@ -3,11 +3,15 @@
 Extract text from DOCX files and fix incomplete translations
 """
 import json
+import sys
 import zipfile
 import xml.etree.ElementTree as ET
 import re
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from normalization import clean_text
+
 def extract_text_from_docx(docx_path):
     """Extract all text from a DOCX file"""
     paragraphs = []
@@ -40,17 +44,8 @@ def extract_text_from_docx(docx_path):
     return paragraphs
 
 def normalize_text(text):
-    """Normalize text for comparison"""
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    # Remove special characters that might differ
-    text = text.replace('\u00a0', ' ')  # Non-breaking space
-    text = text.replace('\u2019', "'")  # Smart quote
-    text = text.replace('\u201c', '"')
-    text = text.replace('\u201d', '"')
-    text = text.replace('\u2013', '-')  # En dash
-    text = text.replace('\u2014', '-')  # Em dash
-    return text.strip()
+    """Normalize text for comparison (quotes, dashes, NBSP, whitespace)"""
+    return clean_text(text)
 
 def find_best_match(incomplete_en, en_paragraphs, min_overlap=20):
     """Find best matching paragraph from DOCX"""
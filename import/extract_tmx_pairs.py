@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Extract several language pairs from a TMX file in a single pass
+
+Multilingual memories (DGT-TM, EUR-Lex, ...) hold many languages per unit.
+Each TMX file is streamed once and every unit is written to one output per
+requested pair, e.g. NL-EN-dgt.json, NL-FR-dgt.json and EN-FR-dgt.json.
+Language codes are normalized, so 'nl-en' matches variants tagged 'NL',
+'nl-NL' or 'nl_nl' and 'en-GB' or 'EN'. Pairs that differ only in a
+region ('nl:en-gb' and 'nl:en-us') keep it in their file names. The
+lang-source/lang-target fields keep the region the memory gives (see
+TranslationUnit.lang() in tmx_reader.py).
+
+Usage:
+    python extract_tmx_pairs.py dgt.tmx --pairs nl-en nl-fr nl-de en-fr \\
+        --author "European Commission DGT" --license "CC BY 4.0"
+"""
+import argparse
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from json_stream import JsonArrayWriter
+from tmx_reader import iter_tmx, normalize_lang
+
+def parse_pair(pair):
+    """Split 'nl-en' / 'nl:en-gb' into (source, target) language codes"""
+    if ':' in pair:
+        source, target = pair.split(':', 1)
+    else:
+        source, _, target = pair.partition('-')
+    if not source or not target:
+        raise argparse.ArgumentTypeError(f"invalid language pair: {pair}")
+    return normalize_lang(source), normalize_lang(target)
+
+def pair_label(source, target):
+    """File name prefix of a pair ('nl', 'en-gb' -> 'NL-EN')"""
+    return f"{source.split('-')[0].upper()}-{target.split('-')[0].upper()}"
+
+def pair_labels(pairs):
+    """
+    File name prefix per pair, unique across the pairs
+
+    Pairs that would share a prefix ('nl:en-gb' and 'nl:en-us' are both
+    'NL-EN') keep their regions instead ('NL-EN-GB', 'NL-EN-US').
+
+    Raises:
+        ValueError: If a pair is listed twice
+    """
+    if len(set(pairs)) != len(pairs):
+        raise ValueError('language pairs listed more than once')
+
+    short = [pair_label(source, target) for source, target in pairs]
+    return {
+        (source, target): (label if short.count(label) == 1
+                           else f"{source.upper()}-{target.upper()}")
+        for (source, target), label in zip(pairs, short)
+    }
+
+def extract_pairs(filename, pairs, output_dir, name, metadata):
+    """
+    Write one JSON file per language pair from a single pass over a TMX file
+
+    Args:
+        filename: TMX file
+        pairs: List of (source, target) normalized language codes
+        output_dir: Directory for the output files
+        name: Name used in output file names
+        metadata: Fields added to every entry (author, license, ...)
+
+    Returns:
+        Dictionary of output path -> number of units written
+    """
+    labels = pair_labels(pairs)
+    writers = {}
+    try:
+        for source, target in pairs:
+            path = Path(output_dir) / f"{labels[(source, target)]}-{name}.json"
+            writers[(source, target)] = JsonArrayWriter(str(path))
+
+        for unit in iter_tmx(filename):
+            for (source, target), writer in writers.items():
+                source_text = unit.text(source)
+                target_text = unit.text(target)
+                if source_text and target_text:
+                    writer.write({
+                        'tuid': unit.tuid,
+                        'source': source_text,
+                        'target': target_text,
+                        'lang-source': unit.lang(source),
+                        'lang-target': unit.lang(target),
+                        **metadata,
+                    })
+    except BaseException:
+        for writer in writers.values():
+            writer.abort()
+        raise
+
+    for writer in writers.values():
+        writer.close()
+
+    return {writer.path: writer.count for writer in writers.values()}
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Extract several language pairs from TMX files in one pass'
+    )
+    parser.add_argument('tmx_files', nargs='+', help='TMX files to read')
+    parser.add_argument('--pairs', nargs='+', type=parse_pair, default=[('nl', 'en')],
+                        help='Language pairs, e.g. nl-en nl-fr en-fr or nl:en-gb (default: nl-en)')
+    parser.add_argument('--output-dir', default='.', help='Output directory (default: current)')
+    parser.add_argument('--name', help='Name used in output files (default: TMX file name)')
+    parser.add_argument('--author', default='Unknown', help='Author of the translations')
+    parser.add_argument('--license', default='Unknown', help='License of the translations')
+    parser.add_argument('--document', help='Document name (default: TMX file name)')
+    parser.add_argument('--type', default='translation-memory', help='Entry type (default: translation-memory)')
+    parser.add_argument('--sme-reviewed', action='store_true', help='Mark translations as SME reviewed')
+    args = parser.parse_args()
+
+    if len(set(args.pairs)) != len(args.pairs):
+        parser.error('each language pair can only be given once')
+
+    if len(args.tmx_files) > 1 and args.name:
+        parser.error('--name can only be used with a single TMX file')
+
+    for filename in args.tmx_files:
+        stem = Path(filename).stem
+        name = args.name or stem.replace(' ', '-')
+        metadata = {
+            'author': args.author,
+            'license': args.license,
+            'sme-reviewed': args.sme_reviewed,
+            'premium': False,
+            'type': args.type,
+            'document': args.document or stem,
+        }
+
+        print(f"\nProcessing {filename} ({len(args.pairs)} language pairs)...")
+        try:
+            counts = extract_pairs(filename, args.pairs, args.output_dir, name, metadata)
+        except (ET.ParseError, FileNotFoundError) as e:
+            print(f"  ✗ Error reading {filename}: {e}", file=sys.stderr)
+            continue
+
+        for path, count in counts.items():
+            print(f"  ✓ Saved {count:,} segments to {path}")
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 Merge all books into a single combined JSON file for easier browsing
+
+reimport_sentence_level.py writes the combined file while importing; use
+this script only after editing a book file by hand.
 """
 import json
 
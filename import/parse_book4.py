@@ -5,48 +5,31 @@ Parse Book 4 TMX file and convert to JSON format for legislation library
 import xml.etree.ElementTree as ET
 import json
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from tmx_reader import iter_pairs
 
 def parse_tmx(filename):
     """Parse TMX file and extract translation units"""
     try:
-        tree = ET.parse(filename)
-        root = tree.getroot()
-
         translations = []
 
-        # Find all translation units
-        for tu in root.findall('.//{*}tu'):
-            tuid = tu.get('tuid', '')
-
-            nl_text = None
-            en_text = None
-
-            # Find Dutch and English variants
-            for tuv in tu.findall('{*}tuv'):
-                lang = tuv.get('{http://www.w3.org/XML/1998/namespace}lang', '')
-                seg = tuv.find('{*}seg')
-
-                if seg is not None and seg.text:
-                    if lang == 'nl':
-                        nl_text = seg.text.strip()
-                    elif lang == 'en-gb':
-                        en_text = seg.text.strip()
-
-            # Only add if we have both translations
-            if nl_text and en_text:
-                translations.append({
-                    'tuid': tuid,
-                    'source': nl_text,
-                    'target': en_text,
-                    'lang-source': 'nl-nl',
-                    'lang-target': 'en-gb',
-                    'author': 'Burrough/Machon/Oranje/Frakes/Visser',
-                    'license': 'CC BY 4.0',
-                    'sme-reviewed': True,
-                    'premium': False,
-                    'type': 'legislation',
-                    'document': 'Wetboek van Burgerlijke Rechtsvordering - Book 4'
-                })
+        # Stream translation units that have both Dutch and English
+        for tuid, nl_text, en_text in iter_pairs(filename, 'nl', 'en-gb'):
+            translations.append({
+                'tuid': tuid,
+                'source': nl_text,
+                'target': en_text,
+                'lang-source': 'nl-nl',
+                'lang-target': 'en-gb',
+                'author': 'Burrough/Machon/Oranje/Frakes/Visser',
+                'license': 'CC BY 4.0',
+                'sme-reviewed': True,
+                'premium': False,
+                'type': 'legislation',
+                'document': 'Wetboek van Burgerlijke Rechtsvordering - Book 4'
+            })
 
         return translations
     except ET.ParseError as e:
@@ -2,11 +2,18 @@
 """
 Process legislation file to:
 1. Merge article numbers with following sentences
-2. Extract new glossary terms not in existing glossary
+2. Extract new glossary terms not in existing glossary, ranked by
+   C-value/NC-value over a corpus n-gram index (see term_extraction.py)
 """
 import json
 import re
-from typing import List, Dict, Set
+import sys
+from pathlib import Path
+from typing import List, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from term_extraction import extract_terms
 
 def load_json(filepath: str) -> List[Dict]:
     """Load JSON file"""
@@ -64,106 +71,43 @@ def merge_article_numbers(data: List[Dict]) -> List[Dict]:
 
     return merged
 
-def extract_terms_from_text(text: str) -> Set[str]:
-    """Extract potential legal terms from text"""
-    terms = set()
-
-    # Clean and split text
-    words = text.lower().split()
-
-    # Extract single words (nouns/legal terms)
-    for word in words:
-        # Remove punctuation
-        clean_word = re.sub(r'[^\w\s-]', '', word)
-        if len(clean_word) > 3:  # Skip very short words
-            terms.add(clean_word)
-
-    # Extract common multi-word legal phrases (2-3 words)
-    for i in range(len(words)):
-        # Two-word phrases
-        if i + 1 < len(words):
-            phrase = ' '.join(words[i:i+2])
-            clean_phrase = re.sub(r'[^\w\s-]', '', phrase)
-            if len(clean_phrase) > 6:
-                terms.add(clean_phrase)
-
-        # Three-word phrases
-        if i + 2 < len(words):
-            phrase = ' '.join(words[i:i+3])
-            clean_phrase = re.sub(r'[^\w\s-]', '', phrase)
-            if len(clean_phrase) > 10:
-                terms.add(clean_phrase)
-
-    return terms
-
-def extract_glossary_terms(legislation_data: List[Dict], existing_glossary: List[Dict]) -> List[Dict]:
-    """Extract new glossary terms from legislation that don't exist in current glossary"""
-
-    # Build set of existing terms (both source and target)
-    existing_sources = set()
-    existing_targets = set()
-
-    for term in existing_glossary:
-        if 'source' in term:
-            existing_sources.add(term['source'].lower())
-        if 'target' in term:
-            existing_targets.add(term['target'].lower())
-
-    print(f"Existing glossary has {len(existing_sources)} Dutch terms and {len(existing_targets)} English terms")
-
-    # Extract term pairs from legislation
-    term_pairs = {}  # source -> target mapping
-
-    for item in legislation_data:
-        source = item['source']
-        target = item['target']
-
-        # Skip headers, article numbers, dates, etc.
-        if (is_article_header(source) or
-            is_article_number(source) or
-            source.isupper() or  # Skip all-caps titles
-            len(source.split()) < 2 or  # Skip very short entries
-            len(source) < 10):  # Skip very short text
-            continue
-
-        # Look for specific legal terms (specific patterns)
-        # This is a basic extraction - can be enhanced with NLP
-        source_lower = source.lower()
-        target_lower = target.lower()
-
-        # Only add if not already in glossary
-        if source_lower not in existing_sources and target_lower not in existing_targets:
-            # Create a term pair
-            key = (source[:100], target[:100])  # Truncate for key
-            if key not in term_pairs:
-                term_pairs[key] = {
-                    'source': source[:200],  # Limit length for glossary
-                    'target': target[:200],
-                    'count': 1
-                }
-            else:
-                term_pairs[key]['count'] += 1
-
-    # Convert to glossary format
+def extract_glossary_terms(legislation_data: List[Dict], existing_glossary: List[Dict],
+                           limit: int = 500) -> List[Dict]:
+    """
+    Extract new glossary terms from legislation that don't exist in current glossary
+
+    Candidate terms of any length are counted in one pass over the
+    legislation and ranked by NC-value; each gets the English n-gram it
+    co-occurs with most as suggested translation.
+
+    Args:
+        legislation_data: Legislation segments (source, target)
+        existing_glossary: Glossary entries whose terms are skipped
+        limit: Number of terms to return
+
+    Returns:
+        Glossary entries by descending NC-value
+    """
+    existing_sources = {term['source'].lower() for term in existing_glossary if 'source' in term}
+    print(f"Existing glossary has {len(existing_sources)} Dutch terms")
+
     new_glossary = []
-    for (src, tgt), data in term_pairs.items():
-        # Only include if appears multiple times or is likely a legal term
-        if data['count'] >= 1:  # You can adjust this threshold
-            new_glossary.append({
-                'source': data['source'],
-                'lang-source': 'nl-nl',
-                'target': data['target'],
-                'lang-target': 'en-gb',
-                'author': 'Burrough/Machon/Oranje/Frakes/Visser',
-                'license': 'CC BY 4.0',
-                'sme-reviewed': True,
-                'premium': False,
-                'type': 'legislation-derived',
-                'occurrences': data['count']
-            })
-
-    # Sort by occurrence count
-    new_glossary.sort(key=lambda x: x['occurrences'], reverse=True)
+    for term in extract_terms(legislation_data, limit, exclude=existing_sources):
+        new_glossary.append({
+            'source': term['term'],
+            'lang-source': 'nl-nl',
+            'target': term['translation'],
+            'lang-target': 'en-gb',
+            'author': 'Burrough/Machon/Oranje/Frakes/Visser',
+            'license': 'CC BY 4.0',
+            # Machine-extracted candidates, not yet reviewed
+            'sme-reviewed': False,
+            'premium': False,
+            'type': 'legislation-derived',
+            'occurrences': term['frequency'],
+            'c-value': term['c-value'],
+            'nc-value': term['nc-value'],
+        })
 
     print(f"Extracted {len(new_glossary)} potential new glossary terms")
 
@@ -209,16 +153,17 @@ def main():
 
     # Task 2: Extract glossary terms
     print("\n3. Extracting potential glossary terms...")
-    new_terms = extract_glossary_terms(merged_legislation, existing_glossary)
+    new_terms = extract_glossary_terms(merged_legislation, existing_glossary, limit=500)
 
     # Save new terms
-    save_json(output_new_terms, new_terms[:500])  # Save top 500 terms
-    print(f"   - Saved top {min(500, len(new_terms))} new terms to {output_new_terms}")
+    save_json(output_new_terms, new_terms)
+    print(f"   - Saved top {len(new_terms)} new terms to {output_new_terms}")
 
-    # Show top 10 most frequent
-    print("\n   Top 10 most frequent new terms:")
+    # Show top 10 ranked
+    print("\n   Top 10 ranked new terms:")
     for i, term in enumerate(new_terms[:10], 1):
-        print(f"   {i}. [{term['occurrences']}x] {term['source'][:60]} → {term['target'][:60]}")
+        print(f"   {i}. [{term['occurrences']}x, NC {term['nc-value']:.1f}] "
+              f"{term['source'][:60]} → {term['target'][:60]}")
 
     print("\n" + "=" * 60)
     print("PROCESSING COMPLETE!")
@@ -1,72 +1,122 @@
 #!/usr/bin/env python3
 """
 Re-import all books from sentence-level TMX files to fix incomplete translations
+
+The books are parsed in parallel (one process per book) and written to the
+per-book files and to the combined NL-EN-civil-procedure-all.json in the
+same run, in book order, so merge_all_books.py no longer needs to reload
+them. Each worker hands its parsed book back to the main process as a
+whole; only the writing of the combined file overlaps with parsing.
+
+A book whose TMX file yields nothing is left out of the combined file,
+unless --keep-previous is given.
+
+Usage:
+    python reimport_sentence_level.py
+    python reimport_sentence_level.py --workers 1      # parse serially
+    python reimport_sentence_level.py --keep-previous  # reuse old book files
 """
+import argparse
+import contextlib
+import io
 import xml.etree.ElementTree as ET
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from incomplete_scorer import PARAGRAPH_RULES, REASON_OK, reason_text, score_pairs
+from json_stream import JsonArrayWriter
+from tmx_reader import iter_pairs
 
 def parse_tmx(filename, book_name):
     """Parse TMX file and extract translation units"""
     try:
-        tree = ET.parse(filename)
-        root = tree.getroot()
-
         translations = []
-        incomplete_count = 0
 
-        # Find all translation units
-        for tu in root.findall('.//{*}tu'):
-            tuid = tu.get('tuid', '')
-
-            nl_text = None
-            en_text = None
-
-            # Find Dutch and English variants
-            for tuv in tu.findall('{*}tuv'):
-                lang = tuv.get('{http://www.w3.org/XML/1998/namespace}lang', '')
-                seg = tuv.find('{*}seg')
-
-                if seg is not None and seg.text:
-                    if lang == 'nl':
-                        nl_text = seg.text.strip()
-                    elif lang == 'en-gb':
-                        en_text = seg.text.strip()
-
-            # Only add if we have both translations
-            if nl_text and en_text:
-                # Check for incomplete translations (known patterns)
-                if (en_text.endswith(' apply') or
-                    en_text.endswith(' applicable') or
-                    len(en_text) < len(nl_text) * 0.3):  # English much shorter than Dutch
-                    incomplete_count += 1
-                    print(f"  Warning - possible incomplete translation (TUID {tuid}):")
-                    print(f"    NL: {nl_text[:100]}...")
-                    print(f"    EN: {en_text[:100]}...")
-
-                translations.append({
-                    'tuid': tuid,
-                    'source': nl_text,
-                    'target': en_text,
-                    'lang-source': 'nl-nl',
-                    'lang-target': 'en-gb',
-                    'author': 'Burrough/Machon/Oranje/Frakes/Visser',
-                    'license': 'CC BY 4.0',
-                    'sme-reviewed': True,
-                    'premium': False,
-                    'type': 'legislation',
-                    'document': f'Wetboek van Burgerlijke Rechtsvordering - {book_name}'
-                })
+        # Stream translation units that have both Dutch and English
+        for tuid, nl_text, en_text in iter_pairs(filename, 'nl', 'en-gb'):
+            translations.append({
+                'tuid': tuid,
+                'source': nl_text,
+                'target': en_text,
+                'lang-source': 'nl-nl',
+                'lang-target': 'en-gb',
+                'author': 'Burrough/Machon/Oranje/Frakes/Visser',
+                'license': 'CC BY 4.0',
+                'sme-reviewed': True,
+                'premium': False,
+                'type': 'legislation',
+                'document': f'Wetboek van Burgerlijke Rechtsvordering - {book_name}'
+            })
+
+        # Check for incomplete translations (heuristics shared with the sentence extractor)
+        features, reasons = score_pairs([t['source'] for t in translations],
+                                        [t['target'] for t in translations], PARAGRAPH_RULES)
+        incomplete_count = 0
+        for translation, code, row in zip(translations, reasons, features):
+            if code != REASON_OK:
+                incomplete_count += 1
+                print(f"  Warning - possible incomplete translation (TUID {translation['tuid']}): "
+                      f"{reason_text(code, row)}")
+                print(f"    NL: {translation['source'][:100]}...")
+                print(f"    EN: {translation['target'][:100]}...")
 
         if incomplete_count > 0:
             print(f"  Found {incomplete_count} potentially incomplete translations")
 
         return translations
-    except ET.ParseError as e:
+    except (ET.ParseError, FileNotFoundError) as e:
         print(f"Error parsing TMX file: {e}", file=sys.stderr)
         return []
 
+def import_book(file_info, keep_previous=False):
+    """
+    Parse one book and write its JSON file (runs in a worker process)
+
+    Args:
+        file_info: Book description (file, book, output)
+        keep_previous: If the TMX file yields nothing, use the previously
+            imported book file for the combined output
+
+    Returns:
+        (translations, console output of the parse)
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        translations = parse_tmx(file_info['file'], file_info['book'])
+
+        if translations:
+            # Save individual book file
+            with JsonArrayWriter(file_info['output']) as writer:
+                for translation in translations:
+                    writer.write(translation)
+
+            print(f"  ✓ Saved {len(translations)} segments to {file_info['output']}")
+        elif keep_previous and Path(file_info['output']).exists():
+            # Keep the book in the combined file from its previous import
+            with open(file_info['output'], 'r', encoding='utf-8') as f:
+                translations = json.load(f)
+            print(f"  ✗ No translations found in {file_info['file']}, "
+                  f"keeping {len(translations)} segments from {file_info['output']}")
+        else:
+            print(f"  ✗ No translations found in {file_info['file']}")
+
+    return translations, output.getvalue()
+
 def main():
+    parser = argparse.ArgumentParser(
+        description='Re-import all books from sentence-level TMX files'
+    )
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: one per book)')
+    parser.add_argument('--keep-previous', action='store_true',
+                        help='Use the previously imported book file for books whose TMX file '
+                             'yields nothing (default: leave them out)')
+    args = parser.parse_args()
+
     print("=" * 70)
     print("RE-IMPORTING FROM SENTENCE-LEVEL TMX FILES")
     print("=" * 70)
@@ -90,41 +140,42 @@ def main():
         }
     ]
 
-    all_translations = []
-    total_count = 0
+    combined_output = '../legal-data/netherlands/legislation/civil-procedure/NL-EN-civil-procedure-all.json'
+    book_counts = {}
+    workers = args.workers or len(files)
 
-    for file_info in files:
-        print(f"\nProcessing {file_info['file']}...")
-        translations = parse_tmx(file_info['file'], file_info['book'])
+    # Books are parsed in parallel; each book arrives whole, in book order,
+    # and is appended to the combined file
+    book_import = partial(import_book, keep_previous=args.keep_previous)
+    with JsonArrayWriter(combined_output) as combined, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        for file_info, (translations, output) in zip(files, executor.map(book_import, files)):
+            print(f"\nProcessing {file_info['file']}...")
+            print(output, end='')
 
-        if translations:
-            # Save individual book file
-            with open(file_info['output'], 'w', encoding='utf-8') as f:
-                json.dump(translations, f, ensure_ascii=False, indent=2)
+            for translation in translations:
+                combined.write(translation)
+            book_counts[file_info['book']] = len(translations)
 
-            print(f"  ✓ Saved {len(translations)} segments to {file_info['output']}")
-            all_translations.extend(translations)
-            total_count += len(translations)
-        else:
-            print(f"  ✗ No translations found in {file_info['file']}")
+        if not combined.count:
+            combined.abort()
 
     # Create combined file
-    if all_translations:
-        combined_output = '../legal-data/netherlands/legislation/civil-procedure/NL-EN-civil-procedure-all.json'
-        with open(combined_output, 'w', encoding='utf-8') as f:
-            json.dump(all_translations, f, ensure_ascii=False, indent=2)
-
+    if combined.count:
         print(f"\n{'=' * 70}")
         print(f"✓ COMPLETE - Combined file created")
-        print(f"  Total segments: {total_count}")
+        print(f"  Total segments: {combined.count}")
         print(f"  Output: {combined_output}")
         print(f"{'=' * 70}")
 
         # Show breakdown
         print("\nBreakdown by book:")
         for file_info in files:
-            count = sum(1 for t in all_translations if t['document'].endswith(file_info['book']))
-            print(f"  {file_info['book']:20s}: {count:5,} segments")
+            print(f"  {file_info['book']:20s}: {book_counts[file_info['book']]:5,} segments")
+
+        missing = [book for book, count in book_counts.items() if not count]
+        if missing:
+            print(f"\n⚠️  Not in the combined file (no translations): {', '.join(missing)}")
 
     else:
         print("\n✗ ERROR - No translations imported!")
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Batch scoring of incomplete translations.
+
+One set of heuristics for every script that flags incomplete translations
+(extract-sentences-from-civil-procedure.py, import/reimport_sentence_level.py,
+import/analyze_incomplete_translations.py). A whole corpus is scored in one
+call: the texts are turned into feature columns, the placeholder and
+mutatis mutandis patterns run as one combined regex over the concatenated
+corpus, and the rules are applied column-wise.
+
+With NumPy installed, the length, ratio and copy columns are computed as
+arrays and the rules are vectorized. The remaining text checks (letters,
+"apply" and "(" endings) are per-text string tests, which NumPy cannot
+speed up. Without NumPy the same rules run over plain lists; --check
+verifies that both paths agree.
+
+Sentences and paragraphs are scored with different rules: SENTENCE_RULES
+for sentence pairs, PARAGRAPH_RULES for the paragraphs of the TMX imports.
+The first rule of the list that applies gives the reason code (REASON_OK if
+the translation looks complete); reason_text() turns a code into the label
+written to the data files.
+
+Usage:
+    features, reasons = score_pairs(nl_texts, en_texts, SENTENCE_RULES)
+    for code, row in zip(reasons, features):
+        if code != REASON_OK:
+            print(reason_text(code, row))
+
+    python incomplete_scorer.py --check
+"""
+
+import argparse
+import json
+import re
+import sys
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Reason codes, in order of precedence (the first rule that applies wins)
+REASON_OK = 0
+REASON_EMPTY = 1
+REASON_PLACEHOLDER = 2
+REASON_COPY = 3
+REASON_TOO_SHORT = 4
+REASON_TOO_LONG = 5
+REASON_NO_ALPHA = 6
+REASON_TRUNCATED_CLAUSE = 7
+REASON_MUCH_SHORTER = 8
+REASON_OPEN_ENDING = 9
+
+REASON_LABELS = {
+    REASON_OK: '',
+    REASON_EMPTY: 'Empty translation',
+    REASON_PLACEHOLDER: 'Contains placeholder: {placeholder}',
+    REASON_COPY: 'English is copy of Dutch',
+    REASON_TOO_SHORT: 'Too short (ratio: {ratio:.2f})',
+    REASON_TOO_LONG: 'Too long (ratio: {ratio:.2f})',
+    REASON_NO_ALPHA: 'No alphabetic characters',
+    REASON_TRUNCATED_CLAUSE: 'Mutatis mutandis clause - truncated',
+    REASON_MUCH_SHORTER: 'English much shorter than Dutch',
+    REASON_OPEN_ENDING: 'Ellipsis or incomplete parenthesis',
+}
+
+# Rules in order of precedence. Sentence pairs: missing, placeholder or
+# copied text and implausible length ratios. Paragraphs: truncation
+# patterns, the last one listed in the original analysis winning.
+SENTENCE_RULES = (REASON_EMPTY, REASON_PLACEHOLDER, REASON_COPY, REASON_TOO_SHORT,
+                  REASON_TOO_LONG, REASON_NO_ALPHA)
+PARAGRAPH_RULES = (REASON_OPEN_ENDING, REASON_MUCH_SHORTER, REASON_TRUNCATED_CLAUSE)
+
+# English/Dutch length ratio limits
+MIN_RATIO = 0.3
+MAX_RATIO = 3.0
+# Stricter limit for longer Dutch text
+SHORTER_RATIO = 0.4
+SHORTER_MIN_LENGTH = 50
+# A clause cut off after "apply" leaves the English this much shorter
+TRUNCATED_RATIO = 1 / 1.5
+
+# Placeholder patterns, reported by their source text
+PLACEHOLDERS = [r'\[.*?\]', 'TODO', 'TBD', 'XXX', r'\?\?\?']
+
+# Column order of the feature matrix
+FEATURES = (
+    'nl-length',     # characters of Dutch text
+    'en-length',     # characters of English text
+    'ratio',         # en-length / nl-length (NaN without Dutch text)
+    'placeholder',   # index into PLACEHOLDERS + 1, 0 if none
+    'copy',          # English equals Dutch
+    'alphabetic',    # English contains a letter
+    'ends-apply',    # English ends in "apply" / "applicable"
+    'mutatis',       # Dutch contains a mutatis mutandis phrase
+    'open-ending',   # English ends in "..." or "("
+)
+
+_COLUMN_TYPES = (int, int, float, int, bool, bool, bool, bool, bool)
+
+# Patterns run over the lowercased corpus, joined with NUL (which never
+# occurs in the text); '.' is narrowed so no match crosses into the next
+# row. Groups would disable the regex engine's literal prefix search, so a
+# match is mapped back to its PLACEHOLDERS entry by its text.
+_SEPARATOR = '\x00'
+_PLACEHOLDER_PATTERN = re.compile(r'todo|tbd|xxx|\?\?\?|\[[^\x00\n]*?\]')
+# Matched text -> index into PLACEHOLDERS + 1; the bracket pattern is keyed by '['
+_PLACEHOLDER_INDEX = {
+    '[' if pattern.startswith(r'\[') else re.sub(r'\\(.)', r'\1', pattern).lower(): i
+    for i, pattern in enumerate(PLACEHOLDERS, 1)
+}
+# Mutatis mutandis phrases: "toepassing" preceded by one of these
+_MUTATIS_PATTERN = re.compile(r'toepassing')
+_MUTATIS_PREFIXES = ('van overeenkomstige ', 'is van ', 'zijn van ')
+_ALPHABETIC = re.compile(r'[a-zA-Z]')
+_APPLY_ENDINGS = ('apply', 'applicable')
+_ENDS_APPLY = re.compile(r'\bappl(?:y|icable)$')
+
+
+def scan_rows(pattern: re.Pattern, texts: Sequence[str]) -> Iterator[Tuple[int, re.Match]]:
+    """
+    Run a pattern once over all texts, lowercased and joined
+
+    Yields:
+        (row, match) for every match, in order; match.string is the joined text
+    """
+    lowered = [text.lower() for text in texts]
+    # Start offset of every row in the joined string
+    starts = list(accumulate((len(text) + 1 for text in lowered), initial=0))
+
+    for match in pattern.finditer(_SEPARATOR.join(lowered)):
+        yield bisect_right(starts, match.start()) - 1, match
+
+
+def placeholder_column(texts: Sequence[str]) -> List[int]:
+    """
+    Placeholder index (+1) per text, 0 if none
+
+    If several placeholders occur in a text, the one listed first in
+    PLACEHOLDERS is reported.
+    """
+    column = [0] * len(texts)
+    for row, match in scan_rows(_PLACEHOLDER_PATTERN, texts):
+        text = match.group()
+        index = _PLACEHOLDER_INDEX['[' if text[0] == '[' else text]
+        if not column[row] or index < column[row]:
+            column[row] = index
+    return column
+
+
+def mutatis_column(texts: Sequence[str]) -> List[bool]:
+    """Whether each (Dutch) text contains a mutatis mutandis phrase"""
+    column = [False] * len(texts)
+    for row, match in scan_rows(_MUTATIS_PATTERN, texts):
+        if match.string.endswith(_MUTATIS_PREFIXES, 0, match.start()):
+            column[row] = True
+    return column
+
+
+def feature_columns(nl_texts: Sequence[str], en_texts: Sequence[str]) -> List[list]:
+    """Feature columns (in FEATURES order) of stripped text pairs"""
+    nl_lengths = list(map(len, nl_texts))
+    en_lengths = list(map(len, en_texts))
+    nan = float('nan')
+    ratios = [en / nl if nl else nan for nl, en in zip(nl_lengths, en_lengths)]
+    return [
+        nl_lengths,
+        en_lengths,
+        ratios,
+        placeholder_column(en_texts),
+        [nl == en for nl, en in zip(nl_texts, en_texts)],
+        *_text_columns(nl_texts, en_texts),
+    ]
+
+
+def feature_arrays(nl_texts: Sequence[str], en_texts: Sequence[str]) -> list:
+    """Feature columns (in FEATURES order) of stripped text pairs as NumPy arrays"""
+    count = len(nl_texts)
+    nl_lengths = np.fromiter(map(len, nl_texts), dtype=np.int64, count=count)
+    en_lengths = np.fromiter(map(len, en_texts), dtype=np.int64, count=count)
+    ratios = np.divide(en_lengths, nl_lengths, out=np.full(count, np.nan),
+                       where=nl_lengths > 0)
+    copies = np.asarray(nl_texts, dtype=object) == np.asarray(en_texts, dtype=object)
+    columns = [nl_lengths, en_lengths, ratios,
+               np.asarray(placeholder_column(en_texts), dtype=np.int64),
+               np.asarray(copies, dtype=bool)]
+    columns.extend(np.asarray(column, dtype=bool)
+                   for column in _text_columns(nl_texts, en_texts))
+    return columns
+
+
+def _text_columns(nl_texts: Sequence[str], en_texts: Sequence[str]) -> List[List[bool]]:
+    """The alphabetic, ends-apply, mutatis and open-ending columns"""
+    return [
+        [_ALPHABETIC.search(en) is not None for en in en_texts],
+        [en.endswith(_APPLY_ENDINGS) and _ENDS_APPLY.search(en) is not None
+         for en in en_texts],
+        mutatis_column(nl_texts),
+        [en.endswith(('...', '(')) for en in en_texts],
+    ]
+
+
+def score_pairs(nl_texts: Sequence[str], en_texts: Sequence[str],
+                rules: Sequence[int] = SENTENCE_RULES,
+                use_numpy: Optional[bool] = None) -> Tuple[object, object]:
+    """
+    Score translation pairs for incompleteness
+
+    Args:
+        nl_texts: Dutch texts
+        en_texts: English texts (same length)
+        rules: Reason codes to check, in order of precedence
+            (SENTENCE_RULES or PARAGRAPH_RULES)
+        use_numpy: Force the NumPy (True) or plain list (False) path;
+            default: NumPy if installed
+
+    Returns:
+        (features, reasons): a row per pair with the FEATURES columns, and a
+        reason code per pair. NumPy arrays on the NumPy path, otherwise a
+        list of tuples and a list of ints.
+    """
+    nl_texts = [(text or '').strip() for text in nl_texts]
+    en_texts = [(text or '').strip() for text in en_texts]
+
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        return _reasons_numpy(feature_arrays(nl_texts, en_texts), rules)
+
+    columns = feature_columns(nl_texts, en_texts)
+    reasons = [_reason(row, rules) for row in zip(*columns)]
+    return list(zip(*columns)), reasons
+
+
+def _rules(nl_length, en_length, ratio, placeholder, copy, alphabetic, ends_apply,
+           mutatis, open_ending):
+    """Condition per reason code; works on scalars and arrays"""
+    has_ratio = nl_length > 0
+    return {
+        REASON_EMPTY: (en_length == 0) | (nl_length == 0),
+        REASON_PLACEHOLDER: placeholder > 0,
+        REASON_COPY: copy,
+        REASON_TOO_SHORT: has_ratio & (ratio < MIN_RATIO),
+        REASON_TOO_LONG: has_ratio & (ratio > MAX_RATIO),
+        REASON_NO_ALPHA: alphabetic == 0,
+        REASON_TRUNCATED_CLAUSE: ends_apply & mutatis & has_ratio & (ratio < TRUNCATED_RATIO),
+        REASON_MUCH_SHORTER: ((nl_length > SHORTER_MIN_LENGTH) & has_ratio &
+                              (ratio < SHORTER_RATIO)),
+        REASON_OPEN_ENDING: open_ending,
+    }
+
+
+def _reason(row, rules: Sequence[int]) -> int:
+    """Reason code of one feature row"""
+    conditions = _rules(*row)
+    for code in rules:
+        if conditions[code]:
+            return code
+    return REASON_OK
+
+
+def _reasons_numpy(arrays: list, rules: Sequence[int]):
+    """Feature matrix and reason codes with NumPy"""
+    conditions = _rules(*arrays)
+    reasons = np.select([conditions[code] for code in rules], list(rules),
+                        default=REASON_OK).astype(np.int8)
+    features = np.column_stack([array.astype(float) for array in arrays])
+    return features, reasons
+
+
+def reason_text(code: int, features) -> str:
+    """
+    Label of a reason code
+
+    Args:
+        code: Reason code
+        features: Feature row of the pair (for the ratio and placeholder)
+    """
+    placeholder = int(features[3])
+    return REASON_LABELS[int(code)].format(
+        ratio=float(features[2]),
+        placeholder=PLACEHOLDERS[placeholder - 1] if placeholder else '')
+
+
+# (Dutch, English, rules, expected label): one case per placeholder and rule
+CHECK_CASES = [
+    ('De rechter beslist.', '', SENTENCE_RULES, 'Empty translation'),
+    ('', 'The court decides.', SENTENCE_RULES, 'Empty translation'),
+    ('De rechter beslist.', 'The court [X] decides.', SENTENCE_RULES,
+     r'Contains placeholder: \[.*?\]'),
+    ('De rechter beslist.', 'The court TODO decides.', SENTENCE_RULES, 'Contains placeholder: TODO'),
+    ('De rechter beslist.', 'The court TBD.', SENTENCE_RULES, 'Contains placeholder: TBD'),
+    ('De rechter beslist.', 'XXX court decides', SENTENCE_RULES, 'Contains placeholder: XXX'),
+    ('De rechter beslist.', '??? the court decides', SENTENCE_RULES,
+     r'Contains placeholder: \?\?\?'),
+    ('De rechter beslist.', 'The court [TODO] decides.', SENTENCE_RULES,
+     r'Contains placeholder: \[.*?\]'),
+    ('De rechter beslist.', 'De rechter beslist.', SENTENCE_RULES, 'English is copy of Dutch'),
+    ('De rechter beslist over de zaak.', 'Court.', SENTENCE_RULES, 'Too short (ratio: 0.19)'),
+    ('Ja.', 'The court decides on the case.', SENTENCE_RULES, 'Too long (ratio: 10.00)'),
+    ('Lid 12.', '12.', SENTENCE_RULES, 'No alphabetic characters'),
+    ('De rechter beslist over de zaak.', 'The court decides the case.', SENTENCE_RULES, ''),
+    ('Artikel 111, derde lid, en artikel 112 zijn van overeenkomstige toepassing.',
+     'Articles 111(3) and 112 shall apply', PARAGRAPH_RULES, 'Mutatis mutandis clause - truncated'),
+    ('Artikel 111, derde lid, is van overeenkomstige toepassing.', 'Article 111.',
+     PARAGRAPH_RULES, 'English much shorter than Dutch'),
+    ('De rechter beslist over de zaak.', 'The court decides the case (', PARAGRAPH_RULES,
+     'Ellipsis or incomplete parenthesis'),
+    ('Artikel 111, derde lid, is van overeenkomstige toepassing.', 'Article 111(3) applies (',
+     PARAGRAPH_RULES, 'Ellipsis or incomplete parenthesis'),
+    ('Artikel 111, derde lid, is van toepassing.', 'Article 111(3) applies.', PARAGRAPH_RULES, ''),
+]
+
+
+def check(corpus: Optional[str] = None) -> bool:
+    """
+    Check the reason label of every CHECK_CASES entry and, with NumPy,
+    that the NumPy and plain list paths agree (on the cases and a corpus)
+
+    Args:
+        corpus: Optional paragraph JSON file (source, target) to compare both paths on
+
+    Returns:
+        Whether all checks passed
+    """
+    paths = [False] + ([True] if np is not None else [])
+    ok = True
+
+    for use_numpy in paths:
+        for nl, en, rules, expected in CHECK_CASES:
+            (row,), (code,) = score_pairs([nl], [en], rules, use_numpy)
+            label = reason_text(code, row)
+            if label != expected:
+                ok = False
+                print(f"✗ {'numpy' if use_numpy else 'lists'}: {en!r} -> {label!r}, "
+                      f"expected {expected!r}")
+
+    if np is None:
+        print("⚠️  NumPy not installed: only the plain list path was checked")
+    elif corpus:
+        with open(corpus, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        nl_texts = [entry.get('source') for entry in entries]
+        en_texts = [entry.get('target') for entry in entries]
+        for rules in (SENTENCE_RULES, PARAGRAPH_RULES):
+            list_features, list_reasons = score_pairs(nl_texts, en_texts, rules, False)
+            array_features, array_reasons = score_pairs(nl_texts, en_texts, rules, True)
+            if list(array_reasons) != list_reasons or not np.array_equal(
+                    np.asarray(list_features, dtype=float), array_features, equal_nan=True):
+                ok = False
+                print(f"✗ NumPy and list paths differ on {corpus}")
+        print(f"Compared both paths on {len(entries):,} pairs of {corpus}")
+
+    print("✓ All checks passed" if ok else "✗ Checks failed")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Check the incomplete-translation scorer'
+    )
+    parser.add_argument('--check', nargs='?', const='', metavar='JSON',
+                        help='Check the reason labels and, with NumPy, that both paths agree '
+                             '(optionally on a paragraph JSON file)')
+    args = parser.parse_args()
+
+    if args.check is None:
+        parser.error('nothing to do, use --check')
+    sys.exit(0 if check(args.check or None) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Streaming reader and writer for JSON array files.
+
+Items are read and written one at a time, so large files never need to be
+held in memory as a list. The writer's output is byte-identical to
+json.dump(items, f, ensure_ascii=False, indent=2), the format of every JSON
+file in this repository.
+
+Usage:
+    for entry in iter_json_array('NL-EN-legal-glossary.json'):
+        ...
+
+    with JsonArrayWriter('NL-FR-dgt.json') as writer:
+        for entry in entries:
+            writer.write(entry)
+"""
+
+import json
+import os
+from typing import Any, Iterator
+
+
+def iter_json_array(filename: str, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """
+    Stream the items of a top-level JSON array
+
+    The file is read in chunks and decoded one item at a time, so only the
+    current item (plus one chunk) is held in memory.
+
+    Args:
+        filename: Path to a JSON file containing an array
+        chunk_size: Number of characters read per chunk
+
+    Yields:
+        Array items in file order
+    """
+    decoder = json.JSONDecoder()
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        buffer = ''
+        pos = 0
+        eof = False
+
+        def next_char() -> str:
+            """Skip whitespace and return the next character ('' at end of file)"""
+            nonlocal buffer, pos, eof
+            while True:
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    eof = True
+                    return ''
+                buffer, pos = chunk, 0
+
+        if next_char() != '[':
+            raise ValueError(f"{filename}: expected a JSON array")
+        pos += 1
+        if next_char() == ']':
+            return
+
+        while True:
+            next_char()
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                    # Only accept the item once its separator is buffered:
+                    # a number at the end of a chunk may have been cut off
+                    lookahead = end
+                    while lookahead < len(buffer) and buffer[lookahead] in ' \t\r\n':
+                        lookahead += 1
+                    if eof or buffer[lookahead:lookahead + 1] in (',', ']'):
+                        break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer, pos = buffer[pos:] + chunk, 0
+
+            pos = end
+            yield item
+
+            separator = next_char()
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"{filename}: expected ',' or ']' at offset {f.tell()}")
+            pos += 1
+
+
+class JsonArrayWriter:
+    """Writes a JSON array item by item"""
+
+    def __init__(self, path: str):
+        """
+        Open the output file
+
+        The array is written to a temporary file that replaces `path` on
+        close(), so readers never see a half-written file.
+        """
+        self.path = path
+        self.count = 0
+        self._tmp_path = path + '.tmp'
+        self._file = open(self._tmp_path, 'w', encoding='utf-8')
+        self._file.write('[')
+
+    def write(self, item: Any):
+        """Append one item"""
+        text = json.dumps(item, ensure_ascii=False, indent=2)
+        self._file.write(',\n  ' if self.count else '\n  ')
+        self._file.write(text.replace('\n', '\n  '))
+        self.count += 1
+
+    def close(self):
+        """Finish the array and move the file into place"""
+        if self._file.closed:
+            return
+        self._file.write('\n]' if self.count else ']')
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """Discard the output"""
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self) -> 'JsonArrayWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
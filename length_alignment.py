@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Length-based sentence/paragraph alignment (Gale & Church, 1993).
+
+Two sequences of segments are aligned with dynamic programming over
+"beads": 1:1, 1:2, 2:1, 1:0 and 0:1. The cost of a bead combines its prior
+probability with how well the character lengths of both sides agree,
+assuming target length ~ c * source length with variance proportional to
+the length. A single split or merged paragraph then only affects its own
+bead instead of shifting every later pair.
+
+The search is restricted to a band around the diagonal, so the cost is
+O(n * band) instead of O(n * m). If the best path leaves the band, the
+band is widened and the search repeated.
+
+Each bead carries a score in (0, 1] (exp(-cost)): high for a likely 1:1
+pair of matching lengths, low for unusual beads or length mismatches.
+Sorting by score gives a review queue of the most doubtful alignments.
+
+align_texts() adds punctuation cues for short segments such as sentences:
+digits, colons/semicolons, brackets and question/exclamation marks are
+usually carried over by a translation, so each bead also pays for the
+difference in these counts between its two sides.
+
+merge_unpaired() folds 1:0 and 0:1 beads into their neighbour, for output
+that must pair every segment with text on both sides.
+
+Usage:
+    beads = align_by_length([len(s) for s in nl], [len(s) for s in en])
+    for bead in beads:
+        print(bead.kind, bead.score, [nl[i] for i in bead.source], [en[j] for j in bead.target])
+
+    beads = align_texts(nl_sentences, en_sentences)
+    pairs = merge_unpaired(beads)
+"""
+
+import math
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+# Prior probabilities of each bead (source count, target count)
+BEAD_PRIORS = {
+    (1, 1): 0.89,
+    (1, 2): 0.0445,
+    (2, 1): 0.0445,
+    (1, 0): 0.0099,
+    (0, 1): 0.0099,
+}
+BEAD_COSTS = {bead: -math.log(prior) for bead, prior in BEAD_PRIORS.items()}
+
+# Variance of target length per source character (Gale & Church)
+VARIANCE = 6.8
+
+DEFAULT_BAND = 20
+
+# Character classes counted as punctuation cues, and the cost per unit of
+# difference between both sides of a bead
+CUE_CLASSES = ('0123456789', ':;', '()[]', '?!')
+CUE_WEIGHT = 0.5
+
+
+class Bead(NamedTuple):
+    """One aligned group: source and target segment indices and its score"""
+    source: Tuple[int, ...]
+    target: Tuple[int, ...]
+    score: float
+
+    @property
+    def kind(self) -> str:
+        """Bead type such as '1:1' or '2:1'"""
+        return f"{len(self.source)}:{len(self.target)}"
+
+
+def length_cost(source_length: int, target_length: int, ratio: float) -> float:
+    """-log probability that segments of these lengths are translations"""
+    if source_length == 0 and target_length == 0:
+        return 0.0
+    mean = (source_length + target_length / ratio) / 2
+    z = abs(ratio * source_length - target_length) / math.sqrt(VARIANCE * mean)
+    # Two-sided tail probability of the standard normal distribution
+    return -math.log(max(math.erfc(z / math.sqrt(2)), 1e-300))
+
+
+def cue_counts(text: str) -> Tuple[int, ...]:
+    """Number of characters of each CUE_CLASSES class in a text"""
+    return tuple(sum(text.count(char) for char in chars) for chars in CUE_CLASSES)
+
+
+def cue_cost(source_cues: Sequence[int], target_cues: Sequence[int]) -> float:
+    """Cost of the difference in punctuation cue counts between both sides of a bead"""
+    return CUE_WEIGHT * sum(abs(s - t) for s, t in zip(source_cues, target_cues))
+
+
+def align_texts(source: Sequence[str], target: Sequence[str], band: int = DEFAULT_BAND,
+                ratio: Optional[float] = None) -> List[Bead]:
+    """
+    Align two sequences of texts by length and punctuation cues
+
+    Args:
+        source: Source segments
+        target: Target segments
+        band: Half-width of the search band around the diagonal
+        ratio: Expected target/source length ratio (default: ratio of the totals)
+
+    Returns:
+        Beads in document order, covering every segment exactly once
+    """
+    # One segment on each side: a 1:0 + 0:1 split would only hide a length mismatch
+    if len(source) == 1 and len(target) == 1:
+        cost = BEAD_COSTS[(1, 1)] + cue_cost(cue_counts(source[0]), cue_counts(target[0]))
+        if ratio is not None:
+            cost += length_cost(len(source[0]), len(target[0]), ratio)
+        return [Bead((0,), (0,), math.exp(-cost))]
+
+    return align_by_length([len(text) for text in source], [len(text) for text in target],
+                           band, ratio,
+                           source_cues=[cue_counts(text) for text in source],
+                           target_cues=[cue_counts(text) for text in target])
+
+
+def align_by_length(source_lengths: Sequence[int], target_lengths: Sequence[int],
+                    band: int = DEFAULT_BAND, ratio: Optional[float] = None,
+                    source_cues: Optional[Sequence[Tuple[int, ...]]] = None,
+                    target_cues: Optional[Sequence[Tuple[int, ...]]] = None) -> List[Bead]:
+    """
+    Align two sequences of segments by their lengths
+
+    Args:
+        source_lengths: Character length of each source segment
+        target_lengths: Character length of each target segment
+        band: Half-width of the search band around the diagonal
+        ratio: Expected target/source length ratio (default: ratio of the totals)
+        source_cues: Optional punctuation cue counts per source segment (see cue_counts)
+        target_cues: Optional punctuation cue counts per target segment
+
+    Returns:
+        Beads in document order, covering every segment exactly once
+    """
+    n, m = len(source_lengths), len(target_lengths)
+    if ratio is None:
+        ratio = (sum(target_lengths) / sum(source_lengths)
+                 if sum(source_lengths) and sum(target_lengths) else 1.0)
+
+    band = max(band, abs(n - m) + 2)
+    while True:
+        beads = _banded_search(source_lengths, target_lengths, band, ratio,
+                               source_cues, target_cues)
+        if beads is not None:
+            return beads
+        band *= 2
+
+
+def merge_unpaired(beads: Sequence[Bead]) -> List[Bead]:
+    """
+    Merge 1:0 and 0:1 beads into the preceding bead (the following one at the start)
+
+    A merged bead keeps the lowest score of its parts, so it stays in the
+    review queue. If no bead has segments on both sides, the beads are
+    returned unchanged.
+
+    Args:
+        beads: Beads in document order
+
+    Returns:
+        Beads in document order, each with segments on both sides
+    """
+    merged = []
+    leading = []  # unpaired beads before the first paired one
+    for bead in beads:
+        if bead.source and bead.target:
+            for previous in reversed(leading):
+                bead = Bead(previous.source + bead.source, previous.target + bead.target,
+                            min(previous.score, bead.score))
+            leading = []
+            merged.append(bead)
+        elif merged:
+            previous = merged[-1]
+            merged[-1] = Bead(previous.source + bead.source, previous.target + bead.target,
+                              min(previous.score, bead.score))
+        else:
+            leading.append(bead)
+
+    return merged if merged else list(beads)
+
+
+def _prefix_sums(values: Sequence) -> List:
+    """Running totals of numbers or of equal-length tuples, starting at zero"""
+    if values and isinstance(values[0], tuple):
+        sums = [(0,) * len(values[0])]
+        for value in values:
+            sums.append(tuple(a + b for a, b in zip(sums[-1], value)))
+    else:
+        sums = [0]
+        for value in values:
+            sums.append(sums[-1] + value)
+    return sums
+
+
+def _banded_search(source_lengths: Sequence[int], target_lengths: Sequence[int],
+                   band: int, ratio: float,
+                   source_cues: Optional[Sequence[Tuple[int, ...]]] = None,
+                   target_cues: Optional[Sequence[Tuple[int, ...]]] = None) -> Optional[List[Bead]]:
+    """DP inside the band; None if the band cuts off the path"""
+    n, m = len(source_lengths), len(target_lengths)
+    slope = m / n if n else 0.0
+    infinity = float('inf')
+    beads_costs = list(BEAD_COSTS.items())
+
+    # Prefix sums, so the length of any group of segments is one subtraction
+    source_sums = _prefix_sums(source_lengths)
+    target_sums = _prefix_sums(target_lengths)
+    use_cues = bool(source_cues) and bool(target_cues)
+    if use_cues:
+        source_cue_sums = _prefix_sums(source_cues)
+        target_cue_sums = _prefix_sums(target_cues)
+
+    # Row i covers target positions lows[i]..highs[i]
+    lows = []
+    highs = []
+    for i in range(n + 1):
+        center = round(i * slope)
+        lows.append(max(0, center - band))
+        highs.append(min(m, center + band))
+
+    cost = []  # cost[i][j - lows[i]]
+    back = []
+
+    for i in range(n + 1):
+        low, high = lows[i], highs[i]
+        row_cost = [infinity] * (high - low + 1)
+        row_back = [None] * (high - low + 1)
+        cost.append(row_cost)
+        back.append(row_back)
+
+        for j in range(low, high + 1):
+            if i == 0 and j == 0:
+                row_cost[0] = 0.0
+                continue
+
+            best = infinity
+            best_bead = None
+            for (di, dj), prior_cost in beads_costs:
+                pi, pj = i - di, j - dj
+                if pi < 0 or pj < 0:
+                    continue
+                k = pj - lows[pi]
+                if k < 0 or pj > highs[pi]:
+                    continue
+                previous = cost[pi][k]
+                if previous == infinity:
+                    continue
+
+                total = previous + prior_cost + length_cost(
+                    source_sums[i] - source_sums[pi], target_sums[j] - target_sums[pj], ratio)
+                if use_cues and di and dj:
+                    total += cue_cost(
+                        [s1 - s0 for s0, s1 in zip(source_cue_sums[pi], source_cue_sums[i])],
+                        [t1 - t0 for t0, t1 in zip(target_cue_sums[pj], target_cue_sums[j])])
+                if total < best:
+                    best = total
+                    best_bead = (di, dj)
+
+            row_cost[j - low] = best
+            row_back[j - low] = best_bead
+
+    if not lows[n] <= m <= highs[n] or cost[n][m - lows[n]] == infinity:
+        return None
+
+    # Backtrack from (n, m)
+    beads = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        # A path running along the band edge may have been forced there
+        if (j == lows[i] or j == highs[i]) and 0 < j < m and band < max(n, m):
+            return None
+
+        di, dj = back[i][j - lows[i]]
+        pi, pj = i - di, j - dj
+        bead_cost = cost[i][j - lows[i]] - cost[pi][pj - lows[pi]]
+        beads.append(Bead(tuple(range(pi, i)), tuple(range(pj, j)),
+                          math.exp(-bead_cost)))
+        i, j = pi, pj
+
+    beads.reverse()
+    return beads
@@ -1,73 +1,307 @@
 #!/usr/bin/env python3
 """
 Merge all dictionary sources into unified structure
+
+Sources are declared in the SOURCES registry (path, source-type label and
+field mapping) and are read with a streaming JSON parser, one entry at a
+time, so peak memory is bounded by the merged output.
+
+Rebuilds are incremental: a merge state file stores a content hash per
+source file and per source entry, so a re-run only recomputes the terms
+touched by changed entries and patches them into the existing output.
+
+A SQLite database (unified-dictionary.db, see dictionary_db.py) with
+indexed terms, translations and examples and an FTS5 search index is
+written alongside the JSON output, and build statistics with per-stage
+wall time and item counts go to build-metrics.json.
+
+Linked example sentences are written once to unified-examples.json; terms
+list the IDs of their examples. Term and example IDs are derived from the
+normalized term and example content (see term_ids.py), so they stay the
+same across rebuilds. Each build that changes the output also writes a
+versioned patch against the previous artifact (see dictionary_patches.py),
+so clients can update without downloading the whole dictionary.
+
+With --dedupe, duplicate translations from the Civil Procedure Glossary
+and Legal Glossary are merged per term while the translations are merged
+(the rules of deduplicate_dictionary.py), instead of rewriting the whole
+output afterwards; --report writes the duplicate clusters to a file.
+
+With --shards the dictionary is also written as shards (by normalized
+first letter or by hash bucket) plus a manifest, so the website can fetch
+only the shards a query needs instead of the whole file.
+
+Usage:
+    python merge-dictionaries.py          # incremental rebuild
+    python merge-dictionaries.py --full   # ignore the merge state
+    python merge-dictionaries.py --workers 8   # parallel example matching
+    python merge-dictionaries.py --shards letter
+    python merge-dictionaries.py --shards hash --buckets 32
+    python merge-dictionaries.py --no-sqlite   # skip the SQLite database
+    python merge-dictionaries.py --no-patches  # skip delta publishing
+    python merge-dictionaries.py --dedupe --report duplicates.json
 """
 
+import argparse
+import hashlib
 import json
-from collections import defaultdict
-from typing import Dict, List, Any
-import re
+import os
+import zlib
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+from build_metrics import METRICS_FILE, BuildMetrics
+from deduplicate_dictionary import deduplicate_translations as merge_duplicate_translations
+from deduplicate_dictionary import exact_report, write_report
+from dictionary_db import DB_FILE, build_database
+from dictionary_patches import PATCH_DIR, example_sort_key, publish, term_sort_key
+from json_stream import iter_json_array
+from normalization import NORMALIZATION_VERSION, normalize_key
+from term_ids import ID_SCHEME_VERSION, ID_TABLE_FILE, IdTable, example_id
+from term_matcher import TermMatcher
+
+OUTPUT_FILE = 'unified-dictionary.json'
+EXAMPLES_OUTPUT_FILE = 'unified-examples.json'
+STATE_FILE = '.merge-state.json'
+EXAMPLES_FILE = 'NL-EN-example-sentences.json'
+SHARD_DIR = 'unified-dictionary'
+MANIFEST_FILE = 'manifest.json'
+
+# Bump when the layout of the merge state changes
+STATE_VERSION = 3
+
+# Field mapping of the standard source entry format (see CONTRIBUTING.md):
+# unified field -> source entry key
+DEFAULT_FIELDS = {
+    'term': 'source',
+    'term-lang': 'lang-source',
+    'translation': 'target',
+    'lang': 'lang-target',
+    'definition': 'lang-target-dict',
+    'source': 'author',
+    'license': 'license',
+    'sme-reviewed': 'sme-reviewed',
+}
+
+# Translation sources in merge order. Adding a source only needs an entry
+# here; 'fields' overrides individual keys of DEFAULT_FIELDS.
+SOURCES = [
+    {
+        'path': 'Glossary-of-Dutch-Procedural-Terminology.json',
+        'source-type': 'Civil Procedure Glossary',
+        'fields': {},
+    },
+    {
+        'path': 'NL-EN-legal-dictionary.json',
+        'source-type': 'Legal Dictionary',  # has definitions!
+        'fields': {},
+    },
+    {
+        'path': 'NL-EN-legal-glossary.json',
+        'source-type': 'Legal Glossary',
+        'fields': {},
+    },
+]
 
 def normalize_term(term: str) -> str:
-    """Normalize term for matching (lowercase, strip whitespace)"""
-    return term.lower().strip()
-
-def extract_terms_from_sentence(sentence: str) -> List[str]:
-    """Extract potential legal terms from a sentence"""
-    # Remove common words and extract multi-word legal terms
-    # This is a simple heuristic - can be improved with NLP
-    words = sentence.split()
-
-    # Extract single words and 2-3 word phrases that might be terms
-    terms = []
-
-    # Single words (longer than 4 chars, likely legal terms)
-    for word in words:
-        cleaned = re.sub(r'[^\w\s]', '', word.lower())
-        if len(cleaned) > 4:
-            terms.append(cleaned)
-
-    # 2-word phrases
-    for i in range(len(words) - 1):
-        phrase = f"{words[i]} {words[i+1]}"
-        cleaned = re.sub(r'[^\w\s]', '', phrase.lower())
-        if len(cleaned) > 8:
-            terms.append(cleaned)
-
-    # 3-word phrases
-    for i in range(len(words) - 2):
-        phrase = f"{words[i]} {words[i+1]} {words[i+2]}"
-        cleaned = re.sub(r'[^\w\s]', '', phrase.lower())
-        if len(cleaned) > 12:
-            terms.append(cleaned)
-
-    return list(set(terms))
-
-def load_json(filename: str) -> List[Dict]:
-    """Load JSON file"""
+    """Normalize term for matching (see normalization.py)"""
+    return normalize_key(term)
+
+def source_fields(source: Dict) -> Dict[str, str]:
+    """Resolve the field mapping of a registered source"""
+    return {**DEFAULT_FIELDS, **source.get('fields', {})}
+
+def hash_file(filename: str, chunk_size: int = 1 << 20) -> Optional[str]:
+    """Content hash of a file, read in chunks (None if missing)"""
+    digest = hashlib.sha256()
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filename, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
     except FileNotFoundError:
         print(f"Warning: {filename} not found, skipping...")
-        return []
+        return None
+    return digest.hexdigest()
+
+def hash_entry(entry: Dict) -> str:
+    """Content hash of a source entry, independent of key order"""
+    canonical = json.dumps(entry, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+def load_state(state_file: str, output_file: str, examples_file: str,
+               dedupe: bool = False) -> Optional[Dict]:
+    """
+    Load the merge state of the previous build
+
+    Returns None (forcing a full rebuild) if there is no state, if the
+    state layout, the normalization rules, the ID scheme or the dedupe
+    setting changed, or if the output or examples file was modified by
+    another script since the state was written.
+    """
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if state.get('version') != STATE_VERSION:
+        return None
+
+    if state.get('normalization') != NORMALIZATION_VERSION:
+        return None
+
+    if state.get('id-scheme') != ID_SCHEME_VERSION:
+        return None
+
+    if state.get('dedupe', False) != dedupe:
+        return None
+
+    if not os.path.exists(output_file) or hash_file(output_file) != state.get('output'):
+        return None
+
+    if not os.path.exists(examples_file) or hash_file(examples_file) != state.get('examples-output'):
+        return None
+
+    return state
+
+def save_state(state_file: str, state: Dict):
+    """Save the merge state for the next build"""
+    with open(state_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+
+def shard_key(term: str, scheme: str, buckets: int) -> str:
+    """
+    Shard key of a term
+
+    'letter': first letter of the term with diacritics removed ('a'-'z'),
+    '0' for terms starting with a digit and '_' for anything else.
+    Leading punctuation such as "(Algemene)" is skipped.
+
+    'hash': CRC-32 of the UTF-8 normalized term modulo the bucket count,
+    as a zero-padded number.
+    """
+    if scheme == 'hash':
+        bucket = zlib.crc32(normalize_key(term).encode('utf-8')) % buckets
+        return str(bucket).zfill(len(str(buckets - 1)))
+
+    for char in normalize_key(term, diacritics=True):
+        if not char.isalnum():
+            continue
+        if 'a' <= char <= 'z':
+            return char
+        if char.isdigit():
+            return '0'
+        break
+    return '_'
+
+def write_shards(unified_list: List[Dict], examples: List[Dict], shard_dir: str, scheme: str,
+                 buckets: int) -> Dict:
+    """
+    Write the dictionary as shards plus a manifest
+
+    Each shard of terms comes with a file of the examples its terms refer
+    to ("a.json", "a.examples.json"), so a shard is usable on its own. The
+    manifest maps each shard key to its filenames, content hashes and term
+    and example counts. Files whose content did not change are not
+    rewritten, and shards that no longer exist are removed.
+
+    Returns:
+        The manifest
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+    manifest_path = os.path.join(shard_dir, MANIFEST_FILE)
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            old_manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        old_manifest = {'shards': {}}
 
-def create_translation(entry: Dict, source_type: str) -> Dict:
+    shards = defaultdict(list)
+    for term_data in unified_list:
+        shards[shard_key(term_data['term'], scheme, buckets)].append(term_data)
+    examples_by_id = {example['id']: example for example in examples}
+
+    manifest = {
+        'scheme': scheme,
+        'buckets': buckets if scheme == 'hash' else None,
+        'terms': len(unified_list),
+        'shards': {},
+    }
+    written = 0
+
+    for key in sorted(shards):
+        old_entry = old_manifest['shards'].get(key, {})
+        example_ids = dict.fromkeys(ex_id for term_data in shards[key]
+                                    for ex_id in term_data['examples'])
+        shard_examples = sorted((examples_by_id[ex_id] for ex_id in example_ids),
+                                key=example_sort_key)
+
+        entry = {
+            'file': f"{key}.json",
+            'terms': len(shards[key]),
+            'examples-file': f"{key}.examples.json",
+            'examples': len(shard_examples),
+        }
+        for file_field, hash_field, content in [('file', 'hash', shards[key]),
+                                                ('examples-file', 'examples-hash', shard_examples)]:
+            data = json.dumps(content, ensure_ascii=False, indent=2).encode('utf-8')
+            entry[hash_field] = hashlib.sha256(data).hexdigest()
+            path = os.path.join(shard_dir, entry[file_field])
+            if old_entry.get(hash_field) != entry[hash_field] or not os.path.exists(path):
+                with open(path, 'wb') as f:
+                    f.write(data)
+                written += 1
+
+        manifest['shards'][key] = entry
+
+    # Remove shards left over from a previous build or scheme
+    for key, entry in old_manifest['shards'].items():
+        if key not in manifest['shards']:
+            for filename in (entry['file'], entry.get('examples-file')):
+                if filename and os.path.exists(os.path.join(shard_dir, filename)):
+                    os.remove(os.path.join(shard_dir, filename))
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    print(f"  ✓ Wrote {written} of {2 * len(shards)} shard files to {shard_dir}/ ({scheme})")
+    return manifest
+
+def deduplicate_translations(translations: List[Dict]) -> List[Dict]:
+    """Remove duplicate translations (same translation from same source)"""
+    unique_translations = []
+    seen = set()
+
+    for trans in translations:
+        key = (trans['translation'], trans['source'], trans['source-type'])
+        if key not in seen:
+            seen.add(key)
+            unique_translations.append(trans)
+
+    return unique_translations
+
+def create_translation(entry: Dict, source: Dict) -> Dict:
     """Create a translation object from source entry"""
+    fields = source_fields(source)
+
     # Handle boolean conversion for sme-reviewed
-    sme_reviewed = entry.get('sme-reviewed')
+    sme_reviewed = entry.get(fields['sme-reviewed'])
     if isinstance(sme_reviewed, str):
         sme_reviewed = sme_reviewed.lower() in ['yes', 'true', '1']
     elif sme_reviewed is None:
         sme_reviewed = False
 
+    translation = entry.get(fields['translation'], '')
+
     return {
-        'translation': entry.get('target', ''),
-        'lang': entry.get('lang-target', 'en-gb'),
-        'definition': entry.get('lang-target-dict'),  # Will be None if not present
-        'source': entry.get('author', 'Unknown'),
-        'source-type': source_type,
-        'license': entry.get('license', 'Unknown'),
+        'translation': translation,
+        'normalized': normalize_key(translation),
+        'lang': entry.get(fields['lang'], 'en-gb'),
+        'definition': entry.get(fields['definition']),  # Will be None if not present
+        'source': entry.get(fields['source'], 'Unknown'),
+        'source-type': source['source-type'],
+        'license': entry.get(fields['license'], 'Unknown'),
         'sme-reviewed': bool(sme_reviewed),
         'context': None  # Can be added later
     }
@@ -96,220 +330,458 @@ def create_example(entry: Dict, example_id: str) -> Dict:
         'context': None
     }
 
-def merge_dictionaries():
-    """Main merge function"""
-    print("🔄 Starting dictionary merge process...")
-
-    # Load all source files
-    print("\n📂 Loading source files...")
-    glossary = load_json('Glossary-of-Dutch-Procedural-Terminology.json')
-    print(f"  ✓ Loaded {len(glossary)} entries from Glossary-of-Dutch-Procedural-Terminology.json")
+def link_examples(unified: Dict[str, Dict], examples_data: List[Dict], workers: int = 1,
+                  metrics: Optional[BuildMetrics] = None) -> List[Dict]:
+    """
+    Link example sentences to every term they contain (replaces existing links)
+
+    Matching is sharded across `workers` processes; example IDs are assigned
+    afterwards in a single ordered pass, so they match a serial run. Terms
+    get the IDs of their examples; identical examples get a numbered suffix.
+
+    Returns:
+        Example objects of all linked examples, sorted by ID
+    """
+    # Build the term matcher once over every merged term, in ID order;
+    # terms and sentences are matched on their normalized keys
+    matcher = TermMatcher()
+    matcher.add_terms(
+        (norm_term, norm_term)
+        for norm_term, term_data in sorted(unified.items(), key=lambda item: item[1]['id'])
+    )
+    matcher.build()
+    print(f"  ✓ Indexed {matcher.term_count} terms for matching")
 
-    dictionary = load_json('NL-EN-legal-dictionary.json')
-    print(f"  ✓ Loaded {len(dictionary)} entries from NL-EN-legal-dictionary.json")
-
-    legal_glossary = load_json('NL-EN-legal-glossary.json')
-    print(f"  ✓ Loaded {len(legal_glossary)} entries from NL-EN-legal-glossary.json")
-
-    examples_data = load_json('NL-EN-example-sentences.json')
-    print(f"  ✓ Loaded {len(examples_data)} entries from NL-EN-example-sentences.json")
-
-    # Dictionary to store merged data
-    # Key: normalized term, Value: term data
-    unified = {}
-    term_to_id = {}
-    id_counter = 1
-
-    print("\n🔨 Merging translations...")
-
-    # Process Civil Procedure Glossary
-    print("  Processing Civil Procedure Glossary...")
-    for entry in glossary:
-        term = entry.get('source', '').strip()
-        if not term:
-            continue
-
-        norm_term = normalize_term(term)
-
-        if norm_term not in unified:
-            term_id = f"term_{str(id_counter).zfill(5)}"
-            term_to_id[norm_term] = term_id
-            id_counter += 1
-
-            unified[norm_term] = {
-                'id': term_id,
-                'term': term,  # Keep original case
-                'lang': entry.get('lang-source', 'nl-nl'),
-                'translations': [],
-                'examples': [],
-                'metadata': {}
-            }
-
-        translation = create_translation(entry, 'Civil Procedure Glossary')
-        unified[norm_term]['translations'].append(translation)
-
-    # Process Legal Dictionary (has definitions!)
-    print("  Processing Legal Dictionary...")
-    for entry in dictionary:
-        term = entry.get('source', '').strip()
-        if not term:
-            continue
-
-        norm_term = normalize_term(term)
-
-        if norm_term not in unified:
-            term_id = f"term_{str(id_counter).zfill(5)}"
-            term_to_id[norm_term] = term_id
-            id_counter += 1
-
-            unified[norm_term] = {
-                'id': term_id,
-                'term': term,
-                'lang': entry.get('lang-source', 'nl-nl'),
-                'translations': [],
-                'examples': [],
-                'metadata': {}
-            }
-
-        translation = create_translation(entry, 'Legal Dictionary')
-        unified[norm_term]['translations'].append(translation)
-
-    # Process Legal Glossary
-    print("  Processing Legal Glossary...")
-    for entry in legal_glossary:
-        term = entry.get('source', '').strip()
-        if not term:
-            continue
-
-        norm_term = normalize_term(term)
-
-        if norm_term not in unified:
-            term_id = f"term_{str(id_counter).zfill(5)}"
-            term_to_id[norm_term] = term_id
-            id_counter += 1
-
-            unified[norm_term] = {
-                'id': term_id,
-                'term': term,
-                'lang': entry.get('lang-source', 'nl-nl'),
-                'translations': [],
-                'examples': [],
-                'metadata': {}
-            }
+    for term_data in unified.values():
+        term_data['examples'] = []
 
-        translation = create_translation(entry, 'Legal Glossary')
-        unified[norm_term]['translations'].append(translation)
+    example_entries = [entry for entry in examples_data if entry.get('source', '').strip()]
+    sentences = [normalize_key(entry['source']) for entry in example_entries]
 
-    print(f"\n  ✓ Created {len(unified)} unique terms")
+    # Link each example to every longest non-overlapping term it contains
+    if workers > 1:
+        print(f"  Matching {len(sentences)} examples with {workers} workers...")
+    all_matches = matcher.find_all_many(sentences, workers=workers)
 
-    # Process Examples
-    print("\n📝 Processing example sentences...")
-    example_counter = defaultdict(int)
-    examples_matched = 0
+    example_ids = Counter()
+    examples = []
     examples_unmatched = 0
+    example_links = 0
 
-    for example_entry in examples_data:
-        nl_sentence = example_entry.get('source', '').strip()
-        if not nl_sentence:
+    for example_entry, nl_normalized, matched_terms in zip(example_entries, sentences, all_matches):
+        if not matched_terms:
+            examples_unmatched += 1
             continue
 
-        # Extract potential terms from the sentence
-        potential_terms = extract_terms_from_sentence(nl_sentence)
-
-        # Try to match to existing terms
-        matched = False
-        for potential_term in potential_terms:
-            norm_potential = normalize_term(potential_term)
+        ex_id = example_id(nl_normalized, example_entry.get('author', 'Unknown'))
+        example_ids[ex_id] += 1
+        if example_ids[ex_id] > 1:
+            ex_id = f"{ex_id}_{example_ids[ex_id]}"
+        examples.append(create_example(example_entry, ex_id))
 
-            if norm_potential in unified:
-                # Match found!
-                term_id = unified[norm_potential]['id']
-                example_counter[term_id] += 1
-                example_id = f"ex_{term_id.split('_')[1]}_{str(example_counter[term_id]).zfill(3)}"
+        for norm_term in dict.fromkeys(matched_terms):
+            unified[norm_term]['examples'].append(ex_id)
+            example_links += 1
 
-                example_obj = create_example(example_entry, example_id)
-                unified[norm_potential]['examples'].append(example_obj)
+    examples_matched = len(examples)
 
-                matched = True
-                examples_matched += 1
-                break  # Only match to first found term
+    if metrics is not None:
+        metrics.count('examples-matched', examples_matched)
+        metrics.count('examples-unmatched', examples_unmatched)
 
-        if not matched:
-            examples_unmatched += 1
-
-    print(f"  ✓ Matched {examples_matched} examples to terms")
+    print(f"  ✓ Matched {examples_matched} examples to terms ({example_links} links)")
     print(f"  ⚠ {examples_unmatched} examples could not be matched to terms")
 
-    # Remove duplicates within translations (same translation from same source)
-    print("\n🧹 Cleaning duplicates...")
-    for term_data in unified.values():
-        translations = term_data['translations']
-        unique_translations = []
-        seen = set()
+    examples.sort(key=example_sort_key)
+    return examples
 
-        for trans in translations:
-            # Create a key for deduplication
-            key = (trans['translation'], trans['source'], trans['source-type'])
-            if key not in seen:
-                seen.add(key)
-                unique_translations.append(trans)
+def collect_statistics(metrics: BuildMetrics, unified_list: List[Dict], examples: List[Dict]):
+    """Gather all dictionary statistics in a single pass over the output"""
+    for term_data in unified_list:
+        translations = term_data['translations']
 
-        term_data['translations'] = unique_translations
+        metrics.count('terms')
+        metrics.count('translations', len(translations))
+        metrics.count('example-links', len(term_data['examples']))
+        if term_data['examples']:
+            metrics.count('terms-with-examples')
 
-    # Convert to list and sort by term
-    unified_list = list(unified.values())
-    unified_list.sort(key=lambda x: x['term'].lower())
-
-    # Calculate statistics
+        has_definition = False
+        for trans in translations:
+            metrics.tally('license', trans['license'])
+            metrics.tally('source-type', trans['source-type'])
+            if trans.get('definition'):
+                has_definition = True
+        if has_definition:
+            metrics.count('terms-with-definitions')
+
+    metrics.count('examples', len(examples))
+    for example in examples:
+        metrics.count('premium-examples' if example['premium'] else 'free-examples')
+
+def print_statistics(metrics: BuildMetrics):
+    """Print the statistics gathered by collect_statistics()"""
+    counters = metrics.counters
     print("\n📊 Statistics:")
-    total_translations = sum(len(t['translations']) for t in unified_list)
-    total_examples = sum(len(t['examples']) for t in unified_list)
-    terms_with_examples = sum(1 for t in unified_list if len(t['examples']) > 0)
-    terms_with_definitions = sum(1 for t in unified_list
-                                 if any(tr.get('definition') for tr in t['translations']))
-
-    print(f"  Total unique terms: {len(unified_list)}")
-    print(f"  Total translations: {total_translations}")
-    print(f"  Avg translations per term: {total_translations / len(unified_list):.1f}")
-    print(f"  Total examples: {total_examples}")
-    print(f"  Terms with examples: {terms_with_examples}")
-    print(f"  Terms with definitions: {terms_with_definitions}")
-
-    # License breakdown
-    licenses = defaultdict(int)
-    for term_data in unified_list:
-        for trans in term_data['translations']:
-            licenses[trans['license']] += 1
+    print(f"  Total unique terms: {counters['terms']}")
+    print(f"  Total translations: {counters['translations']}")
+    print(f"  Avg translations per term: {counters['translations'] / max(counters['terms'], 1):.1f}")
+    print(f"  Total examples: {counters['examples']} ({counters['example-links']} term links)")
+    print(f"  Terms with examples: {counters['terms-with-examples']}")
+    print(f"  Terms with definitions: {counters['terms-with-definitions']}")
 
     print(f"\n  License breakdown:")
-    for license, count in sorted(licenses.items()):
+    for license, count in sorted(metrics.breakdowns['license'].items()):
         print(f"    {license}: {count}")
 
-    # Premium vs Free examples
-    premium_examples = sum(1 for t in unified_list for ex in t['examples'] if ex['premium'])
-    free_examples = total_examples - premium_examples
     print(f"\n  Examples breakdown:")
-    print(f"    Free: {free_examples}")
-    print(f"    Premium: {premium_examples}")
+    print(f"    Free: {counters['free-examples']}")
+    print(f"    Premium: {counters['premium-examples']}")
+
+def merge_dictionaries(full: bool = False, state_file: str = STATE_FILE, workers: int = 1,
+                       shards: Optional[str] = None, buckets: int = 16, shard_dir: str = SHARD_DIR,
+                       db_file: Optional[str] = DB_FILE, metrics_file: str = METRICS_FILE,
+                       id_table_file: str = ID_TABLE_FILE, patch_dir: Optional[str] = PATCH_DIR,
+                       dedupe: bool = False, report_file: Optional[str] = None):
+    """Main merge function"""
+    print("🔄 Starting dictionary merge process...")
+    metrics = BuildMetrics('merge-dictionaries')
+
+    output_file = OUTPUT_FILE
+    examples_file = EXAMPLES_OUTPUT_FILE
+    state = None if full else load_state(state_file, output_file, examples_file, dedupe)
+    incremental = state is not None
+    if not incremental:
+        state = {'sources': {}, 'examples': None}
+    print(f"  Mode: {'incremental' if incremental else 'full rebuild'}")
+    metrics.tally('mode', 'incremental' if incremental else 'full')
+
+    # Hash all source files; only changed ones are parsed
+    print("\n📂 Checking source files...")
+    old_sources = state['sources']
+    new_sources = {}
+    changed = []
+
+    with metrics.stage('check-sources') as stage:
+        for source in SOURCES:
+            path = source['path']
+            fields = source_fields(source)
+            term_field, term_lang_field = fields['term'], fields['term-lang']
+            digest = hash_file(path)
+
+            if path in old_sources and old_sources[path]['hash'] == digest:
+                new_sources[path] = old_sources[path]
+                print(f"  = {path} unchanged")
+                continue
+
+            # First pass: hash each entry and record the term it belongs to,
+            # with its display form and language
+            entries = []
+            if digest is not None:
+                for entry in iter_json_array(path):
+                    term = entry.get(term_field, '').strip()
+                    if term:
+                        entries.append([hash_entry(entry), normalize_term(term),
+                                        term, entry.get(term_lang_field, 'nl-nl')])
+
+            new_sources[path] = {'hash': digest, 'entries': entries}
+            changed.append(source)
+            metrics.count('changed-sources')
+            metrics.count('source-entries', len(entries))
+            print(f"  ✓ Indexed {len(entries)} entries from {path}")
+
+        examples_hash = hash_file(EXAMPLES_FILE)
+        examples_changed = examples_hash != state['examples']
+        stage.items = len(SOURCES) + 1
+
+    if incremental and not changed and not examples_changed:
+        if shards:
+            print(f"\n💾 Updating shards in {shard_dir}/...")
+            with metrics.stage('write-shards'):
+                write_shards(list(iter_json_array(output_file)),
+                             list(iter_json_array(examples_file)), shard_dir, shards, buckets)
+        if db_file and not os.path.exists(db_file):
+            print(f"\n💾 Building {db_file}...")
+            with metrics.stage('write-sqlite') as stage:
+                stage.items = build_database(iter_json_array(output_file), db_file,
+                                             iter_json_array(examples_file))
+        metrics.save(metrics_file)
+        print("\n✅ Everything up to date, nothing to merge!")
+        return None
+
+    with metrics.stage('read-changed-sources') as stage:
+        # Terms touched by added, removed or reordered entries, in order of
+        # first appearance
+        touched = {}
+        for source in changed:
+            old_entries = old_sources.get(source['path'], {}).get('entries', [])
+            new_entries = new_sources[source['path']]['entries']
+            old_hashes = defaultdict(list)
+            new_hashes = defaultdict(list)
+            for entry_hash, norm_term, _, _ in old_entries:
+                old_hashes[norm_term].append(entry_hash)
+            for entry_hash, norm_term, _, _ in new_entries:
+                new_hashes[norm_term].append(entry_hash)
+
+            for _, norm_term, _, _ in new_entries + old_entries:
+                if new_hashes[norm_term] != old_hashes[norm_term]:
+                    touched[norm_term] = None
+
+        # Display form and language of touched terms come from their first
+        # entry across all sources, as in a full build
+        first_seen = {}  # normalized term -> (original term, language)
+        for source in SOURCES:
+            for _, norm_term, term, lang in new_sources[source['path']]['entries']:
+                if norm_term in touched and norm_term not in first_seen:
+                    first_seen[norm_term] = (term, lang)
+
+        # Second pass: build translations of touched terms from changed sources.
+        # Merged duplicates no longer show which source they came from, so
+        # with dedupe touched terms are rebuilt from every source.
+        changed_translations = {}  # path -> {normalized term: [translations]}
+
+        for source in (SOURCES if dedupe else changed):
+            path = source['path']
+            fields = source_fields(source)
+            by_term = defaultdict(list)
+
+            if new_sources[path]['hash'] is not None:
+                print(f"  Processing {source['source-type']}...")
+                for entry in iter_json_array(path):
+                    term = entry.get(fields['term'], '').strip()
+                    norm_term = normalize_term(term)
+                    if not term or norm_term not in touched:
+                        continue
+
+                    by_term[norm_term].append(create_translation(entry, source))
+
+            changed_translations[path] = by_term
+
+        metrics.count('touched-terms', len(touched))
+        stage.items = len(touched)
 
-    # Save to file
-    output_file = 'unified-dictionary.json'
-    print(f"\n💾 Saving to {output_file}...")
+    # Dictionary to store merged data
+    # Key: normalized term, Value: term data
+    unified = {}
+    ids = IdTable(id_table_file)
+    terms_added_or_removed = False
+    report = []
+
+    print(f"\n🔨 Merging translations for {len(touched)} touched terms...")
+
+    with metrics.stage('merge-translations') as stage:
+        if incremental:
+            unified = {t['normalized']: t for t in iter_json_array(output_file)}
+            for norm_term, term_data in unified.items():
+                ids.reserve(norm_term, term_data['id'])
+
+        for norm_term in touched:
+            old_term = unified.get(norm_term)
+            translations = []
+
+            # Rebuild translations in source order: fresh ones from changed
+            # sources, existing ones from unchanged sources
+            for source in SOURCES:
+                if source['path'] in changed_translations:
+                    translations.extend(changed_translations[source['path']].get(norm_term, []))
+                elif old_term is not None:
+                    translations.extend(t for t in old_term['translations']
+                                        if t['source-type'] == source['source-type'])
+
+            if not translations:
+                if unified.pop(norm_term, None) is not None:
+                    terms_added_or_removed = True
+                    metrics.count('terms-removed')
+                continue
+
+            if old_term is None:
+                term_id = ids.term_id(norm_term)
+                terms_added_or_removed = True
+                metrics.count('terms-added')
+
+                unified[norm_term] = {
+                    'id': term_id,
+                    'term': None,
+                    'normalized': norm_term,
+                    'lang': None,
+                    'translations': [],
+                    'examples': [],
+                    'metadata': {}
+                }
+
+            term, lang = first_seen[norm_term]
+            unified[norm_term]['term'] = term  # Keep original case
+            unified[norm_term]['lang'] = lang
+
+            # Remove duplicates within translations (same translation from same source)
+            translations = deduplicate_translations(translations)
+
+            if dedupe:
+                clusters = []
+                deduplicated = merge_duplicate_translations(translations, clusters)
+                metrics.count('duplicates-merged', len(translations) - len(deduplicated))
+                metrics.count('duplicate-clusters', len(clusters))
+                report.extend(exact_report(unified[norm_term], clusters))
+                translations = deduplicated
+
+            unified[norm_term]['translations'] = translations
+
+        stage.items = len(touched)
+
+    ids.save()
+    metrics.count('id-collisions', ids.collisions)
+    print(f"  ✓ {len(unified)} unique terms")
+    if dedupe:
+        print(f"  ✓ Merged {metrics.counters['duplicates-merged']} duplicate translations "
+              f"in {metrics.counters['duplicate-clusters']} clusters")
+    if report_file:
+        write_report(report_file, report)
+        print(f"  ✓ Wrote duplicate clusters to {report_file}")
+    if ids.collisions:
+        print(f"  ⚠ {ids.collisions} term ID collisions, recorded in {id_table_file}")
+
+    # Example links depend on the example file and on the set of terms
+    if examples_changed or terms_added_or_removed:
+        print("\n📝 Processing example sentences...")
+        with metrics.stage('link-examples') as stage:
+            examples_data = list(iter_json_array(EXAMPLES_FILE)) if examples_hash is not None else []
+            print(f"  ✓ Loaded {len(examples_data)} entries from {EXAMPLES_FILE}")
+            examples = link_examples(unified, examples_data, workers=workers, metrics=metrics)
+            stage.items = len(examples_data)
+    else:
+        print("\n📝 Example sentences unchanged, keeping existing links")
+        examples = list(iter_json_array(examples_file))
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(unified_list, f, ensure_ascii=False, indent=2)
+    # Convert to list and sort by term
+    unified_list = list(unified.values())
+    unified_list.sort(key=term_sort_key)
+
+    with metrics.stage('statistics') as stage:
+        collect_statistics(metrics, unified_list, examples)
+        stage.items = len(unified_list)
+    print_statistics(metrics)
 
-    # Calculate file size
-    import os
+    # Save to file
+    print(f"\n💾 Saving to {output_file} and {examples_file}...")
+
+    with metrics.stage('write-json') as stage:
+        # Previous artifacts, kept for the patches against this build
+        old_hash = hash_file(output_file) if os.path.exists(output_file) else None
+        old_terms = list(iter_json_array(output_file)) if patch_dir and old_hash else None
+        old_examples_hash = hash_file(examples_file) if os.path.exists(examples_file) else None
+        old_examples = (list(iter_json_array(examples_file))
+                        if patch_dir and old_examples_hash else None)
+
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(unified_list, f, ensure_ascii=False, indent=2)
+        with open(examples_file, 'w', encoding='utf-8') as f:
+            json.dump(examples, f, ensure_ascii=False, indent=2)
+        new_hash = hash_file(output_file)
+        new_examples_hash = hash_file(examples_file)
+
+        # Record hashes so the next run only merges what changed
+        save_state(state_file, {
+            'version': STATE_VERSION,
+            'sources': new_sources,
+            'examples': examples_hash,
+            'normalization': NORMALIZATION_VERSION,
+            'id-scheme': ID_SCHEME_VERSION,
+            'dedupe': dedupe,
+            'output': new_hash,
+            'examples-output': new_examples_hash,
+        })
+        stage.items = len(unified_list)
+
+    if patch_dir:
+        # Terms and examples are versioned separately; examples patches go
+        # to a subdirectory (see dictionary_patches.py)
+        artifacts = [
+            (old_terms, old_hash, unified_list, new_hash, output_file, patch_dir),
+            (old_examples, old_examples_hash, examples, new_examples_hash, examples_file,
+             os.path.join(patch_dir, 'examples')),
+        ]
+        with metrics.stage('write-patch') as stage:
+            patches = [(artifact[-1], publish(*artifact)) for artifact in artifacts]
+            stage.items = 0
+            for _, patch in patches:
+                if patch:
+                    stage.items += patch['added'] + patch['removed'] + patch['changed']
+                    metrics.count('patch-bytes', patch['bytes'])
+        for directory, patch in patches:
+            if patch:
+                print(f"  ✓ Wrote patch {directory}/{patch['file']} "
+                      f"(+{patch['added']} -{patch['removed']} ~{patch['changed']}, "
+                      f"{patch['bytes'] / 1024:.1f} KB)")
+
+    # Calculate file sizes
     file_size = os.path.getsize(output_file)
-    file_size_mb = file_size / (1024 * 1024)
+    examples_size = os.path.getsize(examples_file)
+    metrics.count('output-bytes', file_size)
+    metrics.count('examples-output-bytes', examples_size)
 
     print(f"  ✓ Saved {len(unified_list)} terms to {output_file}")
-    print(f"  File size: {file_size_mb:.2f} MB")
+    print(f"  ✓ Saved {len(examples)} examples to {examples_file}")
+    print(f"  File size: {file_size / (1024 * 1024):.2f} MB "
+          f"+ {examples_size / (1024 * 1024):.2f} MB examples")
+
+    if shards:
+        with metrics.stage('write-shards') as stage:
+            stage.items = len(write_shards(unified_list, examples, shard_dir, shards,
+                                           buckets)['shards'])
+
+    if db_file:
+        with metrics.stage('write-sqlite') as stage:
+            stage.items = build_database(unified_list, db_file, examples)
+        print(f"  ✓ Built {db_file} ({os.path.getsize(db_file) / (1024 * 1024):.2f} MB)")
+
+    metrics.save(metrics_file)
+    print(f"  ✓ Wrote build metrics to {metrics_file}")
 
     print("\n✅ Merge complete!")
 
     return unified_list
 
+def bucket_count(value: str) -> int:
+    """Parse --buckets: a whole number of at least 1"""
+    try:
+        buckets = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid bucket count: {value}")
+    if buckets < 1:
+        raise argparse.ArgumentTypeError(f"bucket count must be at least 1: {value}")
+    return buckets
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Merge all dictionary sources into unified-dictionary.json'
+    )
+    parser.add_argument('--full', action='store_true',
+                       help='Ignore the merge state and rebuild everything')
+    parser.add_argument('--state', default=STATE_FILE,
+                       help=f'Merge state file (default: {STATE_FILE})')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Processes for example matching (default: 1, serial)')
+    parser.add_argument('--shards', choices=['letter', 'hash'],
+                       help='Also write the dictionary as shards with a manifest')
+    parser.add_argument('--buckets', type=bucket_count, default=16,
+                       help='Number of hash buckets for --shards hash (default: 16)')
+    parser.add_argument('--shard-dir', default=SHARD_DIR,
+                       help=f'Output directory for shards (default: {SHARD_DIR})')
+    parser.add_argument('--no-sqlite', action='store_true',
+                       help=f'Do not build the SQLite database ({DB_FILE})')
+    parser.add_argument('--dedupe', action='store_true',
+                       help='Merge duplicate glossary translations during the merge')
+    parser.add_argument('--report',
+                       help='Write duplicate clusters of merged terms to this JSON file (implies --dedupe)')
+    parser.add_argument('--no-patches', action='store_true',
+                       help=f'Do not write a patch against the previous build ({PATCH_DIR}/)')
+
+    args = parser.parse_args()
+    merge_dictionaries(full=args.full, state_file=args.state, workers=args.workers,
+                       shards=args.shards, buckets=args.buckets, shard_dir=args.shard_dir,
+                       db_file=None if args.no_sqlite else DB_FILE,
+                       patch_dir=None if args.no_patches else PATCH_DIR,
+                       dedupe=args.dedupe or bool(args.report), report_file=args.report)
+
 if __name__ == '__main__':
-    merge_dictionaries()
+    main()
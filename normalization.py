@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Shared text normalization for matching terms, translations and sentences.
+
+Every script that compares dictionary text should build its keys here, so
+that "ne bis in idem", "Ne bis in idem " and "ne bis in idem" with a
+no-break space all map to the same key. The merge stores these keys on
+terms and translations at build time ('normalized'), so consumers can
+compare against them without normalizing again; example sentences are
+normalized at load time. translation-dictionary.html mirrors
+normalize_key() in JavaScript for search queries.
+
+Steps:
+    1. Typographic quotes -> ASCII quotes, dashes and minus -> hyphen,
+       NBSP -> space, invisible characters removed
+    2. Unicode NFKC (compatibility forms, ligatures, full-width forms)
+    3. Whitespace runs collapsed to a single space, ends stripped
+    4. Case folding (keys only)
+    5. Diacritic folding (keys only, optional)
+"""
+
+import re
+import unicodedata
+
+# Bump when the normalization changes, so stored keys get rebuilt
+NORMALIZATION_VERSION = 1
+
+_CHARACTER_MAP = str.maketrans({
+    '\u2018': "'",  # left single quote
+    '\u2019': "'",  # right single quote / apostrophe
+    '\u201a': "'",  # single low-9 quote
+    '\u201b': "'",  # single high-reversed-9 quote
+    '\u2032': "'",  # prime
+    '\u00b4': "'",  # acute accent used as apostrophe
+    '`': "'",  # grave accent used as apostrophe
+    '\u201c': '"',  # left double quote
+    '\u201d': '"',  # right double quote
+    '\u201e': '"',  # double low-9 quote
+    '\u201f': '"',  # double high-reversed-9 quote
+    '\u2033': '"',  # double prime
+    '\u00ab': '"',  # left guillemet
+    '\u00bb': '"',  # right guillemet
+    '\u2010': '-',  # hyphen
+    '\u2011': '-',  # non-breaking hyphen
+    '\u2012': '-',  # figure dash
+    '\u2013': '-',  # en dash
+    '\u2014': '-',  # em dash
+    '\u2015': '-',  # horizontal bar
+    '\u2212': '-',  # minus sign
+    '\u00a0': ' ',  # no-break space
+    '\u00ad': None,  # soft hyphen
+    '\u200b': None,  # zero-width space
+    '\ufeff': None,  # byte order mark
+})
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def clean_text(text: str) -> str:
+    """
+    Normalize the form of a text without changing its case
+
+    Use this for display-preserving comparisons (e.g. prefix matching of
+    paragraphs); use normalize_key() for lookups.
+    """
+    if not text:
+        return ''
+    text = text.translate(_CHARACTER_MAP)
+    text = unicodedata.normalize('NFKC', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def fold_diacritics(text: str) -> str:
+    """Remove diacritics ("één" -> "een", "procédure" -> "procedure")"""
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return unicodedata.normalize('NFC', stripped)
+
+
+def normalize_key(text: str, diacritics: bool = False) -> str:
+    """
+    Build the lookup key of a term, translation or sentence
+
+    Args:
+        text: Text to normalize
+        diacritics: Also fold diacritics (off by default, since accents
+            can distinguish Dutch and French terms)
+
+    Returns:
+        Normalized key
+    """
+    key = clean_text(text).casefold()
+    if diacritics:
+        key = fold_diacritics(key)
+    return key
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Multi-word term extraction with C-value / NC-value (Frantzi et al., 2000).
+
+The corpus is read once into an n-gram index per language: every word
+sequence of 1..max_length words that stays within one clause (no
+punctuation or numbers in between) and neither starts nor ends with a
+stopword is counted, both as total frequency and as number of segments it
+occurs in. Candidates of any length are then ranked from the index:
+
+    C-value(a) = log2(|a| + 1) * f(a)                          if a is not nested
+                 log2(|a| + 1) * (f(a) - t(a) / c(a))          otherwise
+
+where t(a) is the frequency of a inside longer candidates and c(a) the
+number of those candidates (the nested-term containment). log2(|a| + 1)
+replaces the original log2|a| so single words are not scored zero, and a
+candidate that occurs fewer than min_frequency times outside longer
+candidates ("hoger" outside "hoger beroep") is dropped.
+
+NC-value re-ranks the best candidates with their context words:
+
+    NC-value(a) = 0.8 * C-value(a) + 0.2 * sum(f_a(w) * weight(w))
+
+where f_a(w) is how often w occurs next to a and weight(w) the share of
+the top candidates that w occurs next to.
+
+Each term gets an English suggestion: the target n-gram with the highest
+Dice coefficient over the segments both occur in.
+
+Usage:
+    terms = extract_terms(entries, limit=500, exclude=existing_terms)
+
+    python term_extraction.py legal-data/netherlands/legislation/civil-procedure/NL-EN-civil-procedure-all.json --limit 50
+"""
+
+import argparse
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from json_stream import iter_json_array
+
+Gram = Tuple[str, ...]
+
+# Words (letters, optionally hyphenated) and everything that ends a clause
+TOKEN_PATTERN = re.compile(r"(?P<word>[^\W\d_]+(?:-[^\W\d_]+)*)|\S")
+
+MAX_LENGTH = 6
+MIN_FREQUENCY = 2
+# Shortest single-word candidate, in characters
+MIN_WORD_LENGTH = 4
+# Candidates re-ranked by NC-value, per requested term
+POOL_FACTOR = 4
+# Top candidates whose context words give the context weights
+CONTEXT_TERMS = 200
+C_WEIGHT = 0.8
+CONTEXT_WEIGHT = 0.2
+
+STOPWORDS = {
+    'nl': frozenset('''
+        aan al alle alsmede als andere anders betreffende bij binnen dan dat de deze
+        dezelfde die dit door een eerste elk elke en enig enige er gedaan geen geldt
+        haar had hadden hebben heeft hem hen het hier hij hun ieder iedere in indien
+        ingevolge is kan krachtens kunnen leden lid mag met moet moeten mogen na naar
+        niet noch nog of om omtrent onder ons ook op over sedert sinds te tegen ten ter
+        tenzij tot tweede tussen uit van vanaf voor voordat waar waarbij waarin waarop
+        waarvan wanneer wat welke werd werden wie wel worden wordt zal ze zich zij zijn
+        zo zoals zonder zou zullen daarbij daarin daarop daartoe daarvan hierin hiervan
+        bedoeld bedoelde genoemd genoemde artikel artikelen onderdeel derde
+    '''.split()),
+    'en': frozenset('''
+        a all an and any are as at be been being but by can could each either for
+        from had has have he her his if in into is it its may must no nor not of on
+        or other shall she should such than that the their them then there these
+        they this those to under unless upon was were when where which who whom
+        whose will with within without would referred article articles paragraph
+        paragraphs section first second third
+    '''.split()),
+}
+
+
+def clauses(text: str) -> List[Tuple[str, ...]]:
+    """Lowercase word runs of a text, split at punctuation and numbers"""
+    runs = []
+    words = []
+    for match in TOKEN_PATTERN.finditer(text.lower()):
+        word = match.group('word')
+        if word:
+            words.append(word)
+        elif words:
+            runs.append(tuple(words))
+            words = []
+    if words:
+        runs.append(tuple(words))
+    return runs
+
+
+class NgramIndex:
+    """Candidate n-gram counts of one language over a segmented corpus"""
+
+    def __init__(self, lang: str, max_length: int = MAX_LENGTH,
+                 stopwords: Optional[FrozenSet[str]] = None):
+        """
+        Initialize an empty index
+
+        Args:
+            lang: Language code ('nl', 'en-gb', ...); selects the stopwords
+            max_length: Longest candidate, in words
+            stopwords: Words a candidate may not start or end with
+        """
+        self.lang = lang
+        self.max_length = max_length
+        self.stopwords = (frozenset(stopwords) if stopwords is not None
+                          else STOPWORDS.get(lang.lower().split('-')[0], frozenset()))
+        self.counts: Counter = Counter()
+        self.document_counts: Counter = Counter()
+        # Word runs of every segment, for the context and co-occurrence passes
+        self.segments: List[List[Tuple[str, ...]]] = []
+
+    def grams(self, run: Sequence[str]) -> Iterator[Tuple[int, Gram]]:
+        """(start, gram) of every candidate n-gram in a word run"""
+        stopwords = self.stopwords
+        for start, first in enumerate(run):
+            if first in stopwords or len(first) < 2:
+                continue
+            for end in range(start + 1, min(start + self.max_length, len(run)) + 1):
+                last = run[end - 1]
+                if last in stopwords or len(last) < 2:
+                    continue
+                if end - start == 1 and len(first) < MIN_WORD_LENGTH:
+                    continue
+                yield start, run[start:end]
+
+    def add(self, text: str) -> int:
+        """
+        Count the candidates of one segment
+
+        Returns:
+            Segment ID (position in the index)
+        """
+        runs = clauses(text or '')
+        seen = set()
+        for run in runs:
+            for _, gram in self.grams(run):
+                self.counts[gram] += 1
+                seen.add(gram)
+        self.document_counts.update(seen)
+        self.segments.append(runs)
+        return len(self.segments) - 1
+
+    def containment(self, candidates: Dict[Gram, int]) -> Dict[Gram, Tuple[int, int]]:
+        """
+        Nested-term containment of the candidates
+
+        Longer candidates are processed first; each passes the frequency it
+        does not already owe to a longer candidate on to its sub-grams, so
+        no occurrence is counted twice.
+
+        Returns:
+            gram -> (t, c): frequency inside longer candidates and number of
+            those candidates (only for nested candidates)
+        """
+        nested: Dict[Gram, List[int]] = {}
+        for gram in sorted(candidates, key=len, reverse=True):
+            t, _ = nested.get(gram, (0, 0))
+            independent = candidates[gram] - t
+            if independent <= 0:
+                continue
+            for length in range(1, len(gram)):
+                for start in range(len(gram) - length + 1):
+                    sub = gram[start:start + length]
+                    if sub in candidates:
+                        entry = nested.setdefault(sub, [0, 0])
+                        entry[0] += independent
+                        entry[1] += 1
+        return {gram: (t, c) for gram, (t, c) in nested.items()}
+
+    def occurrences(self, grams: Set[Gram]) -> Tuple[Dict[Gram, Counter], Dict[Gram, Set[int]]]:
+        """
+        Context words and segments of the given grams
+
+        Returns:
+            (contexts, segments): gram -> Counter of the non-stopwords right
+            before and after it, and gram -> IDs of the segments it occurs in
+        """
+        contexts: Dict[Gram, Counter] = defaultdict(Counter)
+        segments: Dict[Gram, Set[int]] = defaultdict(set)
+        for segment_id, runs in enumerate(self.segments):
+            for run in runs:
+                for start, gram in self.grams(run):
+                    if gram not in grams:
+                        continue
+                    segments[gram].add(segment_id)
+                    end = start + len(gram)
+                    for position in (start - 1, end):
+                        if 0 <= position < len(run) and run[position] not in self.stopwords:
+                            contexts[gram][run[position]] += 1
+        return contexts, segments
+
+
+def c_values(index: NgramIndex, min_frequency: int = MIN_FREQUENCY) -> Dict[Gram, float]:
+    """C-value of every candidate occurring at least `min_frequency` times"""
+    candidates = {gram: count for gram, count in index.counts.items() if count >= min_frequency}
+    nested = index.containment(candidates)
+
+    scores = {}
+    for gram, frequency in candidates.items():
+        t, c = nested.get(gram, (0, 0))
+        if frequency - t < min_frequency:
+            continue
+        score = math.log2(len(gram) + 1) * (frequency - t / c if c else frequency)
+        if score > 0:
+            scores[gram] = score
+    return scores
+
+
+def nc_values(scores: Dict[Gram, float], contexts: Dict[Gram, Counter],
+              context_terms: int = CONTEXT_TERMS) -> Dict[Gram, float]:
+    """
+    NC-value of the candidates in `contexts`
+
+    Args:
+        scores: C-values
+        contexts: Context word counts per candidate (see NgramIndex.occurrences)
+        context_terms: Number of top candidates (by C-value) that weigh context words
+    """
+    top = sorted(contexts, key=scores.get, reverse=True)[:context_terms]
+    weights = Counter()
+    for gram in top:
+        weights.update(contexts[gram].keys())
+    total = len(top) or 1
+
+    return {
+        gram: C_WEIGHT * scores[gram] + CONTEXT_WEIGHT * sum(
+            count * weights[word] / total for word, count in words.items())
+        for gram, words in contexts.items()
+    }
+
+
+def suggest_translations(source_segments: Dict[Gram, Set[int]], target: NgramIndex,
+                         min_frequency: int = MIN_FREQUENCY) -> Dict[Gram, Tuple[Gram, float]]:
+    """
+    Best target n-gram per source term by Dice coefficient over segments
+
+    Args:
+        source_segments: Source term -> IDs of the segments it occurs in
+        target: Index of the target side (same segment IDs)
+        min_frequency: Minimum segment count of a target n-gram
+
+    Returns:
+        Source term -> (target gram, Dice coefficient)
+    """
+    suggestions = {}
+    for gram, segment_ids in source_segments.items():
+        cooccurrences = Counter()
+        for segment_id in segment_ids:
+            cooccurrences.update({candidate for run in target.segments[segment_id]
+                                  for _, candidate in target.grams(run)})
+
+        best = None
+        for candidate, both in cooccurrences.items():
+            frequency = target.document_counts[candidate]
+            if frequency < min_frequency:
+                continue
+            dice = 2 * both / (len(segment_ids) + frequency)
+            key = (dice, len(candidate), both)
+            if best is None or key > best[0]:
+                best = (key, candidate)
+        if best is not None:
+            suggestions[gram] = (best[1], best[0][0])
+    return suggestions
+
+
+def build_indexes(entries: Iterable[Dict], source_lang: str = 'nl', target_lang: str = 'en',
+                  max_length: int = MAX_LENGTH) -> Tuple[NgramIndex, NgramIndex]:
+    """
+    Index the source and target texts of corpus entries in one pass
+
+    Entries may be paragraphs (source, target) or sentences (nl, en).
+    """
+    source = NgramIndex(source_lang, max_length)
+    target = NgramIndex(target_lang, max_length)
+    for entry in entries:
+        if 'nl' in entry or 'en' in entry:
+            source.add(entry.get('nl'))
+            target.add(entry.get('en'))
+        else:
+            source.add(entry.get('source'))
+            target.add(entry.get('target'))
+    return source, target
+
+
+def extract_terms(entries: Iterable[Dict], limit: int = 500, exclude: Iterable[str] = (),
+                  min_frequency: int = MIN_FREQUENCY, max_length: int = MAX_LENGTH) -> List[Dict]:
+    """
+    Rank the terminology candidates of a parallel corpus
+
+    Args:
+        entries: Corpus entries (read once)
+        limit: Number of terms to return
+        exclude: Terms to leave out (e.g. already in the glossary), any case
+        min_frequency: Minimum frequency of a candidate
+        max_length: Longest candidate, in words
+
+    Returns:
+        Terms by descending NC-value, each with 'term', 'frequency',
+        'c-value', 'nc-value', 'translation' and 'dice'
+    """
+    source, target = build_indexes(entries, max_length=max_length)
+    excluded = {term.lower().strip() for term in exclude}
+
+    scores = {gram: score for gram, score in c_values(source, min_frequency).items()
+              if ' '.join(gram) not in excluded}
+    pool = set(sorted(scores, key=scores.get, reverse=True)[:limit * POOL_FACTOR])
+    contexts, segments = source.occurrences(pool)
+    for gram in pool:
+        contexts.setdefault(gram, Counter())
+
+    ranked = nc_values(scores, contexts)
+    top = sorted(ranked, key=lambda gram: (-ranked[gram], -source.counts[gram], gram))[:limit]
+    suggestions = suggest_translations({gram: segments[gram] for gram in top}, target,
+                                       min_frequency)
+
+    terms = []
+    for gram in top:
+        translation, dice = suggestions.get(gram, ((), 0.0))
+        terms.append({
+            'term': ' '.join(gram),
+            'frequency': source.counts[gram],
+            'c-value': round(scores[gram], 3),
+            'nc-value': round(ranked[gram], 3),
+            'translation': ' '.join(translation),
+            'dice': round(dice, 3),
+        })
+    return terms
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Rank multi-word term candidates of a parallel corpus by C-value/NC-value'
+    )
+    parser.add_argument('corpus', help='Corpus JSON (paragraph or sentence level)')
+    parser.add_argument('--limit', type=int, default=50, help='Number of terms to show (default: 50)')
+    parser.add_argument('--min-frequency', type=int, default=MIN_FREQUENCY,
+                        help=f'Minimum candidate frequency (default: {MIN_FREQUENCY})')
+    args = parser.parse_args()
+
+    terms = extract_terms(iter_json_array(args.corpus), args.limit, min_frequency=args.min_frequency)
+    for i, term in enumerate(terms, 1):
+        print(f"{i:4}. [{term['frequency']}x, NC {term['nc-value']:.1f}] "
+              f"{term['term']} → {term['translation']} (dice {term['dice']:.2f})")
+
+
+if __name__ == '__main__':
+    main()
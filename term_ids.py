@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Stable content-derived IDs for dictionary terms and examples.
+
+A term ID is a hash of the normalized term, and an example ID is a hash of
+the normalized example sentence and its source, so the same term or
+example gets the same ID in every build no matter which entries were added
+or removed around it. Examples are stored once (unified-examples.json) and
+terms refer to them by ID.
+
+Hash collisions between different terms are resolved with a suffix
+("term_1a2b3c4d5e_2"). Every term involved in a collision is pinned in a
+small table (term-ids.json) that is kept under version control, so which
+term gets which suffix does not depend on build order.
+
+Usage:
+    ids = IdTable()
+    ids.reserve(existing['normalized'], existing['id'])
+    term_id = ids.term_id(normalize_key('aanhangig'))
+    ids.save()
+"""
+
+import hashlib
+import json
+from typing import Dict, Optional
+
+ID_TABLE_FILE = 'term-ids.json'
+
+# Bump when the ID derivation changes, so stored IDs get rebuilt. Version 1
+# is the sequential scheme (term_00001, ...) of builds before this module;
+# their build state has no 'id-scheme' entry and is rebuilt as well.
+# Version 2 derived example IDs from the term they were linked to.
+ID_SCHEME_VERSION = 3
+
+HASH_LENGTH = 10
+
+
+def content_hash(*parts: str, length: int = HASH_LENGTH) -> str:
+    """Short hex hash of one or more text parts"""
+    digest = hashlib.sha256('\x1f'.join(parts).encode('utf-8'))
+    return digest.hexdigest()[:length]
+
+
+def example_id(nl_normalized: str, source: str) -> str:
+    """
+    ID of an example sentence
+
+    Identical sentences from the same source get the same ID; callers add a
+    suffix to tell such duplicates apart.
+    """
+    return f"ex_{content_hash(nl_normalized, source)}"
+
+
+class IdTable:
+    """Assigns term IDs and records how hash collisions were resolved"""
+
+    def __init__(self, path: Optional[str] = ID_TABLE_FILE):
+        """
+        Load the collision table
+
+        Args:
+            path: Table file (None for an in-memory table)
+        """
+        self.path = path
+        self.pinned: Dict[str, str] = {}  # normalized term -> ID
+        self.collisions = 0
+        self._owners: Dict[str, str] = {}  # ID -> normalized term
+        self._changed = False
+
+        if path:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.pinned = json.load(f)
+            except FileNotFoundError:
+                pass
+
+        for norm_term, term_id in self.pinned.items():
+            self._owners[term_id] = norm_term
+
+    def reserve(self, norm_term: str, term_id: str):
+        """Register a term that already has an ID (e.g. from a previous build)"""
+        self._owners.setdefault(term_id, norm_term)
+
+    def term_id(self, norm_term: str) -> str:
+        """
+        ID of a normalized term
+
+        Args:
+            norm_term: Normalized term (see normalization.normalize_key)
+
+        Returns:
+            "term_" plus a hash of the term, with a suffix if another term
+            already owns that hash
+        """
+        if norm_term in self.pinned:
+            return self.pinned[norm_term]
+
+        base = f"term_{content_hash(norm_term)}"
+        owner = self._owners.get(base)
+        if owner is None or owner == norm_term:
+            self._owners[base] = norm_term
+            return base
+
+        # Collision: pin the current owner and give this term the next suffix
+        if owner not in self.pinned:
+            self.pinned[owner] = base
+        suffix = 2
+        while f"{base}_{suffix}" in self._owners:
+            suffix += 1
+        term_id = f"{base}_{suffix}"
+
+        self.pinned[norm_term] = term_id
+        self._owners[term_id] = norm_term
+        self.collisions += 1
+        self._changed = True
+        return term_id
+
+    def save(self):
+        """Write the collision table if it changed"""
+        if not self.path or not self._changed:
+            return
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(self.pinned.items())), f, ensure_ascii=False, indent=2)
+        self._changed = False
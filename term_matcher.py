@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Aho-Corasick term matcher for linking sentences to dictionary terms.
+
+The automaton is built once from all glossary terms (of any length) and
+works on word tokens, so matches always fall on word boundaries. Each
+sentence is scanned in a single linear pass and every longest
+non-overlapping term occurrence is returned.
+
+Large corpora can be scanned across a process pool with find_all_many();
+results come back in input order, so callers can assign IDs exactly as a
+serial scan would.
+
+Usage:
+    matcher = TermMatcher()
+    matcher.add_term('voorlopige voorziening', 'voorlopige voorziening')
+    matcher.build()
+    matcher.find_all('De voorlopige voorziening wordt gevraagd.')
+    matcher.find_all_many(sentences, workers=8)
+"""
+
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+WORD_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens, dropping punctuation"""
+    return WORD_PATTERN.findall(text.lower())
+
+
+class TermMatcher:
+    """Word-level Aho-Corasick automaton over dictionary terms"""
+
+    def __init__(self, min_length: int = 5):
+        """
+        Initialize an empty matcher
+
+        Args:
+            min_length: Minimum character length of a term (tokens joined
+                by spaces) for it to be matched. Shorter terms are ignored.
+        """
+        self.min_length = min_length
+        # Node 0 is the root. Each node has a goto table, a failure link,
+        # the pattern it terminates (token count + value) and a link to the
+        # nearest terminal node on its failure chain.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, Any]] = [None]
+        self._dict_link: List[int] = [0]
+        self._built = False
+        self.term_count = 0
+
+    def add_term(self, term: str, value: Any) -> bool:
+        """
+        Add a term to the automaton
+
+        Args:
+            term: Term text (tokenized the same way as sentences)
+            value: Value returned when the term is matched
+
+        Returns:
+            True if the term was added, False if it was skipped
+        """
+        if self._built:
+            raise RuntimeError("Cannot add terms after build()")
+
+        tokens = tokenize(term)
+        if not tokens or len(' '.join(tokens)) < self.min_length:
+            return False
+
+        node = 0
+        for token in tokens:
+            next_node = self._goto[node].get(token)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][token] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._dict_link.append(0)
+            node = next_node
+
+        # First term wins when several terms tokenize identically
+        if self._output[node] is not None:
+            return False
+
+        self._output[node] = (len(tokens), value)
+        self.term_count += 1
+        return True
+
+    def add_terms(self, terms: Iterable[Tuple[str, Any]]) -> int:
+        """Add (term, value) pairs, returning the number added"""
+        return sum(1 for term, value in terms if self.add_term(term, value))
+
+    def build(self) -> 'TermMatcher':
+        """Compute failure and dictionary links (breadth-first)"""
+        queue = deque()
+
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            self._dict_link[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                queue.append(child)
+
+                fail = self._fail[node]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(token, 0)
+
+                self._fail[child] = fail
+                self._dict_link[child] = fail if self._output[fail] is not None else self._dict_link[fail]
+
+        self._built = True
+        return self
+
+    def iter_matches(self, tokens: List[str]) -> Iterable[Tuple[int, int, Any]]:
+        """
+        Yield every (start, end, value) term occurrence in a token list
+
+        Overlapping and nested occurrences are all reported.
+        """
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        dict_link = self._dict_link
+
+        node = 0
+        for position, token in enumerate(tokens):
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+
+            match_node = node if output[node] is not None else dict_link[node]
+            while match_node:
+                length, value = output[match_node]
+                yield position + 1 - length, position + 1, value
+                match_node = dict_link[match_node]
+
+    def find_all(self, text: str) -> List[Any]:
+        """
+        Find every longest non-overlapping term in a text
+
+        Overlaps are resolved leftmost-longest: among occurrences starting
+        at the same token the longest wins, and an occurrence is dropped if
+        it overlaps one already selected.
+
+        Args:
+            text: Sentence or paragraph to scan
+
+        Returns:
+            Matched term values in order of appearance
+        """
+        matches = list(self.iter_matches(tokenize(text)))
+        matches.sort(key=lambda m: (m[0], m[0] - m[1]))
+
+        result = []
+        covered_until = 0
+        for start, end, value in matches:
+            if start >= covered_until:
+                result.append(value)
+                covered_until = end
+
+        return result
+
+    def find_all_many(self, texts: List[str], workers: int = 1,
+                      shard_size: Optional[int] = None) -> List[List[Any]]:
+        """
+        Run find_all() over many texts, optionally across a process pool
+
+        The texts are split into contiguous shards that are matched
+        independently; shard results are concatenated in input order, so
+        the output is identical to a serial scan.
+
+        Args:
+            texts: Sentences to scan
+            workers: Number of worker processes (1 = scan in this process)
+            shard_size: Texts per shard (default: spread evenly, 4 shards per worker)
+
+        Returns:
+            One list of matched term values per input text
+        """
+        if not self._built:
+            self.build()
+
+        if workers <= 1 or len(texts) < 2:
+            return [self.find_all(text) for text in texts]
+
+        if shard_size is None:
+            shard_size = max(1, -(-len(texts) // (workers * 4)))
+        shards = [texts[i:i + shard_size] for i in range(0, len(texts), shard_size)]
+
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self,)) as executor:
+            for shard_result in executor.map(_match_shard, shards):
+                results.extend(shard_result)
+
+        return results
+
+
+# Matcher shared by the functions below inside each worker process
+_worker_matcher: Optional[TermMatcher] = None
+
+
+def _init_worker(matcher: TermMatcher):
+    """Install the matcher in a pool worker (runs once per process)"""
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def _match_shard(texts: List[str]) -> List[List[Any]]:
+    """Match one shard of texts in a pool worker"""
+    return [_worker_matcher.find_all(text) for text in texts]
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Streaming TMX reader.
+
+Translation units are read with iterparse and yielded one at a time; each
+<tu> element is discarded as soon as it has been converted, so peak memory
+does not grow with the size of the file (multi-GB dumps such as DGT-TM
+included).
+
+Segment text is collected from all text nodes of <seg> (itertext-style),
+so text after inline markup such as <hi> or <ph> is kept. The native codes
+inside <bpt>, <ept>, <it>, <ph> and <ut> are not part of the translation
+and are left out.
+
+Language codes are normalized ('en-GB', 'en_gb' -> 'en-gb', 'EN' -> 'en'),
+and a requested language without a region ('en') also matches a variant
+with one ('en-gb'), so pairs can be requested the same way for every
+memory. TranslationUnit.lang() gives the code to write to output files:
+the region of the memory itself (the variant's xml:lang, else the unit's
+or header's srclang), and DEFAULT_REGIONS only if the memory has none.
+
+Usage:
+    for unit in iter_tmx('book 4 (sentence level).tmx'):
+        print(unit.tuid, unit.text('nl'), unit.text('en-gb'))
+
+    for tuid, nl, en in iter_pairs('book 4 (sentence level).tmx', 'nl', 'en-gb'):
+        ...
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Tuple
+
+XML_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
+
+# Inline elements holding native codes rather than translatable text
+CODE_ELEMENTS = {'bpt', 'ept', 'it', 'ph', 'ut'}
+
+# Region used in output files for languages the memory gives without one
+DEFAULT_REGIONS = {
+    'nl': 'nl-nl',
+    'en': 'en-gb',
+    'fr': 'fr-fr',
+    'de': 'de-de',
+    'es': 'es-es',
+    'it': 'it-it',
+    'pt': 'pt-pt',
+}
+
+_LANG_SEPARATOR = re.compile(r'[_\s]+')
+
+
+@dataclass
+class TranslationUnit:
+    """One <tu>: its ID, properties and segment text per language"""
+    tuid: str
+    variants: Dict[str, str] = field(default_factory=dict)  # normalized language -> text
+    props: Dict[str, str] = field(default_factory=dict)  # prop type -> value
+    srclang: Optional[str] = None
+
+    def variant(self, lang: str) -> Optional[str]:
+        """
+        Normalized code of the variant that matches a language
+
+        An exact match of the normalized code wins; a code without a region
+        ('en') falls back to the first variant of that language ('en-gb').
+        """
+        lang = normalize_lang(lang)
+        if lang in self.variants:
+            return lang
+        if '-' not in lang:
+            for variant in self.variants:
+                if variant.split('-', 1)[0] == lang:
+                    return variant
+        return None
+
+    def text(self, lang: str) -> Optional[str]:
+        """Segment text in a language (matched as in variant())"""
+        variant = self.variant(lang)
+        return self.variants[variant] if variant is not None else None
+
+    def lang(self, lang: str) -> Optional[str]:
+        """
+        Language code with a region of the variant that matches a language
+
+        The region comes from the variant itself ('en-us'), else from the
+        srclang of the unit or header if it is the same language, else from
+        DEFAULT_REGIONS (see full_lang()).
+        """
+        variant = self.variant(lang)
+        if variant is None:
+            return None
+        if '-' not in variant and self.srclang and self.srclang.split('-', 1)[0] == variant:
+            variant = self.srclang
+        return full_lang(variant)
+
+
+def normalize_lang(code: str) -> str:
+    """Normalize a language code ('en-GB', 'en_gb', ' EN ' -> 'en-gb' / 'en')"""
+    return _LANG_SEPARATOR.sub('-', (code or '').strip()).lower()
+
+
+def full_lang(code: str) -> str:
+    """Language code with a region, as used in output files ('nl' -> 'nl-nl')"""
+    code = normalize_lang(code)
+    return DEFAULT_REGIONS.get(code, code)
+
+
+def local_name(tag: str) -> str:
+    """Tag name without namespace"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def seg_text(seg: ET.Element) -> str:
+    """Plain text of a <seg>, including text inside and after inline markup"""
+    parts = [seg.text or '']
+    for child in seg:
+        if local_name(child.tag) not in CODE_ELEMENTS:
+            parts.append(seg_text(child))
+        parts.append(child.tail or '')
+    return ''.join(parts)
+
+
+def parse_unit(tu: ET.Element, default_srclang: Optional[str] = None) -> TranslationUnit:
+    """Convert a <tu> element into a TranslationUnit (srclang defaults to the header's)"""
+    srclang = tu.get('srclang') or default_srclang
+    unit = TranslationUnit(tuid=tu.get('tuid', ''),
+                           srclang=normalize_lang(srclang) if srclang else None)
+
+    for child in tu:
+        name = local_name(child.tag)
+        if name == 'prop':
+            unit.props[child.get('type', '')] = (child.text or '').strip()
+        elif name == 'tuv':
+            lang = normalize_lang(child.get(XML_LANG) or child.get('lang', ''))
+            seg = next((el for el in child if local_name(el.tag) == 'seg'), None)
+            if seg is not None:
+                text = seg_text(seg).strip()
+                if text:
+                    unit.variants[lang] = text
+
+    return unit
+
+
+def iter_tmx(filename: str) -> Iterator[TranslationUnit]:
+    """
+    Stream the translation units of a TMX file
+
+    Args:
+        filename: Path to a TMX file
+
+    Yields:
+        TranslationUnit objects in file order
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the file is not well-formed
+    """
+    stack = []
+    header_srclang = None
+    for event, elem in ET.iterparse(filename, events=('start', 'end')):
+        if event == 'start':
+            stack.append(elem)
+            if local_name(elem.tag) == 'header':
+                header_srclang = elem.get('srclang')
+            continue
+
+        stack.pop()
+        if local_name(elem.tag) != 'tu':
+            continue
+
+        yield parse_unit(elem, header_srclang)
+
+        # Drop the unit so the tree never holds more than one <tu>
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+
+def iter_pairs(filename: str, source_lang: str,
+               target_lang: str) -> Iterator[Tuple[str, str, str]]:
+    """
+    Stream (tuid, source text, target text) for units that have both languages
+
+    Languages are matched as described in TranslationUnit.text().
+    """
+    for unit in iter_tmx(filename):
+        source = unit.text(source_lang)
+        target = unit.text(target_lang)
+        if source and target:
+            yield unit.tuid, source, target
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Streaming TMX 1.4b export of the sentence corpus and the unified dictionary.
+
+Units are read from the JSON files with a streaming parser and written to
+the TMX file one <tu> at a time, so exports of millions of units run in
+constant memory; no XML tree is built.
+
+Each unit carries its metadata as <prop> elements:
+    x-tuid          ID of the unit in the corpus file
+    x-term-id       ID of the term (dictionary)
+    x-document      Document (corpus) or source type (dictionary)
+    x-source        Author of the translation (dictionary)
+    x-license       License of the translation
+    x-sme-reviewed  "true" or "false"
+Dictionary exports carry the definition of a translation as a <note>.
+Corpus units are numbered in export order in the tuid attribute, since
+source tuids repeat across books.
+
+Both corpus formats are supported: paragraph files (tuid, source, target,
+lang-source, lang-target) and sentence files (id, nl, en).
+
+Usage:
+    python tmx_writer.py corpus legal-data/netherlands/legislation/civil-procedure/NL-EN-civil-procedure-sentences-all.json -o civil-procedure.tmx
+    python tmx_writer.py dictionary unified-dictionary.json -o glossary.tmx
+    python tmx_writer.py dictionary unified-dictionary.json --license CC0 -o glossary-cc0.tmx
+"""
+
+import argparse
+import os
+import re
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from json_stream import iter_json_array
+
+TMX_VERSION = '1.4'
+CREATION_TOOL = 'legal-dictionary-tmx-writer'
+CREATION_TOOL_VERSION = '1'
+
+# Characters not allowed in XML 1.0
+_INVALID_XML = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+
+def xml_text(text) -> str:
+    """Escape text for element content"""
+    return escape(_INVALID_XML.sub('', str(text)))
+
+
+def xml_attr(text) -> str:
+    """Escape and quote text for an attribute value"""
+    return quoteattr(_INVALID_XML.sub('', str(text)))
+
+
+class TmxWriter:
+    """Writes a TMX 1.4b document unit by unit"""
+
+    def __init__(self, path: str, srclang: str, segtype: str = 'sentence'):
+        """
+        Open the output file and write the header
+
+        The document is written to a temporary file that replaces `path` on
+        close(), so readers never see a half-written file.
+        """
+        self.path = path
+        self.count = 0
+        self._tmp_path = path + '.tmp'
+        self._file = open(self._tmp_path, 'w', encoding='utf-8')
+        self._file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self._file.write(f'<tmx version="{TMX_VERSION}">\n')
+        self._file.write(
+            f'  <header creationtool={xml_attr(CREATION_TOOL)} '
+            f'creationtoolversion={xml_attr(CREATION_TOOL_VERSION)} '
+            f'segtype={xml_attr(segtype)} o-tmf="JSON" adminlang="en-gb" '
+            f'srclang={xml_attr(srclang)} datatype="plaintext"/>\n'
+        )
+        self._file.write('  <body>\n')
+
+    def write(self, tuid: str, variants: List[Tuple[str, str]], props: Dict[str, object],
+              note: Optional[str] = None):
+        """
+        Write one translation unit
+
+        Args:
+            tuid: Unique unit ID
+            variants: (language, text) per <tuv>
+            props: Property type -> value (None values are skipped)
+            note: Optional note text
+        """
+        lines = [f'    <tu tuid={xml_attr(tuid)}>']
+        if note:
+            lines.append(f'      <note>{xml_text(note)}</note>')
+        for prop_type, value in props.items():
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                value = 'true' if value else 'false'
+            lines.append(f'      <prop type={xml_attr(prop_type)}>{xml_text(value)}</prop>')
+        for lang, text in variants:
+            lines.append(f'      <tuv xml:lang={xml_attr(lang)}><seg>{xml_text(text)}</seg></tuv>')
+        lines.append('    </tu>\n')
+        self._file.write('\n'.join(lines))
+        self.count += 1
+
+    def close(self):
+        """Finish the document and move the file into place"""
+        if self._file.closed:
+            return
+        self._file.write('  </body>\n</tmx>\n')
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """Discard the output"""
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self) -> 'TmxWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def corpus_units(entries: Iterable[Dict], srclang: str,
+                 tgtlang: str) -> Iterator[Tuple[List[Tuple[str, str]], Dict]]:
+    """Convert corpus entries (paragraph or sentence format) into TMX variants and props"""
+    for entry in entries:
+        if 'nl' in entry or 'en' in entry:
+            source, target = entry.get('nl'), entry.get('en')
+            source_lang, target_lang = srclang, tgtlang
+            unit_id = entry.get('id', '')
+        else:
+            source, target = entry.get('source'), entry.get('target')
+            source_lang = entry.get('lang-source', srclang)
+            target_lang = entry.get('lang-target', tgtlang)
+            unit_id = entry.get('tuid', '')
+        if not source or not target:
+            continue
+
+        yield [(source_lang, source), (target_lang, target)], {
+            'x-tuid': unit_id,
+            'x-document': entry.get('document'),
+            'x-license': entry.get('license'),
+            'x-sme-reviewed': bool(entry.get('sme-reviewed')),
+        }
+
+
+def export_corpus(paths: List[str], output: str, srclang: str = 'nl-nl',
+                  tgtlang: str = 'en-gb') -> int:
+    """
+    Export corpus JSON files (paragraph or sentence level) as one TMX file
+
+    Returns:
+        Number of units written
+    """
+    def entries():
+        for path in paths:
+            yield from iter_json_array(path)
+
+    with TmxWriter(output, srclang, segtype='sentence') as writer:
+        for variants, props in corpus_units(entries(), srclang, tgtlang):
+            writer.write(str(writer.count + 1), variants, props)
+    return writer.count
+
+
+def export_dictionary(path: str, output: str, license: Optional[str] = None,
+                      target_lang: Optional[str] = None) -> int:
+    """
+    Export the unified dictionary as term-level TMX (one unit per translation)
+
+    Args:
+        path: unified-dictionary.json
+        output: TMX file to write
+        license: Only export translations with this license
+        target_lang: Only export translations into this language (e.g. en-gb)
+
+    Returns:
+        Number of units written
+    """
+    with TmxWriter(output, 'nl-nl', segtype='phrase') as writer:
+        for term in iter_json_array(path):
+            for i, trans in enumerate(term['translations'], 1):
+                if license and trans.get('license') != license:
+                    continue
+                if target_lang and trans.get('lang') != target_lang:
+                    continue
+                # Monolingual entries (e.g. FR-FR definitions) have no pair
+                if not trans.get('translation') or trans.get('lang') == term.get('lang'):
+                    continue
+
+                writer.write(
+                    f"{term['id']}-{i}",
+                    [(term.get('lang') or 'nl-nl', term['term']),
+                     (trans.get('lang') or 'en-gb', trans['translation'])],
+                    {
+                        'x-term-id': term['id'],
+                        'x-document': trans.get('source-type'),
+                        'x-source': trans.get('source'),
+                        'x-license': trans.get('license'),
+                        'x-sme-reviewed': bool(trans.get('sme-reviewed')),
+                    },
+                    note=trans.get('definition'),
+                )
+    return writer.count
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Export the sentence corpus or the unified dictionary as TMX 1.4b'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    corpus_parser = subparsers.add_parser('corpus', help='Export corpus JSON files')
+    corpus_parser.add_argument('inputs', nargs='+', help='Corpus JSON files (paragraph or sentence level)')
+    corpus_parser.add_argument('-o', '--output', required=True, help='TMX file to write')
+    corpus_parser.add_argument('--srclang', default='nl-nl', help='Source language (default: nl-nl)')
+    corpus_parser.add_argument('--tgtlang', default='en-gb', help='Target language (default: en-gb)')
+
+    dict_parser = subparsers.add_parser('dictionary', help='Export the unified dictionary (term level)')
+    dict_parser.add_argument('input', nargs='?', default='unified-dictionary.json',
+                             help='Unified dictionary JSON (default: unified-dictionary.json)')
+    dict_parser.add_argument('-o', '--output', required=True, help='TMX file to write')
+    dict_parser.add_argument('--license', help='Only translations with this license (e.g. CC0)')
+    dict_parser.add_argument('--lang', help='Only translations into this language (e.g. en-gb)')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'corpus':
+            count = export_corpus(args.inputs, args.output, args.srclang, args.tgtlang)
+        else:
+            count = export_dictionary(args.input, args.output, args.license, args.lang)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"✓ Wrote {count:,} translation units to {args.output}")
+
+
+if __name__ == '__main__':
+    main()